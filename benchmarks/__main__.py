@@ -0,0 +1,58 @@
+"""Run the benchmarks and compare them against the saved baseline."""
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.suite import BENCHMARKS, Result, run_benchmark
+
+BASELINE: Path = Path(__file__).with_name("baseline.json")
+
+
+def compare(result: Result, baseline: dict[str, float], tolerance: float) -> str:
+    """Return a regression message, or an empty string."""
+    problems = []
+    if result.ops_per_second < baseline["ops_per_second"] * (1 - tolerance):
+        problems.append(
+            f"{result.ops_per_second:.0f} ops/s < {baseline['ops_per_second']:.0f}",
+        )
+    if result.peak_kib > baseline["peak_kib"] * (1 + tolerance):
+        problems.append(f"{result.peak_kib:.0f} KiB > {baseline['peak_kib']:.0f}")
+    return ", ".join(problems)
+
+
+def main() -> int:
+    """Run."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", default=list(BENCHMARKS))
+    parser.add_argument("--scale", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    parser.add_argument("--save", action="store_true", help="overwrite the baseline")
+    args = parser.parse_args()
+
+    baselines = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    results = [run_benchmark(name, args.scale, args.repeat) for name in args.names]
+    regressions = 0
+    for result in results:
+        problem = ""
+        if not args.save and result.name in baselines:
+            problem = compare(result, baselines[result.name], args.tolerance)
+        regressions += bool(problem)
+        sys.stdout.write(
+            f"{result.name:<14} {result.ops_per_second:>12.0f} ops/s"
+            f" {result.peak_kib:>10.0f} KiB peak"
+            f"{'  REGRESSION: ' + problem if problem else ''}\n",
+        )
+
+    if args.save:
+        baselines.update({result.name: asdict(result) for result in results})
+        for baseline in baselines.values():
+            baseline.pop("name", None)
+        BASELINE.write_text(json.dumps(baselines, indent=2) + "\n")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
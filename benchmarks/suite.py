@@ -0,0 +1,168 @@
+"""Micro and end-to-end benchmarks on synthetic payloads."""
+import asyncio
+import atexit
+import json
+import shutil
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from merriam_api_parser._decode import first_entry
+from merriam_api_parser._io import Reader, Writer
+from merriam_api_parser._json_parser import JsonParser
+from merriam_api_parser._scheduler import AdaptiveScheduler
+from merriam_api_parser._stub_server import StubServer
+from merriam_api_parser._synthetic import PayloadGenerator, word_list
+from merriam_api_parser._token_parser import TextTokenFormatter
+from merriam_api_parser.utility import MerriamWebsterAPI, process_word_list
+
+
+@dataclass
+class Result:
+    """Throughput and peak memory of one benchmark."""
+
+    name: str
+    ops_per_second: float
+    peak_kib: float
+
+
+def _temp_dir() -> Path:
+    path = Path(tempfile.mkdtemp(prefix="merriam-bench-"))
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    return path
+
+
+def _texts(entry: dict) -> list[str]:
+    texts = []
+    for group in entry["def"][0]["sseq"]:
+        for sense in group:
+            senses = sense[1] if sense[0] == "pseq" else [sense]
+            for _, body in senses:
+                texts.append(body["dt"][0][1])
+                texts.extend(vis["t"] for vis in body["dt"][1][1])
+    return texts
+
+
+def bench_token_parser(scale: int) -> Callable[[], int]:
+    """Format every text of a large entry."""
+    texts = _texts(PayloadGenerator(senses=scale).entry("word"))
+    formatter = TextTokenFormatter()
+
+    def run() -> int:
+        for text in texts:
+            formatter.parse_token(text)
+        return len(texts)
+
+    return run
+
+
+def bench_json_parser(scale: int) -> Callable[[], int]:
+    """Parse and render sense-heavy entries."""
+    generator = PayloadGenerator(senses=scale)
+    entries = [generator.entry(word) for word in word_list(20)]
+
+    def run() -> int:
+        for entry in entries:
+            JsonParser(entry).get_md_text()
+        return len(entries)
+
+    return run
+
+
+def bench_decode(scale: int) -> Callable[[], int]:
+    """Decode the renderer's fields of multi-homograph response bodies."""
+    generator = PayloadGenerator(senses=scale, homographs=5)
+    bodies = [json.dumps(generator.response(word)).encode() for word in word_list(20)]
+
+    def run() -> int:
+        for body in bodies:
+            first_entry(body)
+        return len(bodies)
+
+    return run
+
+
+def bench_writer(scale: int) -> Callable[[], int]:
+    """Write rendered notes to disk."""
+    text = JsonParser(PayloadGenerator(senses=scale).entry("word")).get_md_text()
+    out_dir = _temp_dir()
+    words = word_list(200)
+
+    def run() -> int:
+        for word in words:
+            Writer(out_dir / f"{word}.md").write(text)
+        return len(words)
+
+    return run
+
+
+def bench_reader(scale: int) -> Callable[[], int]:
+    """List the words of a directory of notes."""
+    directory = _temp_dir()
+    for word in word_list(scale * 100):
+        (directory / f"{word}.md").touch()
+
+    def run() -> int:
+        return len(Reader(directory).get_md_names())
+
+    return run
+
+
+def bench_batch(scale: int) -> Callable[[], int]:
+    """Run a word list through the pipeline against a local stub server."""
+    directory = _temp_dir()
+    source = directory / "words.txt"
+    source.write_text("\n".join(word_list(scale * 20)) + "\n", encoding="UTF-8")
+    generator = PayloadGenerator(senses=12)
+
+    async def batch() -> int:
+        out_dir = Path(tempfile.mkdtemp(dir=directory))  # every note is new
+        async with StubServer(generator=generator, latency=0.001) as api_url:
+            api = MerriamWebsterAPI(
+                "key",
+                api_url=api_url,
+                scheduler=AdaptiveScheduler(rate=1e6, max_concurrency=64),
+            )
+            stats = await process_word_list(api, source, out_dir, fetchers=64)
+            await api.aclose()
+        return stats.written
+
+    return lambda: asyncio.run(batch())
+
+
+BENCHMARKS: dict[str, Callable[[int], Callable[[], int]]] = {
+    "token_parser": bench_token_parser,
+    "json_parser": bench_json_parser,
+    "decode": bench_decode,
+    "writer": bench_writer,
+    "reader": bench_reader,
+    "batch": bench_batch,
+}
+
+
+def run_benchmark(
+    name: str,
+    scale: int = 10,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> Result:
+    """Return the best throughput of `repeat` samples and the peak memory.
+
+    Each sample calls the benchmark until at least `min_time` seconds passed.
+    """
+    run = BENCHMARKS[name](scale)
+    best = 0.0
+    for _ in range(repeat):
+        ops = 0
+        start = time.perf_counter()
+        while (elapsed := time.perf_counter() - start) < min_time:
+            ops += run()
+        best = max(best, ops / elapsed)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return Result(name, round(best, 1), round(peak / 1024, 1))
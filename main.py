@@ -1,8 +1,9 @@
 """Main, please set environment variable 'MERRIAM_WEBSTER_DICTIONARY_KEY' first."""
 
 import asyncio
+import sys
 
 from merriam_api_parser.utility import main
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,204 @@
+"""Render raw API responses to markdown across a process pool."""
+import itertools
+import logging
+import os
+import tarfile
+import time
+import zipfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from merriam_api_parser._cache import ResponseCache
+from merriam_api_parser._decode import first_entry
+from merriam_api_parser._entry import Entry
+from merriam_api_parser._io import Writer
+from merriam_api_parser._json_parser import JsonParser, MarkdownRenderer
+from merriam_api_parser._metrics import METRICS, Metrics
+from merriam_api_parser._sinks import Sink
+
+_Chunk = list[tuple[str, str]]
+_FAILURES = (ValueError, TypeError, KeyError, IndexError, AttributeError)
+
+
+@dataclass
+class BulkReport:
+    """Throughput summary of a bulk render."""
+
+    entries: int = 0
+    written: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def entries_per_second(self) -> float:
+        """Return the render throughput."""
+        return self.entries / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.entries} entries ({self.written} written,"
+            f" {self.unchanged} unchanged, {self.failed} failed)"
+            f" in {self.seconds:.2f}s, {self.entries_per_second:.0f} entries/s"
+        )
+
+
+def iter_responses(source: Path) -> Iterator[tuple[str, str]]:
+    """Yield (word, raw JSON) pairs from a directory, archive or response cache."""
+    if source.is_dir():
+        for path in sorted(source.glob("*.json")):
+            yield path.stem, path.read_text(encoding="UTF-8")
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for name in archive.namelist():
+                if name.endswith(".json"):
+                    yield Path(name).stem, archive.read(name).decode("UTF-8")
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive:
+                file = archive.extractfile(member)
+                if file is not None and member.name.endswith(".json"):
+                    yield Path(member.name).stem, file.read().decode("UTF-8")
+    else:
+        cache = ResponseCache(source)
+        try:
+            yield from cache.items()
+        finally:
+            cache.close()
+
+
+def render_chunk(chunk: _Chunk, out_dir: str) -> tuple[int, int, int]:
+    """Render one chunk of responses to notes.
+
+    Return (written, unchanged, failed). Notes are normalized like every
+    other note, and ones already up to date are left untouched.
+    """
+    written = unchanged = failed = 0
+    for word, body in chunk:
+        try:
+            markdown = JsonParser(first_entry(body)).get_md_text()
+            writer = Writer(Path(out_dir) / f"{word}.md", normalize=True)
+            changed = writer.write(markdown)
+        except (*_FAILURES, OSError):
+            logging.exception("Failed to render %s", word)
+            failed += 1
+        else:
+            written += changed
+            unchanged += not changed
+    return written, unchanged, failed
+
+
+def parse_chunk(chunk: _Chunk) -> tuple[list[tuple[str, Entry, str]], int]:
+    """Parse and render one chunk of responses, return (rows, failed)."""
+    rows = []
+    renderer = MarkdownRenderer()
+    for word, body in chunk:
+        try:
+            entry = JsonParser(first_entry(body)).parse()
+            rows.append((word, entry, renderer.render(entry)))
+        except _FAILURES:
+            logging.exception("Failed to render %s", word)
+    return rows, len(chunk) - len(rows)
+
+
+def _measured(
+    function: Callable[..., Any],
+    *args: Any,  # noqa: ANN401
+) -> tuple[Any, Metrics]:
+    """Call function and return its result with the metrics it recorded.
+
+    Worker processes have their own METRICS, which would be lost with them.
+    """
+    return function(*args), METRICS.drain()
+
+
+def _store(
+    result: Any,  # noqa: ANN401
+    sink: Sink | None,
+) -> tuple[int, int, int]:
+    """Hand the rows of a parsed chunk to the sink.
+
+    Return (written, unchanged, failed).
+    """
+    if sink is None:
+        return result
+    rows, failed = result
+    for row in rows:
+        sink.write(*row)
+    return len(rows), 0, failed
+
+
+def _chunks(items: Iterable[tuple[str, str]], size: int) -> Iterator[_Chunk]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def render_corpus(  # noqa: PLR0913
+    source: Path,
+    out_dir: Path,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 64,
+    ordered: bool = True,
+    executor: Executor | None = None,
+    sink: Sink | None = None,
+) -> BulkReport:
+    """Render every response in source to out_dir on a process pool.
+
+    At most two chunks per worker are in flight, so memory stays bounded no
+    matter how large the corpus is. With `ordered` chunks complete in input
+    order, otherwise in whatever order the workers finish them. With a `sink`
+    the workers only parse and render, and all rows go to the sink instead
+    of one note per word.
+    """
+    if sink is None:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    report = BulkReport()
+    start = time.perf_counter()
+    pool: Executor = executor or ProcessPoolExecutor(workers)
+    pending: deque[tuple[Future[Any], int]] = deque()
+
+    def collect(future: Future[Any], size: int) -> None:
+        result, metrics = future.result()
+        METRICS.merge(metrics)
+        written, unchanged, failed = _store(result, sink)
+        report.entries += size
+        report.written += written
+        report.unchanged += unchanged
+        report.failed += failed
+
+    try:
+        for chunk in _chunks(iter_responses(source), chunk_size):
+            future: Future[Any] = (
+                pool.submit(_measured, render_chunk, chunk, str(out_dir))
+                if sink is None
+                else pool.submit(_measured, parse_chunk, chunk)
+            )
+            pending.append((future, len(chunk)))
+            while len(pending) >= 2 * workers:
+                if ordered:
+                    collect(*pending.popleft())
+                else:
+                    done, _ = wait([f for f, _ in pending], return_when=FIRST_COMPLETED)
+                    for item in [item for item in pending if item[0] in done]:
+                        pending.remove(item)
+                        collect(*item)
+        while pending:
+            collect(*pending.popleft())
+    finally:
+        if executor is None:
+            pool.shutdown()
+    report.seconds = time.perf_counter() - start
+    return report
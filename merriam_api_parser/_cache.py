@@ -0,0 +1,208 @@
+"""Persistent cache of raw API responses."""
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+
+def normalize_word(word: str) -> str:
+    """Normalize a word to its cache key."""
+    return " ".join(word.split()).lower()
+
+
+class ResponseCache:
+    """SQLite-backed cache of raw JSON responses with TTL and LRU eviction.
+
+    A second table maps every stem of a cached response, e.g. "ran" or
+    "geese", to its entry id, so inflections resolve to their headword's
+    response without the API.
+
+    Hits only write their access times to the database once
+    `ACCESS_BATCH` of them have piled up, or before evicting, so reads do
+    not commit one by one.
+    """
+
+    DEFAULT_PATH: Path = Path("data/cache.sqlite3")
+    ACCESS_BATCH: int = 256
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_PATH,
+        ttl: float | None = 30 * 24 * 3600,
+        max_entries: int = 100_000,
+    ) -> None:
+        self.path: Path = Path(path)
+        self.ttl: float | None = ttl
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stem_hits: int = 0
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._accessed: dict[str, float] = {}
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " word TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " expires_at REAL,"
+            " accessed_at REAL NOT NULL)",
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at"
+            " ON responses (accessed_at)",
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stems ("
+            " stem TEXT PRIMARY KEY,"
+            " word TEXT NOT NULL,"
+            " entry_id TEXT NOT NULL) WITHOUT ROWID",
+        )
+        self._conn.commit()
+        self._entries: int = self._count()
+
+    def get(self, word: str, *, allow_expired: bool = False) -> str | None:
+        """Return the cached body for a word, or None on a miss."""
+        key = normalize_word(word)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE word = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (
+                not allow_expired and row[1] is not None and row[1] <= now
+            ):
+                self.misses += 1
+                return None
+            self._touch(key, now)
+            self.hits += 1
+            return row[0]
+
+    def set(self, word: str, body: str, ttl: float | None = None) -> None:
+        """Store a raw response body, evicting least recently used entries."""
+        key = normalize_word(word)
+        now = time.time()
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            known = self._conn.execute(
+                "SELECT 1 FROM responses WHERE word = ?",
+                (key,),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, body, now, expires_at, now),
+            )
+            self._accessed.pop(key, None)
+            if known is None:
+                self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def index_stems(self, word: str, stems: Mapping[str, str]) -> None:
+        """Point every stem to the entry id it belongs to and word's response."""
+        key = normalize_word(word)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO stems VALUES (?, ?, ?)",
+                [
+                    (normalize_word(stem), key, entry_id)
+                    for stem, entry_id in stems.items()
+                ],
+            )
+            self._conn.commit()
+
+    def resolve(
+        self,
+        stem: str,
+        *,
+        allow_expired: bool = False,
+    ) -> tuple[str, str] | None:
+        """Return the entry id and cached body of the headword of a stem."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stems.word, entry_id, body, expires_at FROM stems"
+                " JOIN responses ON responses.word = stems.word"
+                " WHERE stem = ?",
+                (normalize_word(stem),),
+            ).fetchone()
+            if row is None or (
+                not allow_expired and row[3] is not None and row[3] <= now
+            ):
+                return None
+            self._touch(row[0], now)
+            self.stem_hits += 1
+            return row[1], row[2]
+
+    def _touch(self, key: str, now: float) -> None:
+        """Note an access, writing access times once a batch is due."""
+        self._accessed[key] = now
+        if len(self._accessed) >= self.ACCESS_BATCH:
+            self._write_accesses()
+            self._conn.commit()
+
+    def _write_accesses(self) -> None:
+        """Write the pending access times, leaving the commit to the caller."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE word = ?",
+                [(at, key) for key, at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries above `max_entries`.
+
+        The running count can lag behind other processes sharing the file,
+        so it is recounted here, where it matters.
+        """
+        self._write_accesses()
+        self._entries = self._count()
+        if self._entries > self.max_entries:
+            deleted = self._conn.execute(
+                "DELETE FROM responses WHERE word IN ("
+                " SELECT word FROM responses ORDER BY accessed_at LIMIT ?)",
+                (self._entries - self.max_entries,),
+            ).rowcount
+            self._entries -= deleted
+
+    def _count(self) -> int:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Yield every cached (word, body) pair, expired or not."""
+        with self._lock:
+            rows = self._conn.execute("SELECT word FROM responses ORDER BY word")
+            words = [word for (word,) in rows]
+        for word in words:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body FROM responses WHERE word = ?",
+                    (word,),
+                ).fetchone()
+            if row is not None:
+                yield word, row[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def close(self) -> None:
+        """Write pending access times and close the underlying database."""
+        with self._lock:
+            self._write_accesses()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,87 @@
+"""Tiny client of the lookup daemon, light enough to start in milliseconds.
+
+Run it with `python -m merriam_api_parser._client WORD`. It imports nothing
+but the standard library, so editor plugins can call it on every keystroke.
+"""
+import argparse
+import http.client
+import socket
+import sys
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+DEFAULT_SOCKET: Path = Path("data/lookup.sock")
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP over a Unix socket."""
+
+    def __init__(self, path: Path, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.path: Path = path
+
+    def connect(self) -> None:
+        """Connect to the socket file instead of a TCP port."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(str(self.path))
+
+
+def lookup(
+    word: str,
+    *,
+    socket_path: Path = DEFAULT_SOCKET,
+    url: str | None = None,
+    timeout: float = 30.0,
+) -> str | None:
+    """Return the note of a word from the daemon, None if it has none.
+
+    Raise OSError if the daemon could not look the word up. The daemon is
+    reached over `url`, e.g. "http://127.0.0.1:8765", or else over the Unix
+    socket at `socket_path`.
+    """
+    connection: http.client.HTTPConnection
+    if url is not None:
+        parts = urlsplit(url)
+        connection = http.client.HTTPConnection(
+            parts.hostname or "127.0.0.1",
+            parts.port,
+            timeout=timeout,
+        )
+    else:
+        connection = _UnixHTTPConnection(socket_path, timeout)
+    try:
+        connection.request("GET", f"/lookup/{quote(word)}")
+        response = connection.getresponse()
+        body = response.read().decode("UTF-8")
+    finally:
+        connection.close()
+    if response.status == http.client.NOT_FOUND:
+        return None
+    if response.status != http.client.OK:
+        msg = f"Lookup of {word} failed: {response.status} {body}"
+        raise OSError(msg)
+    return body
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print the note of a word, return 1 if there is none and 2 on errors."""
+    parser = argparse.ArgumentParser(description="Look up a word in the daemon.")
+    parser.add_argument("word")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    parser.add_argument("--url", help="daemon URL, instead of the Unix socket")
+    args = parser.parse_args(argv)
+    try:
+        note = lookup(args.word, socket_path=args.socket, url=args.url)
+    except OSError as error:
+        print(error, file=sys.stderr)  # noqa: T201
+        return 2
+    if note is None:
+        print(f"No entry for {args.word}", file=sys.stderr)  # noqa: T201
+        return 1
+    sys.stdout.write(note)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Avoid duplicate API calls for the same word within a batch."""
+import asyncio
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from merriam_api_parser._cache import normalize_word
+from merriam_api_parser._decode import loads
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight(Generic[T]):
+    """An in-flight call and the number of callers awaiting it."""
+
+    task: asyncio.Future[T]
+    waiters: int = 0
+
+
+class Coalescer(Generic[T]):
+    """Let concurrent calls for the same key share one in-flight call.
+
+    The call runs in a task of its own, so a caller that is cancelled does
+    not cancel it for the others. It is cancelled once nobody waits for it.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, _Flight[T]] = {}
+        self.coalesced: int = 0
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Await call(), or the call already running for key."""
+        if (flight := self._in_flight.get(key)) is not None:
+            self.coalesced += 1
+        else:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda _: self._land(key, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                self._land(key, flight)
+                flight.task.cancel()
+
+    def _land(self, key: str, flight: _Flight[T]) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+
+
+def entry_stems(body: str) -> dict[str, str]:
+    """Map the stems of every entry of a raw response to the entry id.
+
+    Stems shared by several homographs belong to the first entry listing
+    them. Suggestion lists and malformed bodies have no stems.
+    """
+    try:
+        entries = loads(body)
+    except ValueError:
+        return {}
+    stems: dict[str, str] = {}
+    if isinstance(entries, list):
+        for entry in entries:
+            if isinstance(entry, dict):
+                meta = entry.get("meta", {})
+                for stem in meta.get("stems", []):
+                    stems.setdefault(stem, meta.get("id", ""))
+    return stems
+
+
+class StemMap:
+    """Map every stem of fetched responses to the response body.
+
+    A response for "run" lists "runs", "ran" and "running" in `meta.stems`,
+    so a later request for any of them, or for "Run", is answered without
+    the API. Only the `max_bodies` most recent responses are kept, and they
+    are kept compressed, so a large batch does not hold every body twice.
+    The stems of an evicted response are forgotten along with it.
+    """
+
+    def __init__(self, max_bodies: int = 10_000) -> None:
+        self.max_bodies: int = max_bodies
+        self._bodies: OrderedDict[str, tuple[bytes, frozenset[str]]] = OrderedDict()
+        self._stems: dict[str, str] = {}
+        self.hits: int = 0
+
+    def add(self, word: str, body: str, stems: Iterable[str]) -> None:
+        """Index the stems of a raw response fetched for word."""
+        key = normalize_word(word)
+        keys = {normalize_word(stem) for stem in stems}
+        if not keys:  # a list of suggestions, not a dictionary entry
+            return
+        keys.add(key)
+        self._forget(key)
+        self._bodies[key] = (zlib.compress(body.encode("UTF-8"), 1), frozenset(keys))
+        for stem in keys:
+            self._stems[stem] = key
+        while len(self._bodies) > self.max_bodies:
+            self._forget(next(iter(self._bodies)))
+
+    def get(self, word: str) -> str | None:
+        """Return the body of a fetched headword that has word as a stem."""
+        headword = self._stems.get(normalize_word(word))
+        if headword is None:
+            return None
+        self.hits += 1
+        return zlib.decompress(self._bodies[headword][0]).decode("UTF-8")
+
+    def _forget(self, key: str) -> None:
+        """Drop the body of a headword and the stems still pointing to it."""
+        if (item := self._bodies.pop(key, None)) is None:
+            return
+        for stem in item[1]:
+            if self._stems.get(stem) == key:
+                del self._stems[stem]
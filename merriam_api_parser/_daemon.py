@@ -0,0 +1,214 @@
+"""Long-lived lookup server keeping connections and rendered notes warm.
+
+Start it with `python -m main --serve` and query it with the client in
+`merriam_api_parser._client`, or with curl:
+
+    curl --unix-socket data/lookup.sock http://localhost/lookup/run
+"""
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import signal
+import stat
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol
+from urllib.parse import unquote, urlsplit
+
+from merriam_api_parser._cache import normalize_word
+from merriam_api_parser._client import DEFAULT_SOCKET
+from merriam_api_parser._io import MdFormatter
+from merriam_api_parser._metrics import METRICS
+
+_REASONS: dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class LookupFailedError(Exception):
+    """Raise when the API gave no response for a word, e.g. it was down."""
+
+
+class _Api(Protocol):
+    async def parse_response(self, word: str) -> str:
+        ...
+
+
+class LookupServer:
+    """Serve notes over HTTP on a Unix socket or a localhost port.
+
+    `GET /lookup/<word>` returns the note as markdown, 404 if the word has
+    no entry or 503 if the API gave no response, and `GET /health` returns
+    counters as JSON. The last `max_entries` notes are kept rendered in
+    memory, so repeated lookups skip the cache database, JSON decoding and
+    rendering altogether; words without an entry are remembered as well.
+    """
+
+    def __init__(self, api: _Api, max_entries: int = 4096) -> None:
+        self.api: _Api = api
+        self.max_entries: int = max_entries
+        self.hits: int = 0
+        self.misses: int = 0
+        self._notes: OrderedDict[str, str] = OrderedDict()
+        self._server: asyncio.Server | None = None
+        self._socket_path: Path | None = None
+
+    async def start(
+        self,
+        socket_path: Path | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> str:
+        """Listen on `socket_path`, or else on `host`:`port`; return the address."""
+        if socket_path is None:
+            self._server = await asyncio.start_server(self._handle, host, port)
+            host, port = self._server.sockets[0].getsockname()[:2]
+            return f"http://{host}:{port}"
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(FileNotFoundError):
+            if stat.S_ISSOCK(socket_path.lstat().st_mode):
+                socket_path.unlink()  # left behind by a daemon that died
+        self._server = await asyncio.start_unix_server(self._handle, socket_path)
+        socket_path.chmod(0o600)
+        self._socket_path = socket_path
+        return str(socket_path)
+
+    async def close(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._socket_path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                self._socket_path.unlink()
+
+    async def lookup(self, word: str) -> str:
+        """Return the normalized note of a word, "" if it has no entry.
+
+        Raise LookupFailedError if the API gave no response.
+        """
+        key = normalize_word(word)
+        if (note := self._notes.get(key)) is not None:
+            self._notes.move_to_end(key)
+            self.hits += 1
+            METRICS.count("daemon_hits")
+            return note
+        self.misses += 1
+        METRICS.count("daemon_misses")
+        try:
+            markdown = await self.api.parse_response(word)
+        except ValueError:
+            # The API answers unknown words with suggestions, not an entry;
+            # remember that, unlike a failed request, which may succeed later.
+            logging.info("No entry for %s", word)
+            self._remember(key, "")
+            return ""
+        if not markdown:
+            msg = f"No response for {word}"
+            raise LookupFailedError(msg)
+        note = MdFormatter.normalize(markdown)
+        self._remember(key, note)
+        return note
+
+    def _remember(self, key: str, note: str) -> None:
+        """Keep a note, evicting the least recently used beyond the limit."""
+        self._notes[key] = note
+        if len(self._notes) > self.max_entries:
+            self._notes.popitem(last=False)
+
+    def health(self) -> dict[str, int]:
+        """Return the counters of the in-memory notes."""
+        return {
+            "pid": os.getpid(),
+            "notes": len(self._notes),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve requests on one keep-alive connection."""
+        try:
+            while True:
+                request_line = await reader.readuntil(b"\r\n")
+                headers = {}
+                while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                status, content_type, body = await self._respond(request_line)
+                head = (
+                    f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n\r\n"
+                )
+                writer.write(head.encode("latin-1") + body)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, request_line: bytes) -> tuple[int, str, bytes]:
+        """Return the status, content type and body for a request."""
+        parts = request_line.decode("latin-1").split(" ")
+        if len(parts) != 3 or parts[0] != "GET":  # noqa: PLR2004
+            return 400, "text/plain", b"Only GET is supported"
+        path = urlsplit(parts[1]).path
+        if path == "/health":
+            return 200, "application/json", json.dumps(self.health()).encode()
+        if not path.startswith("/lookup/") or not (
+            word := unquote(path.removeprefix("/lookup/")).strip()
+        ):
+            return 404, "text/plain", b"Not found"
+        return await self._respond_lookup(word)
+
+    async def _respond_lookup(self, word: str) -> tuple[int, str, bytes]:
+        """Return the status, content type and body for a lookup."""
+        try:
+            note = await self.lookup(word)
+        except LookupFailedError as error:
+            return 503, "text/plain", str(error).encode()
+        except Exception:
+            logging.exception("Failed to look up %s", word)
+            return 500, "text/plain", b"Lookup failed"
+        if not note:
+            return 404, "text/plain", f"No entry for {word}".encode()
+        return 200, "text/markdown; charset=utf-8", note.encode("UTF-8")
+
+
+async def serve(
+    api: _Api,
+    socket_path: Path | None = None,
+    port: int | None = None,
+) -> None:
+    """Serve lookups until cancelled or terminated.
+
+    Listen on a localhost port if one is given, else on the Unix socket,
+    data/lookup.sock by default.
+    """
+    server = LookupServer(api)
+    if port is not None:
+        address = await server.start(port=port)
+    else:
+        address = await server.start(socket_path or DEFAULT_SOCKET)
+    logging.info("Serving lookups on %s", address)
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, stopped.set)
+    try:
+        await stopped.wait()
+    finally:
+        loop.remove_signal_handler(signal.SIGTERM)
+        await server.close()
+    logging.info("Stopped serving lookups")
@@ -0,0 +1,121 @@
+"""Decoding of API responses, straight from bytes and only as far as needed.
+
+orjson or msgspec decode when one of them is installed, the standard library
+otherwise. The renderer reads a handful of fields of the first entry only,
+so responses with several homographs have just their first entry decoded,
+and `first_entry` keeps only the fields of `ENTRY_SCHEMA`.
+"""
+import json
+import re
+from collections.abc import Callable
+from typing import Any, TypedDict
+
+_loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+    DECODER: str = "orjson"
+except ImportError:
+    try:
+        import msgspec
+
+        _loads = msgspec.json.decode
+        DECODER = "msgspec"
+    except ImportError:
+        _loads = json.loads
+        DECODER = "json"
+
+
+class Meta(TypedDict, total=False):
+    """The `meta` fields the renderer reads."""
+
+    id: str
+    stems: list[str]
+
+
+class Definition(TypedDict, total=False):
+    """The `def` fields the renderer reads."""
+
+    sseq: list[Any]
+
+
+# "def" is a keyword, so this one needs the functional syntax.
+RawEntry = TypedDict(
+    "RawEntry",
+    {"meta": Meta, "fl": str, "def": list[Definition]},
+    total=False,
+)
+
+# The fields of RawEntry as data: a dict picks keys, a one-item list keeps
+# only the first element of a list, and None keeps a value as it is.
+_Schema = dict[str, Any] | list[Any] | None
+ENTRY_SCHEMA: _Schema = {
+    "meta": {"id": None, "stems": None},
+    "fl": None,
+    "def": [{"sseq": None}],
+}
+
+_ARRAY_START: re.Pattern[str] = re.compile(r"[ \t\r\n]*\[[ \t\r\n]*")
+_stdlib_decoder = json.JSONDecoder()
+
+
+def loads(data: bytes | str) -> Any:  # noqa: ANN401
+    """Decode a whole JSON document with the fastest decoder available."""
+    return _loads(data)
+
+
+def first_entry(data: bytes | str) -> RawEntry:
+    """Return the fields the renderer reads of the first entry of a response.
+
+    Raise ValueError if the response holds no entry, e.g. when the API
+    answers an unknown word with a list of suggestions.
+    """
+    value = _first_item(data)
+    if not isinstance(value, dict):
+        msg = "Response holds no dictionary entry"
+        raise ValueError(msg)  # noqa: TRY004
+    picked: RawEntry = pick(value, ENTRY_SCHEMA)
+    return picked
+
+
+def _first_item(data: bytes | str) -> Any:  # noqa: ANN401
+    """Decode the first item of a JSON array, ignoring the rest if possible."""
+    if _entries_at_most_one(data):
+        # Decoding a single entry all at once is quickest.
+        items = _loads(data)
+        if not isinstance(items, list) or not items:
+            msg = "Response is not a non-empty JSON array"
+            raise ValueError(msg)
+        return items[0]
+    # Only the standard library can stop after the first item.
+    text = data.decode("utf-8", errors="replace") if isinstance(data, bytes) else data
+    if (match := _ARRAY_START.match(text)) is None:
+        msg = "Response is not a JSON array"
+        raise ValueError(msg)
+    return _stdlib_decoder.raw_decode(text, match.end())[0]
+
+
+def _entries_at_most_one(data: bytes | str) -> bool:
+    """Return False if a response has a second "meta" key, i.e. entry.
+
+    Quotes inside JSON strings are escaped, so the key cannot be mistaken
+    for text, and a "meta" string value merely sends a single entry down
+    the slower partial path.
+    """
+    if isinstance(data, bytes):
+        return data.find(b'"meta"', data.find(b'"meta"') + 1) == -1
+    return data.find('"meta"', data.find('"meta"') + 1) == -1
+
+
+def pick(value: Any, schema: _Schema) -> Any:  # noqa: ANN401
+    """Return the parts of a decoded value that a schema asks for."""
+    if schema is None:
+        return value
+    if isinstance(schema, list):
+        if not isinstance(value, list) or not value:
+            return []
+        return [pick(value[0], schema[0])]
+    if not isinstance(value, dict):
+        return {}
+    return {key: pick(value[key], sub) for key, sub in schema.items() if key in value}
@@ -0,0 +1,42 @@
+"""Compact, typed representation of a parsed dictionary entry.
+
+Text fields keep the raw Merriam-Webster tokens (`{bc}`, `{it}`, links, ...)
+so every renderer can format them its own way.
+"""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class VerbalIllustration:
+    """An example sentence showing the word in use."""
+
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class DividedSense:
+    """A sense introduced by a divider such as "also" or "specifically"."""
+
+    divider: str
+    text: str
+    vis: tuple[VerbalIllustration, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Sense:
+    """A numbered definition."""
+
+    number: str
+    text: str
+    vis: tuple[VerbalIllustration, ...] = ()
+    divided: DividedSense | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    """A headword with its stems and senses."""
+
+    entry_id: str
+    stems: tuple[str, ...] = ()
+    functional_label: str = ""
+    senses: tuple[Sense, ...] = ()
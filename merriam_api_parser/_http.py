@@ -0,0 +1,266 @@
+"""Asyncio HTTP/1.1 client with pooled keep-alive connections."""
+import asyncio
+import socket
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Protocol
+from urllib.parse import urlsplit
+
+from merriam_api_parser._metrics import METRICS
+
+if TYPE_CHECKING:
+    import ssl
+
+_Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+_PoolKey = tuple[str, str, int]
+_FAILURES = (
+    OSError,
+    asyncio.IncompleteReadError,
+    asyncio.LimitOverrunError,
+    ValueError,
+    zlib.error,
+)
+
+
+class HTTPError(Exception):
+    """Raise when a request fails at the transport or protocol level."""
+
+
+@dataclass(frozen=True)
+class Response:
+    """A complete HTTP response."""
+
+    status: int
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @property
+    def ok(self) -> bool:
+        """Return True for 2xx status codes."""
+        return 200 <= self.status < 300  # noqa: PLR2004
+
+    @property
+    def text(self) -> str:
+        """Return the body decoded as UTF-8."""
+        return self.body.decode("utf-8", errors="replace")
+
+
+class Transport(Protocol):
+    """Anything that can GET a URL asynchronously."""
+
+    async def get(
+        self,
+        url: str,
+        timeout: float,
+        connect_timeout: float | None = None,
+    ) -> Response:
+        """Send a GET request and return the full response.
+
+        `connect_timeout` bounds opening a connection, `timeout` the request
+        and response once connected.
+        """
+        ...
+
+    async def aclose(self) -> None:
+        """Release all resources held by the transport."""
+        ...
+
+
+class AsyncHTTPTransport:
+    """HTTP/1.1 transport that keeps connections alive and reuses them.
+
+    One instance is meant to be shared by a whole batch, so every request to
+    the same host after the first skips the TCP and TLS handshakes.
+    """
+
+    USER_AGENT: str = "merriam-api-parser"
+
+    def __init__(self, max_connections: int = 64) -> None:
+        self.max_connections: int = max_connections
+        self.connections_opened: int = 0
+        self._idle: dict[_PoolKey, list[_Connection]] = {}
+        self._slots = asyncio.Semaphore(max_connections)
+        self._ssl_context: "ssl.SSLContext | None" = None
+
+    async def get(
+        self,
+        url: str,
+        timeout: float,
+        connect_timeout: float | None = None,
+    ) -> Response:
+        """Send a GET request over a pooled connection."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or parts.hostname is None:
+            msg = f"Unsupported URL: {url}"
+            raise HTTPError(msg)
+        default_port = 443 if parts.scheme == "https" else 80
+        key: _PoolKey = (parts.scheme, parts.hostname, parts.port or default_port)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        request = (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            f"User-Agent: {self.USER_AGENT}\r\n"
+            "Accept: application/json\r\n"
+            "Accept-Encoding: gzip, deflate\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("ascii")
+
+        async with self._slots:
+            try:
+                return await self._send(key, request, timeout, connect_timeout)
+            except _FAILURES as error:
+                METRICS.count("http_errors")
+                msg = f"GET {url} failed: {error!r}"
+                raise HTTPError(msg) from error
+
+    async def _send(
+        self,
+        key: _PoolKey,
+        request: bytes,
+        timeout: float,
+        connect_timeout: float | None,
+    ) -> Response:
+        """Send a request, retrying once if a reused connection went stale."""
+        connect_timeout = timeout if connect_timeout is None else connect_timeout
+        reused, (reader, writer) = await asyncio.wait_for(
+            self._acquire(key),
+            connect_timeout,
+        )
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status, headers, keep_alive = await self._read_head(reader)
+                except (OSError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if not reused:
+                        raise
+                    reader, writer = await asyncio.wait_for(
+                        self._connect(key),
+                        connect_timeout,
+                    )
+                    start = time.perf_counter()
+                    writer.write(request)
+                    await writer.drain()
+                    status, headers, keep_alive = await self._read_head(reader)
+                head_read = time.perf_counter()
+                METRICS.observe("http_ttfb", head_read - start)
+                body, keep_alive = await self._read_body(reader, headers, keep_alive)
+        except BaseException:
+            writer.close()
+            raise
+        METRICS.observe("http_download", time.perf_counter() - head_read)
+        METRICS.count("http_requests")
+        METRICS.count("http_bytes_received", len(body))
+        if keep_alive:
+            self._idle.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+        return Response(status, headers, _decode_body(body, headers))
+
+    async def _acquire(self, key: _PoolKey) -> tuple[bool, _Connection]:
+        """Return an idle connection for the key, or open a new one."""
+        idle = self._idle.get(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return True, (reader, writer)
+            writer.close()
+        return False, await self._connect(key)
+
+    async def _connect(self, key: _PoolKey) -> _Connection:
+        """Open a new connection, timing name resolution and the handshakes."""
+        scheme, host, port = key
+        context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                # Loading the CA certificates takes tens of milliseconds,
+                # so only runs that go online pay for it.
+                import ssl
+
+                self._ssl_context = ssl.create_default_context()
+            context = self._ssl_context
+        with METRICS.time("http_dns"):
+            addresses = await asyncio.get_running_loop().getaddrinfo(
+                host,
+                port,
+                type=socket.SOCK_STREAM,
+            )
+        error: OSError = OSError(f"No address for {host}")
+        for *_, address in addresses:
+            start = time.perf_counter()
+            try:
+                connection = await asyncio.open_connection(
+                    address[0],
+                    address[1],
+                    ssl=context,
+                    server_hostname=host if context is not None else None,
+                )
+            except OSError as failure:
+                error = failure
+                continue
+            METRICS.observe("http_connect", time.perf_counter() - start)
+            self.connections_opened += 1
+            return connection
+        raise error
+
+    @staticmethod
+    async def _read_head(
+        reader: asyncio.StreamReader,
+    ) -> tuple[int, dict[str, str], bool]:
+        """Read the status line and headers."""
+        status_line = await reader.readuntil(b"\r\n")
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2)
+        headers: dict[str, str] = {}
+        while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = version == "HTTP/1.1" and connection != "close"
+        return int(status), headers, keep_alive
+
+    @staticmethod
+    async def _read_body(
+        reader: asyncio.StreamReader,
+        headers: dict[str, str],
+        keep_alive: bool,  # noqa: FBT001
+    ) -> tuple[bytes, bool]:
+        """Read the body framed by Content-Length, chunks or connection close."""
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while size := int((await reader.readuntil(b"\r\n")).split(b";")[0], 16):
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            while await reader.readuntil(b"\r\n") != b"\r\n":
+                pass  # skip trailers
+            return b"".join(chunks), keep_alive
+        if "content-length" in headers:
+            return await reader.readexactly(int(headers["content-length"])), keep_alive
+        return await reader.read(), False
+
+    async def aclose(self) -> None:
+        """Close all idle connections."""
+        writers = [writer for idle in self._idle.values() for _, writer in idle]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                continue
+
+
+def _decode_body(body: bytes, headers: dict[str, str]) -> bytes:
+    """Undo gzip or deflate content encoding."""
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        return zlib.decompress(body, wbits=zlib.MAX_WBITS | 16)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    return body
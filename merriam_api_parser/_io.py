@@ -1,47 +1,240 @@
+import asyncio
+import bz2
+import fnmatch
+import gzip
+import itertools
+import logging
+import lzma
 import os
-from collections.abc import Generator
-from pathlib import Path
+import re
+import sys
+from collections.abc import AsyncIterator, Callable, Generator, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path, PurePath
+from typing import TextIO, TypeVar
+
+from merriam_api_parser._metrics import METRICS
+
+T = TypeVar("T")
+
+
+_Patterns = tuple[re.Pattern[str] | None, tuple[str, ...]]
+
+
+def _compile(patterns: Sequence[str]) -> _Patterns:
+    """Split globs into one regex for names and the globs of longer paths."""
+    names = [fnmatch.translate(p) for p in patterns if "/" not in p]
+    return (
+        re.compile("|".join(names)) if names else None,
+        tuple(p for p in patterns if "/" in p),
+    )
 
 
 class Reader:
-    """Read a directory or single file."""
+    """Find the notes of a vault, or a single note.
 
-    def __init__(self, path: Path) -> None:
-        if path.is_dir():
-            self._file_names: list[str] = [
-                entry.name for entry in os.scandir(path) if entry.name.endswith(".md")
-            ]
-        else:
-            self._file_names = [path.name]
+    Directories are walked recursively by `workers` threads, and notes are
+    yielded as soon as they are found. A note is a file matching one of the
+    `include` globs, a directory or file matching one of the `exclude` globs
+    is skipped. Globs match from the right of the path relative to the
+    vault, so "*.md" matches notes at any depth and ".*" hidden folders such
+    as .obsidian. Symlinked directories are not followed, so links back up
+    the vault cannot send the walk round in circles.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Path,
+        *,
+        recursive: bool = True,
+        include: Sequence[str] = ("*.md",),
+        exclude: Sequence[str] = (".*",),
+        workers: int = 8,
+    ) -> None:
+        self.path: Path = path
+        self.recursive: bool = recursive
+        self.include: tuple[str, ...] = tuple(include)
+        self.exclude: tuple[str, ...] = tuple(exclude)
+        self.workers: int = workers
+        self._include: _Patterns = _compile(self.include)
+        self._exclude: _Patterns = _compile(self.exclude)
+
+    def notes(self) -> Iterator[tuple[str, Path]]:
+        """Yield (word, note path) pairs as they are discovered."""
+        for word, path in self._walk():
+            yield word, Path(path)
+
+    async def anotes(
+        self,
+        batch: int = 64,
+        keep: Callable[[Path], bool] | None = None,
+    ) -> AsyncIterator[tuple[str, Path]]:
+        """Yield (word, note path) pairs without blocking the event loop.
+
+        With `keep`, only notes it accepts are yielded; it runs on the thread
+        scanning the vault, so it may touch the disk.
+        """
+        notes = self.notes()
+        if keep is not None:
+            notes = (note for note in notes if keep(note[1]))
+        async for note in _abatched(notes, batch):
+            yield note
+
+    def _walk(self) -> Iterator[tuple[str, str]]:
+        """Yield (word, path) pairs, scanning subdirectories on a thread pool."""
+        if not self.path.is_dir():
+            yield self.path.stem, str(self.path)
+            return
+        directories, notes = self._scan(str(self.path))
+        yield from notes
+        if not directories:
+            return
+        with ThreadPoolExecutor(self.workers) as pool:
+            pending = {pool.submit(self._scan, d) for d in directories}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directories, notes = future.result()
+                    pending.update(pool.submit(self._scan, d) for d in directories)
+                    yield from notes
+
+    def _scan(self, directory: str) -> tuple[list[str], list[tuple[str, str]]]:
+        """List the subdirectories and notes of one directory."""
+        directories: list[str] = []
+        notes: list[tuple[str, str]] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if self._matches(entry, self._exclude):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive:
+                            directories.append(entry.path)
+                    elif self._matches(entry, self._include):
+                        name = entry.name
+                        dot = name.rfind(".")
+                        notes.append((name[:dot] if dot > 0 else name, entry.path))
+        except OSError:
+            logging.warning("Cannot scan %s", directory)
+        return directories, notes
+
+    def _matches(self, entry: os.DirEntry[str], patterns: _Patterns) -> bool:
+        """Match the entry's name, or its path relative to the vault."""
+        names, paths = patterns
+        if names is not None and names.match(entry.name):
+            return True
+        if paths:
+            relative = PurePath(os.path.relpath(entry.path, self.path))
+            return any(relative.match(pattern) for pattern in paths)
+        return False
 
     def get_md_names(self) -> list[str]:
         """Return md names wanted."""
-        return [Path(file_name).stem for file_name in self._file_names]
+        return [word for word, _ in self._walk()]
 
     def get_words(self) -> Generator[str, None, None]:
         """Get words from file."""
-        yield from self.get_md_names()
+        yield from (word for word, _ in self._walk())
+
+
+_OPENERS: dict[str, Callable[..., TextIO]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+def iter_words(source: Path) -> Iterator[str]:
+    """Yield the words of a newline-delimited list one at a time.
+
+    A path of "-" reads stdin, and .gz, .bz2 and .xz lists are decompressed
+    on the fly. Blank lines and lines starting with "#" are skipped.
+    """
+    if str(source) == "-":
+        yield from _words(sys.stdin)
+        return
+    opener = _OPENERS.get(source.suffix.lower(), open)
+    with opener(source, "rt", encoding="UTF-8") as file:
+        yield from _words(file)
+
+
+def _words(lines: Iterator[str]) -> Iterator[str]:
+    for line in lines:
+        word = " ".join(line.split())
+        if word and not word.startswith("#"):
+            yield word
+
+
+async def aiter_words(source: Path, batch: int = 1024) -> AsyncIterator[str]:
+    """Yield the words of a list, reading it on a thread `batch` lines at a time."""
+    async for word in _abatched(iter_words(source), batch):
+        yield word
+
+
+async def _abatched(items: Iterator[T], batch: int) -> AsyncIterator[T]:
+    """Advance a blocking iterator on a thread, `batch` items at a time."""
+    while chunk := await asyncio.to_thread(list, itertools.islice(items, batch)):
+        for item in chunk:
+            yield item
 
 
 class Writer:
     """Write md-formated text to file."""
 
-    def __init__(self, out_path: Path) -> None:
+    def __init__(self, out_path: Path, *, normalize: bool = False) -> None:
         self.out_path: Path = out_path
+        self.normalize: bool = normalize
 
-    def write(self, response: str) -> None:
-        """Write md-formated text to file."""
-        with self.out_path.open("w", encoding="UTF-8") as file:
-            file.write(response)
+    def write(self, response: str) -> bool:
+        """Write md-formated text to file, unless the file already holds it.
+
+        Return True if the file was written.
+        """
+        with METRICS.time("write"):
+            if self.normalize:
+                response = MdFormatter.normalize(response)
+            content = response.encode("UTF-8")
+            try:
+                if (
+                    self.out_path.stat().st_size == len(content)
+                    and self.out_path.read_bytes() == content
+                ):
+                    METRICS.count("notes_unchanged")
+                    return False
+            except FileNotFoundError:
+                pass
+            with self.out_path.open("wb") as file:
+                file.write(content)
+        METRICS.count("notes_written")
+        METRICS.count("bytes_written", len(content))
+        return True
 
 
 class MdFormatter:
-    """Format md file."""
+    """Format md file.
+
+    Apply the fixes markdownlint would make to the notes JsonParser emits:
+    no trailing spaces, no runs of blank lines and a single final newline.
+    """
 
     def __init__(self, path: Path) -> None:
         self.path: Path = path
 
     def md_format(self) -> None:
-        """Format md file."""
-        md_format: str = f"markdownlint {self.path}/*.md -f"
-        os.system(md_format)  # noqa: S605
+        """Format md file, or every md file of a directory, in place."""
+        paths = self.path.glob("*.md") if self.path.is_dir() else [self.path]
+        with METRICS.time("format"):
+            for path in paths:
+                Writer(path, normalize=True).write(path.read_text(encoding="UTF-8"))
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Return text with markdownlint's whitespace fixes applied."""
+        lines: list[str] = []
+        for line in text.splitlines():
+            line = line.rstrip()  # noqa: PLW2901
+            if line or (lines and lines[-1]):
+                lines.append(line)
+        while lines and not lines[-1]:
+            lines.pop()
+        return "\n".join(lines) + "\n" if lines else ""
@@ -0,0 +1,206 @@
+"""Daily API quota and a resumable journal of the words of a run."""
+import datetime
+import os
+import socket
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+
+class QuotaExhaustedError(Exception):
+    """Raise when today's API calls are used up."""
+
+
+def _connect(path: Path | str, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    # WAL lets readers run alongside the writer, but its index lives in
+    # shared memory, so only processes of one host can share the file.
+    if str(path) != ":memory:":
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        str(path),
+        timeout=30.0,
+        check_same_thread=check_same_thread,
+    )
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+class QuotaLedger:
+    """Count API calls per UTC day in SQLite, so the count survives restarts.
+
+    Without a `daily_limit` calls are only counted.
+    """
+
+    DEFAULT_PATH: Path = Path("data/quota.sqlite3")
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_PATH,
+        daily_limit: int | None = None,
+    ) -> None:
+        self.daily_limit: int | None = daily_limit
+        self._conn = _connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS calls ("
+            " day TEXT PRIMARY KEY,"
+            " count INTEGER NOT NULL)",
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def today() -> str:
+        """Return the current UTC date, the key of today's count."""
+        return datetime.datetime.now(datetime.UTC).date().isoformat()
+
+    def spent(self) -> int:
+        """Return the number of calls made today."""
+        row = self._conn.execute(
+            "SELECT count FROM calls WHERE day = ?",
+            (self.today(),),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self) -> float:
+        """Return the calls left today, infinite without a limit."""
+        if self.daily_limit is None:
+            return float("inf")
+        return max(self.daily_limit - self.spent(), 0)
+
+    def spend(self) -> None:
+        """Count one call, or raise QuotaExhaustedError if none is left.
+
+        The check and the count are one statement, so processes sharing the
+        ledger cannot together go over the limit.
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO calls SELECT :day, 1 WHERE coalesce(:limit, 1) > 0"
+                " ON CONFLICT (day) DO UPDATE SET count = count + 1"
+                " WHERE count < coalesce(:limit, count + 1)",
+                {"day": self.today(), "limit": self.daily_limit},
+            )
+        if not cursor.rowcount:
+            msg = f"Daily quota of {self.daily_limit} API calls used up"
+            raise QuotaExhaustedError(msg)
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._conn.close()
+
+
+class JobJournal:
+    """The state of every word of a run: pending, leased, done, failed or deferred.
+
+    Jobs are handed out highest priority first, and a run that stopped half
+    way, because of the quota or otherwise, resumes with the pending and
+    deferred jobs left. Several processes on one host can work through one
+    journal, which must sit on a local disk: each claims jobs under a
+    lease and releases what it did not finish when it stops, and jobs whose
+    lease ran out, because their worker died, go back to the queue.
+    """
+
+    STATES: tuple[str, ...] = ("pending", "leased", "done", "failed", "deferred")
+
+    def __init__(
+        self,
+        path: Path | str,
+        owner: str | None = None,
+        lease: float = 300.0,
+    ) -> None:
+        self.path: Path = Path(path)
+        self.owner: str = owner or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease: float = lease
+        self._conn = _connect(path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " word TEXT NOT NULL,"
+            " path TEXT PRIMARY KEY,"
+            " state TEXT NOT NULL DEFAULT 'pending',"
+            " priority REAL NOT NULL DEFAULT 0,"
+            " owner TEXT,"
+            " lease_until REAL,"
+            " updated_at REAL NOT NULL)",
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (state, priority, path)",
+        )
+        self._conn.commit()
+
+    def add(self, jobs: Iterable[tuple[str, Path, float]]) -> int:
+        """Add (word, note path, priority) jobs, keeping known ones as they are.
+
+        Return the number of new jobs.
+        """
+        before = self._conn.total_changes
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (word, path, priority, updated_at)"
+                " VALUES (?, ?, ?, ?)",
+                (
+                    (word, str(path), priority, time.time())
+                    for word, path, priority in jobs
+                ),
+            )
+        return self._conn.total_changes - before
+
+    def claim(self, count: int) -> list[tuple[str, Path]]:
+        """Lease up to `count` jobs to this owner for `lease` seconds.
+
+        Jobs are claimed highest priority first.
+
+        Pending and deferred jobs are claimed, and so are jobs whose lease
+        expired, e.g. because their worker died.
+        """
+        now = time.time()
+        with self._conn:
+            rows = self._conn.execute(
+                "UPDATE jobs SET state = 'leased', owner = ?, lease_until = ?,"
+                " updated_at = ? WHERE path IN ("
+                " SELECT path FROM jobs"
+                " WHERE state IN ('pending', 'deferred')"
+                " OR (state = 'leased' AND lease_until < ?)"
+                " ORDER BY priority DESC, path LIMIT ?)"
+                " RETURNING word, path, priority",
+                (self.owner, now + self.lease, now, now, count),
+            ).fetchall()
+        rows.sort(key=lambda row: (-row[2], row[1]))
+        return [(word, Path(path)) for word, path, _ in rows]
+
+    def mark(self, path: Path, state: str) -> None:
+        """Set the state of the job of a note, releasing its lease."""
+        if state not in self.STATES:
+            msg = f"Unknown job state: {state}"
+            raise ValueError(msg)
+        with self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, lease_until = NULL,"
+                " updated_at = ? WHERE path = ?",
+                (state, time.time(), str(path)),
+            )
+
+    def release(self) -> int:
+        """Put the jobs still leased to this owner back in the queue.
+
+        Return the number of jobs released.
+        """
+        with self._conn:
+            return self._conn.execute(
+                "UPDATE jobs SET state = 'pending', owner = NULL,"
+                " lease_until = NULL, updated_at = ?"
+                " WHERE owner = ? AND state = 'leased'",
+                (time.time(), self.owner),
+            ).rowcount
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of jobs in every state."""
+        counts = dict.fromkeys(self.STATES, 0)
+        counts.update(
+            self._conn.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state"),
+        )
+        return counts
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._conn.close()
@@ -1,145 +1,159 @@
-from collections import defaultdict
-from typing import Any
+import io
+from collections.abc import Mapping
+from typing import Any, TextIO
 
+from merriam_api_parser._entry import DividedSense, Entry, Sense, VerbalIllustration
+from merriam_api_parser._metrics import METRICS
 from merriam_api_parser._token_parser import TextTokenFormatter
 
+# Bump whenever the markdown output changes, incremental runs re-render then.
+RENDERER_VERSION: int = 1
+
 
 class JsonParser:
     """Parse json data from Merriam-Webster Collegiate Dictionary API."""
 
-    def __init__(self, json_data: dict[str, Any]) -> None:
+    def __init__(self, json_data: Mapping[str, Any]) -> None:
         self.token_parser = TextTokenFormatter()
-        self._data: dict[str, Any] = json_data
-        self._meta: dict[str, Any] = self._data.get("meta", {})
+        self._data: Mapping[str, Any] = json_data
+        self._meta: Mapping[str, Any] = self._data.get("meta", {})
         self._fl: str = self._data.get("fl", "")
-        self._sense: dict[str, dict[str, Any]] = defaultdict(dict)
-        self._md_text: str = ""
-        self._parse_sseq()
-
-    def _parse_sseq(self) -> None:
+        self._entry: Entry | None = None
+
+    def parse(self) -> Entry:
+        """Return the parsed entry, parsing it on first use."""
+        if self._entry is None:
+            with METRICS.time("parse"):
+                self._entry = Entry(
+                    entry_id=self._meta.get("id", ""),
+                    stems=tuple(self._meta.get("stems", [])),
+                    functional_label=self._fl,
+                    senses=tuple(self._parse_sseq()),
+                )
+        return self._entry
+
+    def _parse_sseq(self) -> list[Sense]:
         """Parse the 'sseq' field of the JSON data."""
+        senses: list[Sense] = []
         sseq = self._data.get("def", [{}])[0].get("sseq", [])
         for single_sseq in sseq:
-            self._parse_single_sseq(single_sseq)
+            self._parse_single_sseq(single_sseq, senses)
+        return senses
 
-    def _parse_single_sseq(self, single_sseq: list[Any]) -> None:
-        """Parse a single 'sseq' element."""
+    def _parse_single_sseq(self, single_sseq: list[Any], senses: list[Sense]) -> None:
+        """Parse a single 'sseq' element into senses."""
         for single_sense in single_sseq:
             try:
                 if single_sense[0] == "sense":
-                    sense_number, definition_text = self._parse_single_sense(
-                        single_sense,
-                    )
-                    self._sense[sense_number] = definition_text
+                    senses.append(self._parse_single_sense(single_sense))
                 elif single_sense[0] == "pseq":
-                    for single_sense_ in single_sense[1]:
-                        sense_number, definition_text = self._parse_single_sense(
-                            single_sense_,
-                        )
-                        self._sense[sense_number] = definition_text
-            except (TypeError, KeyError, IndexError):
+                    senses.extend(
+                        self._parse_single_sense(single_sense_)
+                        for single_sense_ in single_sense[1]
+                    )
+            except (TypeError, KeyError, IndexError, ValueError):
                 continue
 
-    def _parse_single_sense(
-        self,
-        single_sense: list[Any],
-    ) -> tuple[str, dict[str, Any]]:
+    def _parse_single_sense(self, single_sense: list[Any]) -> Sense:
         """Parse a single 'sense' element."""
-        single_sense_ele: defaultdict[str, str | list[list[str | Any]]] = defaultdict(
-            str,
-            single_sense[1],
-        )
-        sense_number: str = single_sense_ele.get("sn", "")  # type: ignore
-        definition_text = self._parse_dt(single_sense_ele.get("dt", []))  # type: ignore
-        definition_text["text"] = self.token_parser.parse_token(definition_text["text"])
-        definition_text["vis"] = [
-            self.token_parser.parse_token(i["t"]) for i in definition_text["vis"]
-        ]
-
-        if single_sense_ele.get("sdsense") is not None:
-            divided_sense: defaultdict[str, str | list[list[str | Any]]] = defaultdict(
-                str,
-                single_sense_ele["sdsense"],  # type: ignore
-            )
-            divided_sense_dt = self._parse_dt(divided_sense["dt"])  # type: ignore
-            definition_text["sdsense_sd"] = divided_sense["sd"]
-            definition_text["sdsense_text"] = self.token_parser.parse_token(
-                divided_sense_dt["text"],
-            )
-
-        return sense_number, definition_text
-
-    def _parse_dt(self, origin_dt: list[list[str | Any]]) -> dict[str, Any]:
-        """Parse a 'dt' element, return a dictionary."""
-        dt_ele = self._name_ele_constructor(origin_dt)
-        return {"text": dt_ele.get("text", ""), "vis": dt_ele.get("vis", "")}
-
-    # not change to stasticmethod
-    def _name_ele_constructor(self, lst: list[list[str | Any]]) -> dict[str, Any]:
-        """Construct a dictionary from a list of lists."""
-        names = []
-        ele = []
-        for single in lst:
-            names.append(single[0])
-            ele.append(single[1])
-        return dict(zip(names, ele, strict=True))
+        sense_ele: dict[str, Any] = single_sense[1]
+        text, vis = self._parse_dt(sense_ele.get("dt", []))
+        divided = None
+        if (sdsense := sense_ele.get("sdsense")) is not None:
+            sd_text, sd_vis = self._parse_dt(sdsense.get("dt", []))
+            divided = DividedSense(sdsense.get("sd", ""), sd_text, sd_vis)
+        return Sense(sense_ele.get("sn", ""), text, vis, divided)
+
+    def _parse_dt(
+        self,
+        origin_dt: list[list[Any]],
+    ) -> tuple[str, tuple[VerbalIllustration, ...]]:
+        """Parse a 'dt' element into its text and verbal illustrations."""
+        texts: list[str] = []
+        vis: list[VerbalIllustration] = []
+        for name, ele in origin_dt:
+            if name == "text":
+                texts.append(ele)
+            elif name == "vis":
+                vis.extend(VerbalIllustration(i["t"]) for i in ele)
+        return "".join(texts), tuple(vis)
 
     def get_md_text(self) -> str:
         """Get the markdown text."""
-        # note's metadata
-        self._add_three_hyphen_up()
-        self._add_synonym()
-        self._add_three_hyphen_down()
+        return MarkdownRenderer(self.token_parser).render(self.parse())
+
+    def write_md(self, out: TextIO) -> None:
+        """Write the markdown text to a file-like object piece by piece."""
+        MarkdownRenderer(self.token_parser).write(self.parse(), out)
+
+
+class MarkdownRenderer:
+    """Render a parsed entry as a markdown note."""
 
-        self._add_head(self._meta.get("id", ""), 1)
-        self._add_all_sense()
-        return self._md_text
+    def __init__(self, token_parser: TextTokenFormatter | None = None) -> None:
+        self.token_parser: TextTokenFormatter = token_parser or TextTokenFormatter()
 
-    def _add_all_sense(self) -> None:
+    def render(self, entry: Entry) -> str:
+        """Return the markdown text of an entry."""
+        out = io.StringIO()
+        self.write(entry, out)
+        return out.getvalue()
+
+    def write(self, entry: Entry, out: TextIO) -> None:
+        """Write the markdown text to a file-like object piece by piece."""
+        with METRICS.time("render"):
+            # note's metadata
+            self._add_three_hyphen_up(out)
+            self._add_synonym(out, entry.stems)
+            self._add_three_hyphen_down(out)
+
+            self._add_head(out, entry.entry_id, 1)
+            self._add_all_sense(out, entry.senses)
+
+    def _add_all_sense(self, out: TextIO, senses: tuple[Sense, ...]) -> None:
         """Add all senses to the markdown text."""
-        for head, sense in self._sense.items():
-            self._add_head(head, level=2)
-            self._add_sense(sense, "text", "vis")
-            if sense.get("sdsense_sd") is not None:
-                self._add_head(sense.get("sdsense_sd", ""), level=3)
-                self._add_sense(sense, "sdsense_text", "sdense_vis")
+        for sense in senses:
+            self._add_head(out, sense.number, level=2)
+            self._add_sense(out, sense.text, sense.vis)
+            if sense.divided is not None:
+                self._add_head(out, sense.divided.divider, level=3)
+                self._add_sense(out, sense.divided.text, sense.divided.vis)
 
     def _add_sense(
         self,
-        sense: dict[str, str],
-        sense_text: str,
-        illustration: str,
+        out: TextIO,
+        text: str,
+        vis: tuple[VerbalIllustration, ...],
     ) -> None:
         """Add a sense to the markdown text."""
-        self._add_md_new_line()
-        self._md_text += _md_text_color(f"{sense.get(sense_text, '')}")
-        self._add_md_new_line()
-        self._md_text += "\n\n".join(sense.get(illustration, ""))
-
-    def _add_head(self, head: str, level: int) -> None:
+        self._add_md_new_line(out)
+        out.write(_md_text_color(self.token_parser.parse_token(text)))
+        self._add_md_new_line(out)
+        for i, illustration in enumerate(vis):
+            if i:
+                self._add_md_new_line(out)
+            out.write(self.token_parser.parse_token(illustration.text))
+
+    def _add_head(self, out: TextIO, head: str, level: int) -> None:
         """Add a heading to the markdown text."""
-        self._add_md_new_line()
-        self._md_text += f"{'#' * level} {head}"
+        self._add_md_new_line(out)
+        out.write(f"{'#' * level} {head}")
 
-    def _add_md_new_line(self) -> None:
+    def _add_md_new_line(self, out: TextIO) -> None:
         """Add a new line to the markdown text."""
-        self._md_text += "\n\n"
+        out.write("\n\n")
 
-    def _add_three_hyphen_up(
-        self,
-    ) -> None:
+    def _add_three_hyphen_up(self, out: TextIO) -> None:
         """Add three hyphens to the note's metadata."""
-        self._md_text += "---\n"
+        out.write("---\n")
 
-    def _add_three_hyphen_down(
-        self,
-    ) -> None:
-        self._md_text += "---"
+    def _add_three_hyphen_down(self, out: TextIO) -> None:
+        out.write("---")
 
-    def _add_synonym(self) -> None:
+    def _add_synonym(self, out: TextIO, stems: tuple[str, ...]) -> None:
         """Add synonyms to the note's metadata."""
-        if synonym := self._meta.get("stems", []):
-            self._md_text += f"aliases: {', '.join(synonym)}\n"
+        if stems:
+            out.write(f"aliases: {', '.join(stems)}\n")
 
 
 def _md_text_color(text: str, color: str = "#FFB8EBA6") -> str:
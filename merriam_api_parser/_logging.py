@@ -0,0 +1,97 @@
+"""Logging that never blocks the event loop on terminal or file writes."""
+import json
+import logging
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+# Attributes every LogRecord has, anything else was passed in `extra`.
+_RECORD_ATTRIBUTES: frozenset[str] = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)),
+) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, `extra` fields included."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Return the record as a JSON line."""
+        data: dict[str, Any] = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        data.update(
+            (key, value)
+            for key, value in vars(record).items()
+            if key not in _RECORD_ATTRIBUTES
+        )
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Let through at most `rate` records per second of each message template.
+
+    Only records at `level` or below are limited, warnings and errors always
+    pass. The first record let through after a gap reports how many similar
+    records were dropped.
+    """
+
+    def __init__(self, rate: float = 10.0, level: int = logging.INFO) -> None:
+        super().__init__()
+        self.rate: float = rate
+        self.burst: float = max(rate, 1.0)
+        self.level: int = level
+        self.dropped: int = 0
+        self._buckets: dict[object, tuple[float, float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return False if the record's template is over its rate."""
+        if record.levelno > self.level:
+            return True
+        template, now = record.msg, time.monotonic()
+        tokens, last, dropped = self._buckets.get(template, (self.burst, now, 0))
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+        if tokens < 1:
+            self._buckets[template] = (tokens, now, dropped + 1)
+            self.dropped += 1
+            return False
+        self._buckets[template] = (tokens - 1, now, 0)
+        if dropped:
+            record.msg = f"{template} ({dropped} similar messages dropped)"
+        return True
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue records as they are, for handlers in the same process.
+
+    QueueHandler formats records before queueing them, so the handlers
+    behind the queue would format them a second time.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unchanged."""
+        return record
+
+
+def start_logging(
+    handlers: list[logging.Handler],
+    level: int | str = logging.INFO,
+    rate: float | None = None,
+) -> QueueListener:
+    """Route all records through a queue to handlers on a background thread.
+
+    Call `stop()` on the returned listener to flush the queue before exit.
+    """
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _LocalQueueHandler(records)
+    if rate:
+        queue_handler.addFilter(RateLimitFilter(rate))
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    logging.basicConfig(level=level, handlers=[queue_handler])
+    return listener
@@ -0,0 +1,92 @@
+"""Track what was fetched for every note, so unchanged notes can be skipped."""
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from merriam_api_parser._json_parser import RENDERER_VERSION
+
+
+def content_hash(text: str) -> str:
+    """Return a short, stable hash of text."""
+    return hashlib.blake2b(text.encode("UTF-8"), digest_size=16).hexdigest()
+
+
+def _is_blank(path: Path, chunk_size: int = 4096) -> bool:
+    """Return True if a file holds nothing but whitespace."""
+    with path.open("rb") as file:
+        while chunk := file.read(chunk_size):
+            if chunk.strip():
+                return False
+    return True
+
+
+@dataclass
+class ManifestEntry:
+    """When and what was fetched and written for one note."""
+
+    fetched_at: float
+    response_hash: str
+    output_hash: str
+    renderer_version: int = RENDERER_VERSION
+
+
+class Manifest:
+    """JSON file mapping each note of a directory to its last fetch.
+
+    Notes are keyed by their path relative to the directory, so notes of the
+    same word in different folders are tracked apart.
+    """
+
+    FILE_NAME: str = ".merriam_manifest.json"
+
+    def __init__(self, directory: Path) -> None:
+        self.directory: Path = directory
+        self.path: Path = directory / self.FILE_NAME
+        self.entries: dict[str, ManifestEntry] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="UTF-8"))
+            self.entries = {key: ManifestEntry(**entry) for key, entry in data.items()}
+
+    def key(self, note: Path) -> str:
+        """Return the key of a note: its path relative to the directory."""
+        try:
+            return note.relative_to(self.directory).as_posix()
+        except ValueError:
+            return note.as_posix()
+
+    def is_due(self, note: Path, max_age: float) -> bool:
+        """Return True if the note is empty, stale or from an older renderer.
+
+        Notes written before the manifest existed count as fetched at their
+        modification time by the current renderer. Notes are only read as
+        far as their first non-blank chunk.
+        """
+        try:
+            status = note.stat()
+            if not status.st_size or _is_blank(note):
+                return True
+        except FileNotFoundError:
+            return True
+        entry = self.entries.get(self.key(note))
+        if entry is None:
+            fetched_at, version = status.st_mtime, RENDERER_VERSION
+        else:
+            fetched_at, version = entry.fetched_at, entry.renderer_version
+        return version != RENDERER_VERSION or time.time() - fetched_at > max_age
+
+    def record(self, note: Path, body: str, output: str) -> None:
+        """Remember a successful fetch for a note."""
+        self.entries[self.key(note)] = ManifestEntry(
+            time.time(),
+            content_hash(body),
+            content_hash(output),
+        )
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        temp = self.path.with_suffix(".tmp")
+        data = {key: asdict(entry) for key, entry in sorted(self.entries.items())}
+        temp.write_text(json.dumps(data, indent=1), encoding="UTF-8")
+        temp.replace(self.path)
@@ -0,0 +1,221 @@
+"""Latency histograms and counters of every stage of a run."""
+import asyncio
+import bisect
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TextIO
+
+
+class Histogram:
+    """Count observations in fixed, roughly logarithmic buckets of seconds."""
+
+    BUCKETS: tuple[float, ...] = (
+        0.0001,
+        0.00025,
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    )
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = buckets
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the observations of a histogram with the same buckets."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the q-quantile."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank and seen:
+                return bound
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable summary."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip(map(str, self.buckets), self.counts, strict=False)),
+        }
+
+
+class Metrics:
+    """Registry of named histograms and counters, safe to use from threads.
+
+    Metrics pickle, so worker processes can `drain` what they recorded and
+    send it to the parent process to `merge`.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {}
+        self.counters: Counter[str] = Counter()
+        self.started: float = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a duration in the histogram called name."""
+        with self._lock:
+            if (histogram := self.histograms.get(name)) is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increase the counter called name."""
+        with self._lock:
+            self.counters[name] += value
+
+    @contextmanager
+    def time(self, name: str) -> Iterator[None]:
+        """Record how long the block takes, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def drain(self) -> "Metrics":
+        """Return everything recorded so far and forget it here."""
+        drained = Metrics()
+        with self._lock:
+            drained.histograms, self.histograms = self.histograms, {}
+            drained.counters, self.counters = self.counters, Counter()
+        return drained
+
+    def merge(self, other: "Metrics") -> None:
+        """Add the histograms and counters of other, e.g. from a worker."""
+        with self._lock:
+            for name, histogram in other.histograms.items():
+                if (mine := self.histograms.get(name)) is None:
+                    mine = self.histograms[name] = Histogram(histogram.buckets)
+                mine.merge(histogram)
+            self.counters.update(other.counters)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.started = time.perf_counter()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return every histogram and counter as JSON-serializable data."""
+        with self._lock:
+            return {
+                "seconds": time.perf_counter() - self.started,
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {
+                    name: histogram.to_dict()
+                    for name, histogram in sorted(self.histograms.items())
+                },
+            }
+
+    def to_prometheus(self, prefix: str = "merriam") -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+                lines.append(f"{prefix}_{name}_total {value}")
+            for name, histogram in sorted(self.histograms.items()):
+                metric = f"{prefix}_{name}_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(
+                    histogram.buckets,
+                    histogram.counts,
+                    strict=False,
+                ):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum {histogram.sum}")
+                lines.append(f"{metric}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Path) -> None:
+        """Write the metrics as JSON for a .json path, else as Prometheus text."""
+        if path.suffix.lower() == ".json":
+            text = json.dumps(self.to_dict(), indent=1)
+        else:
+            text = self.to_prometheus()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="UTF-8")
+
+    def progress_line(self) -> str:
+        """Return a one-line summary of the run so far."""
+        with self._lock:
+            notes = self.counters["notes_written"] + self.counters["notes_unchanged"]
+            failed = self.counters["api_failures"]
+            fetch = self.histograms.get("fetch")
+        elapsed = time.perf_counter() - self.started
+        line = f"{notes} notes, {failed} failed, {notes / elapsed:.1f} notes/s"
+        if fetch is not None:
+            line += f", fetch p50 {fetch.quantile(0.5) * 1000:.0f}ms"
+        return line
+
+
+async def show_progress(
+    metrics: Metrics,
+    interval: float = 1.0,
+    stream: TextIO = sys.stderr,
+) -> None:
+    """Redraw the progress line every interval seconds until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            stream.write(f"\r{metrics.progress_line()}\x1b[K")
+            stream.flush()
+    finally:
+        stream.write(f"\r{metrics.progress_line()}\x1b[K\n")
+        stream.flush()
+
+
+METRICS = Metrics()
@@ -0,0 +1,180 @@
+"""Streaming fetch, parse and write pipeline connected by bounded queues."""
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from merriam_api_parser._io import Writer
+from merriam_api_parser._journal import QuotaExhaustedError
+
+_DONE = None
+
+
+class _Api(Protocol):
+    async def fetch(self, word: str) -> str | None:
+        ...
+
+    def render(self, body: str) -> str:
+        ...
+
+
+@dataclass
+class PipelineStats:
+    """Counters of one pipeline run."""
+
+    fetched: int = 0
+    written: int = 0
+    unchanged: int = 0
+    failed: int = 0
+
+
+class Pipeline:
+    """Fetch, render and write notes as soon as each response arrives.
+
+    Words flow through three stages connected by bounded queues: `fetchers`
+    concurrent fetch workers, a render stage and a write-behind writer
+    running on a thread. A full queue blocks the stage before it, so memory
+    stays flat whatever the batch size, and every finished note is on disk
+    even if the run dies half way. The stages run in a task group: if one
+    dies, the others are cancelled and its error is raised from `run`.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        api: _Api,
+        *,
+        fetchers: int = 16,
+        queue_size: int | None = None,
+        on_write: Callable[[Path, str, str], object] | None = None,
+        on_done: Callable[[str, Path], object] | None = None,
+        on_fail: Callable[[str, Path, Exception | None], object] | None = None,
+    ) -> None:
+        self.api: _Api = api
+        self.fetchers: int = fetchers
+        self.queue_size: int = queue_size or 2 * fetchers
+        self.on_write: Callable[[Path, str, str], object] | None = on_write
+        self.on_done: Callable[[str, Path], object] | None = on_done
+        self.on_fail: Callable[[str, Path, Exception | None], object] | None = on_fail
+        self.stats = PipelineStats()
+
+    async def run(
+        self,
+        words: Iterable[tuple[str, Path]] | AsyncIterable[tuple[str, Path]],
+    ) -> PipelineStats:
+        """Process (word, note path) pairs until the source is exhausted."""
+        fetch_queue: asyncio.Queue[tuple[str, Path] | None] = asyncio.Queue(
+            self.queue_size,
+        )
+        parse_queue: asyncio.Queue[tuple[str, Path, str] | None] = asyncio.Queue(
+            self.queue_size,
+        )
+        write_queue: asyncio.Queue[tuple[str, Path, str, str] | None] = asyncio.Queue(
+            self.queue_size,
+        )
+        try:
+            async with asyncio.TaskGroup() as stages:
+                fetchers = [
+                    stages.create_task(self._fetch(fetch_queue, parse_queue))
+                    for _ in range(self.fetchers)
+                ]
+                parser = stages.create_task(self._parse(parse_queue, write_queue))
+                writer = stages.create_task(self._write(write_queue))
+                await self._feed(words, fetch_queue)
+                for _ in fetchers:
+                    await fetch_queue.put(_DONE)
+                await asyncio.gather(*fetchers)
+                await parse_queue.put(_DONE)
+                await parser
+                await write_queue.put(_DONE)
+                await writer
+        except ExceptionGroup as error:
+            # A stage died and the others were cancelled; surface its error.
+            raise error.exceptions[0] from error
+        return self.stats
+
+    @staticmethod
+    async def _feed(
+        words: Iterable[tuple[str, Path]] | AsyncIterable[tuple[str, Path]],
+        fetch_queue: asyncio.Queue[tuple[str, Path] | None],
+    ) -> None:
+        if isinstance(words, AsyncIterable):
+            async for item in words:
+                await fetch_queue.put(item)
+        else:
+            for item in words:
+                await fetch_queue.put(item)
+
+    async def _fetch(
+        self,
+        fetch_queue: asyncio.Queue[tuple[str, Path] | None],
+        parse_queue: asyncio.Queue[tuple[str, Path, str] | None],
+    ) -> None:
+        while (item := await fetch_queue.get()) is not _DONE:
+            word, path = item
+            error: Exception | None = None
+            try:
+                body = await self.api.fetch(word)
+            except QuotaExhaustedError as quota_error:
+                logging.info("%s, deferring %s", quota_error, word)
+                body, error = None, quota_error
+            except Exception as fetch_error:
+                logging.exception("Failed to get response for %s", word)
+                body, error = None, fetch_error
+            if body is None:
+                self._fail(word, path, error)
+                continue
+            self.stats.fetched += 1
+            await parse_queue.put((word, path, body))
+
+    async def _parse(
+        self,
+        parse_queue: asyncio.Queue[tuple[str, Path, str] | None],
+        write_queue: asyncio.Queue[tuple[str, Path, str, str] | None],
+    ) -> None:
+        while (item := await parse_queue.get()) is not _DONE:
+            word, path, body = item
+            try:
+                markdown = self.api.render(body)
+            except Exception as error:
+                logging.exception("Failed to render %s", word)
+                self._fail(word, path, error)
+                continue
+            await write_queue.put((word, path, body, markdown))
+
+    async def _write(
+        self,
+        write_queue: asyncio.Queue[tuple[str, Path, str, str] | None],
+    ) -> None:
+        while (item := await write_queue.get()) is not _DONE:
+            word, path, body, markdown = item
+            try:
+                written = await asyncio.to_thread(
+                    Writer(path, normalize=True).write,
+                    markdown,
+                )
+            except OSError as error:
+                logging.exception("Failed to write %s", path)
+                self._fail(word, path, error)
+                continue
+            if written:
+                self.stats.written += 1
+            else:
+                self.stats.unchanged += 1
+            try:
+                if self.on_write is not None:
+                    self.on_write(path, body, markdown)
+                if self.on_done is not None:
+                    self.on_done(word, path)
+            except Exception:
+                logging.exception("Callback failed for %s", word)
+
+    def _fail(self, word: str, path: Path, error: Exception | None) -> None:
+        self.stats.failed += 1
+        if self.on_fail is None:
+            return
+        try:
+            self.on_fail(word, path, error)
+        except Exception:
+            logging.exception("Callback failed for %s", word)
@@ -0,0 +1,187 @@
+"""Retries with backoff, a circuit breaker and a deadline for API requests."""
+import asyncio
+import logging
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from merriam_api_parser._http import HTTPError, Response
+from merriam_api_parser._metrics import METRICS
+
+
+class DeadlineExceededError(HTTPError):
+    """Raise when the run's deadline leaves no time for another request."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How long to wait for a request and how to retry it.
+
+    Retries wait a random time of up to `backoff * 2 ** attempt` seconds,
+    capped at `max_backoff` ("full jitter"), or longer if the server asks
+    for it with Retry-After.
+    """
+
+    attempts: int = 4
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def delay(
+        self,
+        attempt: int,
+        retry_after: str | None = None,
+        rng: random.Random | None = None,
+    ) -> float:
+        """Return the seconds to wait before retry number `attempt + 1`."""
+        cap = min(self.max_backoff, self.backoff * 2**attempt)
+        delay = (rng or random).uniform(0, cap)
+        return max(delay, _parse_retry_after(retry_after))
+
+
+def _parse_retry_after(value: str | None) -> float:
+    """Return the seconds a Retry-After header asks to wait, 0 if unknown."""
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime  # rare, keep it off startup
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class CircuitBreaker:
+    """Pause all requests for `cooldown` seconds when too many of them fail.
+
+    The breaker opens once `threshold` of the last `window` requests failed.
+    After the cooldown requests go through again, and the first failure
+    reopens the breaker until a request succeeds.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        window: int = 20,
+        cooldown: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.threshold: float = threshold
+        self.cooldown: float = cooldown
+        self.opened: int = 0
+        self._clock = clock
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._open_until: float = 0.0
+        self._probing: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are paused."""
+        return self._clock() < self._open_until
+
+    def record(self, *, success: bool) -> None:
+        """Count the outcome of one request."""
+        if success:
+            self._probing = False
+        elif self._probing:
+            self._open()
+            return
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        full = len(self._outcomes) == self._outcomes.maxlen
+        if full and failures >= self.threshold * len(self._outcomes):
+            self._open()
+
+    def _open(self) -> None:
+        self._open_until = self._clock() + self.cooldown
+        self._outcomes.clear()
+        self._probing = True
+        self.opened += 1
+        METRICS.count("breaker_opened")
+        logging.warning("Too many failures, pausing requests for %.0fs", self.cooldown)
+
+    async def wait(self) -> None:
+        """Wait until the breaker lets requests through."""
+        while (remaining := self._open_until - self._clock()) > 0:
+            await asyncio.sleep(remaining)
+
+
+class Deadline:
+    """Time budget of a whole run, unlimited if `seconds` is None."""
+
+    def __init__(
+        self,
+        seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._end: float = math.inf if seconds is None else clock() + seconds
+
+    def remaining(self) -> float:
+        """Return the seconds left, never negative."""
+        return max(self._end - self._clock(), 0.0)
+
+
+class Retrier:
+    """Send requests under a retry policy, a circuit breaker and a deadline."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        deadline: Deadline | None = None,
+    ) -> None:
+        self.policy: RetryPolicy = policy or RetryPolicy()
+        self.breaker: CircuitBreaker = breaker or CircuitBreaker()
+        self.deadline: Deadline = deadline or Deadline()
+
+    async def call(
+        self,
+        send: Callable[[float, float], Awaitable[Response]],
+    ) -> Response:
+        """Call send(read_timeout, connect_timeout) until it succeeds.
+
+        Return the last response once the attempts are used up, or raise the
+        last HTTPError. Raise DeadlineExceededError when the deadline does
+        not leave time for the next attempt.
+        """
+        policy = self.policy
+        for attempt in range(policy.attempts):
+            await self.breaker.wait()
+            remaining = self.deadline.remaining()
+            if not remaining:
+                msg = "Deadline exceeded"
+                raise DeadlineExceededError(msg)
+            retry_after = None
+            try:
+                response = await send(
+                    min(policy.read_timeout, remaining),
+                    min(policy.connect_timeout, remaining),
+                )
+            except HTTPError:
+                self.breaker.record(success=False)
+                if attempt + 1 == policy.attempts:
+                    raise
+            else:
+                retryable = response.status in policy.retry_statuses
+                self.breaker.record(success=not retryable)
+                if not retryable or attempt + 1 == policy.attempts:
+                    return response
+                retry_after = response.headers.get("retry-after")
+            delay = policy.delay(attempt, retry_after)
+            if delay >= self.deadline.remaining():
+                msg = "Deadline exceeded"
+                raise DeadlineExceededError(msg)
+            METRICS.count("api_retries")
+            await asyncio.sleep(delay)
+        msg = "No attempts allowed"
+        raise HTTPError(msg)
@@ -0,0 +1,153 @@
+"""Rate limiting and adaptive concurrency for batches of API requests."""
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Protocol
+
+
+class _Bucket(Protocol):
+    rate: float
+
+    async def acquire(self) -> None:
+        ...
+
+
+class TokenBucket:
+    """Allow `rate` acquisitions per second with bursts of up to `burst`."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            msg = f"rate must be positive, got {rate}"
+            raise ValueError(msg)
+        self.rate: float = rate
+        self.burst: float = max(burst if burst is not None else rate, 1.0)
+        self._clock = clock
+        self._tokens: float = self.burst
+        self._updated: float = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+@dataclass
+class Slot:
+    """One in-flight request; set `status` so the scheduler can adapt."""
+
+    status: int = 0
+
+
+class AdaptiveScheduler:
+    """Bound in-flight requests with AIMD and pace them with a token bucket.
+
+    The concurrency limit grows by one per window of successful requests and
+    is cut multiplicatively on 429s, 5xx, transport errors or latency above
+    `target_latency`, at most once per observed round trip. Pass a `bucket`
+    to pace requests with another token bucket, e.g. one shared by several
+    processes.
+    """
+
+    THROTTLED: int = 429
+    SERVER_ERROR: int = 500
+
+    def __init__(  # noqa: PLR0913
+        self,
+        rate: float = 10.0,
+        burst: float | None = None,
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        max_concurrency: int = 64,
+        target_latency: float = 2.0,
+        backoff: float = 0.5,
+        bucket: _Bucket | None = None,
+    ) -> None:
+        self.bucket: _Bucket = bucket or TokenBucket(rate, burst)
+        self.min_concurrency: int = min_concurrency
+        self.max_concurrency: int = max_concurrency
+        self.target_latency: float = target_latency
+        self.backoff: float = backoff
+        self._limit: float = float(
+            min(max(concurrency, min_concurrency), max_concurrency),
+        )
+        self._in_flight: int = 0
+        self._changed = asyncio.Condition()
+        self._latency: float = 0.0
+        self._last_decrease: float = 0.0
+        self.completed: int = 0
+        self.throttled: int = 0
+        self.errors: int = 0
+
+    @property
+    def limit(self) -> int:
+        """Return the current in-flight limit."""
+        return int(self._limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Slot]:
+        """Wait for a free slot and a rate token, then run one request."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        slot = Slot()
+        start = time.monotonic()
+        try:
+            await self.bucket.acquire()
+            start = time.monotonic()
+            yield slot
+        except Exception:
+            slot.status = -1
+            raise
+        finally:
+            self._observe(time.monotonic() - start, slot.status)
+            async with self._changed:
+                self._in_flight -= 1
+                self._changed.notify_all()
+
+    def _observe(self, latency: float, status: int) -> None:
+        """Adjust the concurrency limit from one finished request."""
+        self.completed += 1
+        self._latency = (
+            0.8 * self._latency + 0.2 * latency if self._latency else latency
+        )
+        if status == self.THROTTLED:
+            self.throttled += 1
+        elif status < 0 or status >= self.SERVER_ERROR:
+            self.errors += 1
+        elif latency <= self.target_latency:
+            self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+            return
+
+        now = time.monotonic()
+        if now - self._last_decrease >= self._latency:
+            self._last_decrease = now
+            self._limit = max(self.min_concurrency, self._limit * self.backoff)
+
+    def stats(self) -> dict[str, float]:
+        """Return the current limits and counters."""
+        return {
+            "rate": self.bucket.rate,
+            "concurrency_limit": self.limit,
+            "in_flight": self._in_flight,
+            "completed": self.completed,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "latency": round(self._latency, 4),
+        }
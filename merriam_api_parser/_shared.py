@@ -0,0 +1,76 @@
+"""A rate limit shared by the processes working through one journal."""
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from merriam_api_parser._journal import _connect
+
+
+class SharedTokenBucket:
+    """A token bucket kept in SQLite, shared by every process that opens it.
+
+    Each acquisition refills and takes a token in one write transaction, so
+    the processes sharing the file, all on one host, together make at most
+    `rate` requests per second. The transaction may wait on other
+    processes, so `acquire` runs it on a worker thread.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Path | str,
+        rate: float,
+        burst: float | None = None,
+        name: str = "api",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if rate <= 0:
+            msg = f"rate must be positive, got {rate}"
+            raise ValueError(msg)
+        self.rate: float = rate
+        self.burst: float = max(burst if burst is not None else rate, 1.0)
+        self.name: str = name
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = _connect(path, check_same_thread=False)
+        self._conn.isolation_level = None
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " name TEXT PRIMARY KEY,"
+            " tokens REAL NOT NULL,"
+            " updated_at REAL NOT NULL)",
+        )
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while (wait := await asyncio.to_thread(self.take)) > 0:
+            await asyncio.sleep(wait)
+
+    def take(self) -> float:
+        """Take a token and return 0, or return the seconds until one is due."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = self._clock()
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM buckets WHERE name = ?",
+                    (self.name,),
+                ).fetchone()
+                tokens, updated = row or (self.burst, now)
+                tokens = min(self.burst, tokens + max(now - updated, 0.0) * self.rate)
+                wait = 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                    (self.name, tokens - 1 if not wait else tokens, now),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return wait
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,175 @@
+"""Export parsed entries to a single file in buffered, batched writes."""
+import abc
+import csv
+import html
+import json
+import sqlite3
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Protocol, Self
+
+from merriam_api_parser._entry import Entry
+from merriam_api_parser._token_parser import HtmlTokenFormatter
+
+
+class Sink(Protocol):
+    """Destination of (word, entry, markdown) rows."""
+
+    def write(self, word: str, entry: Entry, markdown: str) -> None:
+        """Add one row."""
+
+    def close(self) -> None:
+        """Flush pending rows and release the destination."""
+
+
+class BatchSink(abc.ABC):
+    """Collect rows in memory and hand them to `_flush` `batch_size` at a time.
+
+    Subclasses turn an entry into a row with `_row` and write a batch of
+    rows with `_flush`.
+    """
+
+    def __init__(self, batch_size: int = 1000) -> None:
+        self.batch_size: int = batch_size
+        self.rows: int = 0
+        self._batch: list[Any] = []
+
+    def write(self, word: str, entry: Entry, markdown: str) -> None:
+        """Add one row, flushing the batch once it is full."""
+        self._batch.append(self._row(word, entry, markdown))
+        self.rows += 1
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write out the pending batch."""
+        if self._batch:
+            self._flush(self._batch)
+            self._batch = []
+
+    def close(self) -> None:
+        """Flush pending rows."""
+        self.flush()
+
+    @abc.abstractmethod
+    def _row(self, word: str, entry: Entry, markdown: str) -> Any:  # noqa: ANN401
+        """Return the row of one entry."""
+
+    @abc.abstractmethod
+    def _flush(self, batch: list[Any]) -> None:
+        """Write a batch of rows."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_args: object) -> None:
+        self.close()
+
+
+class JsonlSink(BatchSink):
+    """One JSON object per line with the word, parsed entry and markdown."""
+
+    def __init__(self, path: Path, batch_size: int = 1000) -> None:
+        super().__init__(batch_size)
+        self._file = path.open("w", encoding="UTF-8", buffering=1 << 20)
+
+    def _row(self, word: str, entry: Entry, markdown: str) -> str:
+        row = {"word": word, **asdict(entry), "markdown": markdown}
+        return json.dumps(row, ensure_ascii=False) + "\n"
+
+    def _flush(self, batch: list[str]) -> None:
+        self._file.write("".join(batch))
+
+    def close(self) -> None:
+        """Flush pending rows and close the file."""
+        super().close()
+        self._file.close()
+
+
+class SqliteSink(BatchSink):
+    """An `entries` table, committing one transaction per batch."""
+
+    def __init__(self, path: Path, batch_size: int = 1000) -> None:
+        super().__init__(batch_size)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " word TEXT PRIMARY KEY,"
+            " entry_id TEXT NOT NULL,"
+            " functional_label TEXT NOT NULL,"
+            " stems TEXT NOT NULL,"
+            " senses TEXT NOT NULL,"
+            " markdown TEXT NOT NULL)",
+        )
+
+    def _row(self, word: str, entry: Entry, markdown: str) -> tuple[str, ...]:
+        return (
+            word,
+            entry.entry_id,
+            entry.functional_label,
+            json.dumps(entry.stems, ensure_ascii=False),
+            json.dumps([asdict(sense) for sense in entry.senses], ensure_ascii=False),
+            markdown,
+        )
+
+    def _flush(self, batch: list[tuple[str, ...]]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+
+    def close(self) -> None:
+        """Commit pending rows and close the database."""
+        super().close()
+        self._conn.close()
+
+
+class AnkiCsvSink(BatchSink):
+    """A CSV of word / definition notes that Anki imports as is.
+
+    Anki reads the fields as HTML, so definitions are rendered to HTML and
+    words are escaped.
+    """
+
+    def __init__(self, path: Path, batch_size: int = 1000) -> None:
+        super().__init__(batch_size)
+        self.token_parser = HtmlTokenFormatter()
+        self._file = path.open("w", encoding="UTF-8", newline="", buffering=1 << 20)
+        self._file.write("#separator:Comma\n#html:true\n#columns:Front,Back\n")
+        self._writer = csv.writer(self._file)
+
+    def _row(self, word: str, entry: Entry, _markdown: str) -> tuple[str, str]:
+        senses = (
+            f"{sense.number} {self.token_parser.parse_token(sense.text)}".strip()
+            for sense in entry.senses
+        )
+        return html.escape(word, quote=False), "<br>".join(senses)
+
+    def _flush(self, batch: list[tuple[str, str]]) -> None:
+        self._writer.writerows(batch)
+
+    def close(self) -> None:
+        """Flush pending rows and close the file."""
+        super().close()
+        self._file.close()
+
+
+SINKS: dict[str, Callable[[Path, int], BatchSink]] = {
+    ".jsonl": JsonlSink,
+    ".sqlite3": SqliteSink,
+    ".db": SqliteSink,
+    ".csv": AnkiCsvSink,
+}
+
+
+def open_sink(path: Path, batch_size: int = 1000) -> BatchSink:
+    """Open the sink matching the suffix of path."""
+    try:
+        sink = SINKS[path.suffix.lower()]
+    except KeyError:
+        msg = f"Unknown export format {path.suffix!r}, use one of {', '.join(SINKS)}"
+        raise ValueError(msg) from None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return sink(path, batch_size)
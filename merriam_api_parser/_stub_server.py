@@ -0,0 +1,192 @@
+"""Local stand-in for the Merriam-Webster API, for offline load testing.
+
+Run it with `python -m merriam_api_parser._stub_server` and point the parser
+at it with `--api-url` or the MERRIAM_WEBSTER_API_URL environment variable.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import random
+from collections import Counter
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from merriam_api_parser._synthetic import PayloadGenerator
+
+API_PATH: str = "/api/v3/references/collegiate/json/"
+
+_REASONS: dict[int, str] = {
+    200: "OK",
+    404: "Not Found",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+
+class StubServer:
+    """Serve fixture or generated payloads with injected latency and faults.
+
+    Words with a `<word>.json` file in `fixtures` get that file, other words
+    get a generated payload, or a list of suggestions when there is no
+    generator, just like the real API answers unknown words.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        fixtures: Path | None = None,
+        generator: PayloadGenerator | None = None,
+        *,
+        latency: float = 0.0,
+        latency_distribution: str = "fixed",
+        throttle_rate: float = 0.0,
+        error_rate: float = 0.0,
+        reset_rate: float = 0.0,
+        not_found_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        if latency_distribution not in ("fixed", "uniform", "exponential"):
+            msg = f"Unknown latency distribution: {latency_distribution}"
+            raise ValueError(msg)
+        self.fixtures: Path | None = fixtures
+        self.generator: PayloadGenerator | None = generator
+        self.latency: float = latency
+        self.latency_distribution: str = latency_distribution
+        self.throttle_rate: float = throttle_rate
+        self.error_rate: float = error_rate
+        self.reset_rate: float = reset_rate
+        self.not_found_rate: float = not_found_rate
+        self.retry_after: int = retry_after
+        self.requests: Counter[int] = Counter()
+        self.connections: int = 0
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening and return the API URL to use."""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}{API_PATH}"
+
+    async def close(self) -> None:
+        """Stop listening."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> str:
+        return await self.start()
+
+    async def __aexit__(self, *_args: object) -> None:
+        await self.close()
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Serve requests on one keep-alive connection."""
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readuntil(b"\r\n")
+                headers = {}
+                while (line := await reader.readuntil(b"\r\n")) != b"\r\n":
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                await asyncio.sleep(self._delay())
+                if self._random.random() < self.reset_rate:
+                    self.requests[0] += 1
+                    writer.transport.abort()
+                    return
+                target = request_line.decode("latin-1").split(" ")[1]
+                status, extra, body = self._respond(urlsplit(target).path)
+                self.requests[status] += 1
+                if "gzip" in headers.get("accept-encoding", ""):
+                    body = gzip.compress(body)
+                    extra["Content-Encoding"] = "gzip"
+                head = f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                extra["Content-Type"] = "application/json"
+                extra["Content-Length"] = str(len(body))
+                head += "".join(f"{name}: {value}\r\n" for name, value in extra.items())
+                writer.write(f"{head}\r\n".encode("latin-1") + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _delay(self) -> float:
+        """Draw a latency from the configured distribution."""
+        if self.latency_distribution == "uniform":
+            return self._random.uniform(0, 2 * self.latency)
+        if self.latency_distribution == "exponential" and self.latency:
+            return self._random.expovariate(1 / self.latency)
+        return self.latency
+
+    def _respond(self, path: str) -> tuple[int, dict[str, str], bytes]:
+        """Return the status, extra headers and body for a request path."""
+        if not path.startswith(API_PATH):
+            return 404, {}, b"[]"
+        roll = self._random.random()
+        if roll < self.throttle_rate:
+            return 429, {"Retry-After": str(self.retry_after)}, b"[]"
+        if roll < self.throttle_rate + self.error_rate:
+            return self._random.choice((500, 502, 503)), {}, b"[]"
+
+        word = unquote(path.removeprefix(API_PATH))
+        fixture = self.fixtures / f"{word}.json" if self.fixtures else None
+        if fixture is not None and fixture.is_file():
+            return 200, {}, fixture.read_bytes()
+        if self.generator is None or self._random.random() < self.not_found_rate:
+            suggestions = [f"{word}s", f"{word}er", f"un{word}"]
+            return 200, {}, json.dumps(suggestions).encode()
+        return 200, {}, json.dumps(self.generator.response(word)).encode()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run a stub server until interrupted."""
+    server = StubServer(
+        args.fixtures,
+        None if args.no_generate else PayloadGenerator(senses=args.senses),
+        latency=args.latency,
+        latency_distribution=args.latency_distribution,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        reset_rate=args.reset_rate,
+        not_found_rate=args.not_found_rate,
+    )
+    url = await server.start(args.host, args.port)
+    print(f"Serving {url}", flush=True)  # noqa: T201
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--fixtures", type=Path, help="directory of <word>.json")
+    parser.add_argument("--no-generate", action="store_true")
+    parser.add_argument("--senses", type=int, default=12)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument(
+        "--latency-distribution",
+        choices=("fixed", "uniform", "exponential"),
+        default="fixed",
+    )
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--reset-rate", type=float, default=0.0)
+    parser.add_argument("--not-found-rate", type=float, default=0.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(serve(parse_args()))
@@ -0,0 +1,118 @@
+"""Generate realistic Merriam-Webster collegiate payloads of any size."""
+import random
+from typing import Any
+
+_WORDS: tuple[str, ...] = (
+    "abide",
+    "brisk",
+    "candor",
+    "dwell",
+    "earnest",
+    "fathom",
+    "gleam",
+    "harbor",
+    "ideal",
+    "jostle",
+    "kindle",
+    "linger",
+    "mirth",
+    "notion",
+    "ornate",
+    "placid",
+    "quell",
+    "ravel",
+    "sturdy",
+    "tether",
+)
+_LINK_TOKENS: tuple[str, ...] = ("a_link", "d_link", "sx", "dxt", "mat", "et_link")
+
+
+class PayloadGenerator:
+    """Build API-shaped JSON with many senses, links and illustrations."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        senses: int = 12,
+        vis_per_sense: int = 3,
+        links_per_text: int = 3,
+        sdsense_every: int = 3,
+        homographs: int = 1,
+        seed: int | None = 0,
+    ) -> None:
+        self.senses: int = senses
+        self.vis_per_sense: int = vis_per_sense
+        self.links_per_text: int = links_per_text
+        self.sdsense_every: int = sdsense_every
+        self.homographs: int = homographs
+        self._random = random.Random(seed)
+
+    def response(self, word: str) -> list[dict[str, Any]]:
+        """Return a full response: one entry per homograph."""
+        return [self.entry(word, i + 1) for i in range(self.homographs)]
+
+    def entry(self, word: str, homograph: int = 1) -> dict[str, Any]:
+        """Return one entry."""
+        return {
+            "meta": {
+                "id": f"{word}:{homograph}" if self.homographs > 1 else word,
+                "stems": [word, f"{word}s", f"{word}ed", f"{word}ing"],
+                "offensive": False,
+            },
+            "hwi": {"hw": word},
+            "fl": self._random.choice(("noun", "verb", "adjective")),
+            "def": [{"sseq": self._sseq()}],
+            "shortdef": [f"short definition of {word}"],
+        }
+
+    def _sseq(self) -> list[list[list[Any]]]:
+        sseq: list[list[list[Any]]] = []
+        number = 1
+        while number <= self.senses:
+            group: list[list[Any]] = [["sense", self._sense(str(number))]]
+            number += 1
+            if number <= self.senses and number % 2 == 0:
+                group.append(
+                    ["pseq", [["sense", self._sense(f"{number - 1} a")]]],
+                )
+                number += 1
+            sseq.append(group)
+        return sseq
+
+    def _sense(self, sense_number: str) -> dict[str, Any]:
+        sense: dict[str, Any] = {"sn": sense_number, "dt": self._dt()}
+        if self.sdsense_every and self._random.randrange(self.sdsense_every) == 0:
+            sense["sdsense"] = {"sd": "also", "dt": self._dt()}
+        return sense
+
+    def _dt(self) -> list[list[Any]]:
+        return [
+            ["text", self._text()],
+            ["vis", [{"t": self._illustration()} for _ in range(self.vis_per_sense)]],
+        ]
+
+    def _text(self) -> str:
+        parts = ["{bc}"]
+        for _ in range(self.links_per_text):
+            word = self._random.choice(_WORDS)
+            token = self._random.choice(_LINK_TOKENS)
+            parts.append(f"to {self._link(token, word)} or")
+        parts.append(f"{{it}}{self._random.choice(_WORDS)}{{/it}} something")
+        return " ".join(parts)
+
+    def _link(self, tag: str, word: str) -> str:
+        if tag == "a_link":
+            return f"{{a_link|{word}}}"
+        if tag == "sx":
+            return f"{{sx|{word}||}}"
+        if tag == "dxt":
+            return f"{{dx}}see {{dxt|{word}||}}{{/dx}}"
+        return f"{{{tag}|{word}|{word}:1}}"
+
+    def _illustration(self) -> str:
+        word = self._random.choice(_WORDS)
+        return f"{{ldquo}}they {{wi}}{word}{{/wi}} every {{it}}day{{/it}}{{rdquo}}"
+
+
+def word_list(count: int) -> list[str]:
+    """Return count distinct made-up words."""
+    return [f"{_WORDS[i % len(_WORDS)]}{i}" for i in range(count)]
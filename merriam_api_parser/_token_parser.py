@@ -1,44 +1,170 @@
 """Format a string and return md-formatted text."""
+import html
 import re
-from typing import ClassVar
+import time
+from collections.abc import Iterable, Iterator
+from typing import ClassVar, NamedTuple
+
+from merriam_api_parser._metrics import METRICS
+
+TOKEN_PATTERN: re.Pattern[str] = re.compile(r"\{(/?)([a-z_]+)((?:\|[^{}|]*)*)\}")
+
+
+class Token(NamedTuple):
+    """A piece of Merriam-Webster running text.
+
+    `kind` is one of "text", "open", "close", "mark" or "link". Text tokens
+    carry their text in `value`, the others carry the token name in `value`
+    and, for links and other `|`-separated tokens, the fields in `fields`.
+    """
+
+    kind: str
+    value: str
+    fields: tuple[str, ...] = ()
+
+
+PAIRED_TOKENS: frozenset[str] = frozenset(
+    {
+        "b",
+        "inf",
+        "it",
+        "sc",
+        "sup",
+        "gloss",
+        "parahw",
+        "phrase",
+        "qword",
+        "wi",
+        "dx",
+        "dx_def",
+        "dx_ety",
+        "ma",
+    },
+)
+MARK_TOKENS: frozenset[str] = frozenset({"bc", "ldquo", "rdquo", "ds", "p_br"})
+LINK_TOKENS: frozenset[str] = frozenset(
+    {"a_link", "d_link", "i_link", "et_link", "mat", "sx", "dxt"},
+)
+
+
+def tokenize(text: str) -> Iterator[Token]:
+    """Split text into a stream of tokens in a single pass."""
+    position = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        start, end = match.span()
+        if start > position:
+            yield Token("text", text[position:start])
+        position = end
+        closing, name, raw_fields = match.groups()
+        fields = tuple(raw_fields[1:].split("|")) if raw_fields else ()
+        if name in PAIRED_TOKENS and not fields:
+            yield Token("close" if closing else "open", name)
+        elif name in MARK_TOKENS and not closing:
+            yield Token("mark", name, fields)
+        elif name in LINK_TOKENS and fields and not closing:
+            yield Token("link", name, fields)
+        else:
+            yield Token("text", match.group())
+    if position < len(text):
+        yield Token("text", text[position:])
 
 
 class TextTokenFormatter:
     """Format a string and return md-formatted text."""
 
     BASE_URL: str = "https://www.merriam-webster.com/dictionary/"
-    BOLD_COLON_PATTERN: str = r"{bc}"
-    WI_PATTERN: str = r"{wi}(\w+){/wi}"
-    WORD_PATTERN: str = r"(\w*\-*\ *\w*)"
-    URL_PATTERNS: ClassVar[list[str]] = [
-        r"{(a_link)\|" + WORD_PATTERN + r"}",
-        r"{(sx)\|" + WORD_PATTERN + r"\|" + WORD_PATTERN + r"\|}",
-        r"{(d_link)\|" + WORD_PATTERN + r"\|" + WORD_PATTERN + r"}",
-    ]
+    MARKUP: ClassVar[dict[str, tuple[str, str]]] = {
+        "b": ("**", "**"),
+        "inf": ("<sub>", "</sub>"),
+        "it": ("_", "_"),
+        "sc": ('<span style="font-variant: small-caps;">', "</span>"),
+        "sup": ("<sup>", "</sup>"),
+        "gloss": ("[", "]"),
+        "parahw": ("**", "**"),
+        "phrase": ("**_", "_**"),
+        "qword": ("_", "_"),
+        "wi": ("_", "_"),
+        "dx": (" — ", ""),
+        "dx_def": ("(", ")"),
+        "dx_ety": (" — ", ""),
+        "ma": (" — more at ", ""),
+    }
+    MARKS: ClassVar[dict[str, str]] = {
+        "bc": ": ",
+        "ldquo": "“",
+        "rdquo": "”",
+        "ds": "",
+        "p_br": "\n\n",
+    }
 
     def __init__(self) -> None:
         self.text: str = ""
 
     def parse_token(self, text: str) -> str:
-        self.text = text
-        self._parse_colon()
-        self._parse_url()
-        self._parse_wi()
+        """Replace every formatting and link token in text with markdown."""
+        start = time.perf_counter()
+        self.text = self.render(tokenize(text))
+        METRICS.observe("tokens", time.perf_counter() - start)
         return self.text
 
-    def _parse_colon(self) -> None:
-        self.text = re.sub(self.BOLD_COLON_PATTERN, ": ", self.text)
+    def render(self, tokens: Iterable[Token]) -> str:
+        """Render a token stream to markdown."""
+        parts: list[str] = []
+        for kind, value, fields in tokens:
+            if kind == "text":
+                parts.append(value)
+            elif kind == "open":
+                parts.append(self.MARKUP[value][0])
+            elif kind == "close":
+                parts.append(self.MARKUP[value][1])
+            elif kind == "mark":
+                parts.append(self.MARKS[value])
+            else:
+                parts.append(self._link(fields))
+        return "".join(parts)
 
-    def _parse_wi(self) -> None:
-        self.text = re.sub(self.WI_PATTERN, r"_\1_", self.text)
+    def _link(self, fields: tuple[str, ...]) -> str:
+        """Render a cross-reference as a link to the online dictionary."""
+        word = next((field for field in fields[:2] if field), "")
+        word = word.partition(":")[0]
+        if not word:
+            return ""
+        return self._anchor(word, f"{self.BASE_URL}{word.replace(' ', '-')}")
 
-    def _parse_url(self) -> None:
-        for pattern in self.URL_PATTERNS:
-            matches = re.findall(pattern, self.text)
-            for match in matches:
-                _tag, word = match[0], match[1] or match[2]
-                md_format = f"[{word}]({self.BASE_URL}{word.replace(' ', '-')})"
-                self.text = re.sub(pattern, md_format, self.text)
+    def _anchor(self, word: str, url: str) -> str:
+        """Return a link to url reading word."""
+        return f"[{word}]({url})"
 
     def __repr__(self) -> str:
         return f"TextTokenFormatter(text='{self.text}')"
+
+
+class HtmlTokenFormatter(TextTokenFormatter):
+    """Format a string and return HTML, e.g. for Anki cards."""
+
+    MARKUP: ClassVar[dict[str, tuple[str, str]]] = {
+        **TextTokenFormatter.MARKUP,
+        "b": ("<b>", "</b>"),
+        "it": ("<i>", "</i>"),
+        "parahw": ("<b>", "</b>"),
+        "phrase": ("<b><i>", "</i></b>"),
+        "qword": ("<i>", "</i>"),
+        "wi": ("<i>", "</i>"),
+    }
+    MARKS: ClassVar[dict[str, str]] = {
+        **TextTokenFormatter.MARKS,
+        "p_br": "<br><br>",
+    }
+
+    def render(self, tokens: Iterable[Token]) -> str:
+        """Render a token stream to HTML, escaping the text."""
+        return super().render(
+            Token("text", html.escape(token.value, quote=False))
+            if token.kind == "text"
+            else token
+            for token in tokens
+        )
+
+    def _anchor(self, word: str, url: str) -> str:
+        """Return a link to url reading word."""
+        return f'<a href="{html.escape(url)}">{html.escape(word, quote=False)}</a>'
@@ -1,15 +1,58 @@
-"""Utility functions."""
+"""Utility functions.
+
+Modules only some runs need, such as bulk re-rendering, export sinks, the
+daemon, the shared rate limit and the batch pipeline, are imported where
+they are used, so a single-word lookup starts quickly.
+"""
+import argparse
 import asyncio
-import json
+import itertools
 import logging
 import os
+from collections.abc import AsyncIterator, Sequence
+from logging.handlers import QueueListener
 from pathlib import Path
-from typing import Any
-
-import requests
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import quote
 
-from merriam_api_parser._io import MdFormatter, Reader, Writer
+from merriam_api_parser._cache import ResponseCache, normalize_word
+from merriam_api_parser._coalesce import Coalescer, StemMap, entry_stems
+from merriam_api_parser._decode import first_entry
+from merriam_api_parser._http import (
+    AsyncHTTPTransport,
+    HTTPError,
+    Response,
+    Transport,
+)
+from merriam_api_parser._io import Reader, Writer, aiter_words
+from merriam_api_parser._journal import JobJournal, QuotaExhaustedError, QuotaLedger
 from merriam_api_parser._json_parser import JsonParser
+from merriam_api_parser._logging import JsonFormatter, start_logging
+from merriam_api_parser._metrics import METRICS, show_progress
+from merriam_api_parser._retry import (
+    CircuitBreaker,
+    Deadline,
+    DeadlineExceededError,
+    Retrier,
+    RetryPolicy,
+)
+from merriam_api_parser._scheduler import AdaptiveScheduler
+
+if TYPE_CHECKING:
+    from merriam_api_parser._pipeline import Pipeline, PipelineStats
+
+# Jobs written to the journal per transaction while it is filled.
+_JOURNAL_BATCH: int = 1024
+# Errors rendering a response: the word has no entry, retrying will not help.
+_NO_ENTRY = (ValueError, TypeError, KeyError, IndexError, AttributeError)
+
+
+class Lookup(NamedTuple):
+    """The raw response and rendered note of one word."""
+
+    word: str
+    body: str | None
+    markdown: str
 
 
 class MerriamWebsterAPI:
@@ -17,48 +60,392 @@ class MerriamWebsterAPI:
 
     API_URL: str = "https://www.dictionaryapi.com/api/v3/references/collegiate/json/"
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        api_key: str,
+        cache: ResponseCache | None = None,
+        *,
+        offline: bool = False,
+        transport: Transport | None = None,
+        scheduler: AdaptiveScheduler | None = None,
+        api_url: str | None = None,
+        retrier: Retrier | None = None,
+        quota: QuotaLedger | None = None,
+    ) -> None:
         self.api_key: str = api_key
+        self.api_url: str = (api_url or self.API_URL).rstrip("/") + "/"
+        self.cache: ResponseCache | None = cache
+        self.offline: bool = offline
+        self.transport: Transport = transport or AsyncHTTPTransport()
+        self.scheduler: AdaptiveScheduler | None = scheduler
+        self.retrier: Retrier = retrier or Retrier()
+        self.quota: QuotaLedger | None = quota
+        self.coalescer: Coalescer[str | None] = Coalescer()
+        self.stems: StemMap = StemMap()
 
-    def parse_response(self, word: str) -> str:
+    async def parse_response(self, word: str) -> str:
         """Parse response to md-formatted text."""
-        url: str = f"{self.API_URL}/{word}?key={self.api_key}"
+        body = await self.fetch(word)
+        return "" if body is None else self.render(body)
+
+    async def fetch(self, word: str) -> str | None:
+        """Return the raw JSON body for a word, from the cache when possible.
+
+        Inflected forms of headwords fetched earlier reuse those responses,
+        and concurrent fetches of the same word share one API request.
+        """
+        with METRICS.time("fetch"):
+            return await self._fetch(word)
+
+    async def _fetch(self, word: str) -> str | None:
+        body = None
+        if self.cache is not None:
+            body = self.cache.get(word, allow_expired=self.offline)
+            METRICS.count("cache_hits" if body is not None else "cache_misses")
+            if body is None and (
+                resolved := self.cache.resolve(word, allow_expired=self.offline)
+            ):
+                logging.info("Resolved %s to %s", word, resolved[0])
+                METRICS.count("stem_hits")
+                body = resolved[1]
+        if body is None and (body := self.stems.get(word)) is not None:
+            METRICS.count("stem_hits")
+        if body is None:
+            if self.offline:
+                logging.warning("No cached response for %s in offline mode", word)
+                METRICS.count("api_failures")
+                return None
+            body = await self.coalescer.run(
+                normalize_word(word),
+                lambda: self._request_and_store(word),
+            )
+        return body
+
+    async def _request_and_store(self, word: str) -> str | None:
+        """Request a word and remember the response for later lookups."""
+        body = await self._request(word)
+        if body is not None:
+            stems = entry_stems(body)
+            if self.cache is not None:
+                self.cache.set(word, body)
+                self.cache.index_stems(word, stems)
+            else:
+                self.stems.add(word, body, stems)
+        return body
+
+    def render(self, body: str | bytes) -> str:
+        """Render the first entry of a raw JSON body to md-formatted text."""
+        with METRICS.time("decode"):
+            entry = first_entry(body)
+        return JsonParser(entry).get_md_text()
+
+    async def _request(self, word: str) -> str | None:
+        """Request the raw JSON body for a word from the API."""
+        url: str = f"{self.api_url}{quote(word)}?key={self.api_key}"
         try:
-            response: requests.Response = requests.get(url, timeout=3000)
-            response.raise_for_status()
-        except requests.exceptions.HTTPError:
-            response = requests.get(url, timeout=3000)
-        except requests.exceptions.RequestException:
+            response = await self.retrier.call(
+                lambda timeout, connect_timeout: self._get(
+                    url,
+                    timeout,
+                    connect_timeout,
+                ),
+            )
+        except DeadlineExceededError:
+            logging.info("Deadline exceeded, skipping %s", word)
+            METRICS.count("api_failures")
+            return None
+        except HTTPError:
             logging.exception("Failed to get response for %s:", word)
-            return ""
+            METRICS.count("api_failures")
+            return None
+        if not response.ok:
+            logging.error("Failed to get response for %s: %s", word, response.status)
+            METRICS.count("api_failures")
+            return None
+        return response.text
+
+    async def _get(self, url: str, timeout: float, connect_timeout: float) -> Response:
+        """Send one request, paced by the scheduler if there is one.
 
-        json_res: list[dict[str, Any]] = json.loads(response.text)
-        return JsonParser(
-            json_res[0],
-        ).get_md_text()  # TODO: json_res[0] maybe more specific
+        Every request counts against the daily quota, retries included.
+        """
+        if self.quota is not None:
+            self.quota.spend()
+        if self.scheduler is None:
+            return await self.transport.get(url, timeout, connect_timeout)
+        async with self.scheduler.slot() as slot:
+            response = await self.transport.get(url, timeout, connect_timeout)
+            slot.status = response.status
+            return response
 
     async def process_word(self, word: str) -> tuple[str, str]:
         """Process a single word and return the response."""
+        lookup = await self.lookup(word)
+        return lookup.word, lookup.markdown
+
+    async def lookup(self, word: str) -> Lookup:
+        """Fetch and render a word, keeping the raw body next to the markdown."""
+        body = None
         try:
-            logging.info("Getting response for %s", word)
-            response = await asyncio.to_thread(self.parse_response, word)
-            logging.info("Got response for %s", word)
+            logging.info("Getting response for %s", word, extra={"word": word})
+            body = await self.fetch(word)
+            response = "" if body is None else self.render(body)
+            logging.info("Got response for %s", word, extra={"word": word})
         except Exception as error:
             msg: str = f"Failed to get response for {word}: {error}"
             logging.exception(msg)
             response = ""
-        return word, response
+        return Lookup(word, body, response)
 
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self.transport.aclose()
 
-def init_api() -> MerriamWebsterAPI:
+
+def init_api(  # noqa: PLR0913
+    cache: ResponseCache | None = None,
+    *,
+    offline: bool = False,
+    scheduler: AdaptiveScheduler | None = None,
+    api_url: str | None = None,
+    retrier: Retrier | None = None,
+    quota: QuotaLedger | None = None,
+) -> MerriamWebsterAPI:
     """Initialize MerriamWebsterAPI object."""
     key_name: str = "MERRIAM_WEBSTER_DICTIONARY_KEY"
     dict_key: str | None = os.getenv(key_name)
     if dict_key is None:
-        msg: str = f"Please set environment variable {key_name} first"
-        raise ValueError(msg)
+        if not offline:
+            msg: str = f"Please set environment variable {key_name} first"
+            raise ValueError(msg)
+        dict_key = ""
 
-    return MerriamWebsterAPI(dict_key)
+    return MerriamWebsterAPI(
+        dict_key,
+        cache,
+        offline=offline,
+        scheduler=scheduler,
+        api_url=api_url or os.getenv("MERRIAM_WEBSTER_API_URL"),
+        retrier=retrier,
+        quota=quota,
+    )
+
+
+def parse_args(argv: Sequence[str] = ()) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Look up words in the Merriam-Webster Collegiate Dictionary.",
+    )
+    parser.add_argument(
+        "target",
+        nargs="?",
+        help="word to look up, or a path of notes ('-d' for data/md/);"
+        " asked for when missing",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="render from cached responses only, never call the API",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=ResponseCache.DEFAULT_PATH,
+        help="path of the response cache database",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not read or write the response cache",
+    )
+    parser.add_argument(
+        "--api-url",
+        help="API base URL, e.g. a local stub server"
+        " (default: $MERRIAM_WEBSTER_API_URL or the real API)",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=10.0,
+        help="maximum API requests per second",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=32,
+        help="upper bound of in-flight API requests",
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=5.0,
+        help="seconds to wait for a connection",
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=30.0,
+        help="seconds to wait for a response once connected",
+    )
+    parser.add_argument(
+        "--attempts",
+        type=int,
+        default=4,
+        help="tries per word on errors, 429 and 5xx, with exponential backoff",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="stop calling the API once the run took this long",
+    )
+    parser.add_argument(
+        "--words",
+        type=Path,
+        metavar="FILE",
+        help="look up every word of a newline-delimited list, '-' for stdin,"
+        " optionally .gz/.bz2/.xz compressed, and write the notes to --out",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip words of --words that already have a note in --out",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        metavar="FILE",
+        help="record the state of every word in this SQLite journal and look"
+        " up the pending ones, newest notes or first words first; rerun with"
+        " the same journal to resume",
+    )
+    parser.add_argument(
+        "--worker",
+        action="store_true",
+        help="look up the words queued in --journal by other runs; start any"
+        " number of workers on this host, and they share the journal's queue"
+        " and --rate",
+    )
+    parser.add_argument(
+        "--lease",
+        type=float,
+        default=300.0,
+        metavar="SECONDS",
+        help="time a worker has for a word before others may take it over",
+    )
+    parser.add_argument(
+        "--daily-quota",
+        type=int,
+        metavar="CALLS",
+        help="stop once this many API calls were made today (UTC), counted"
+        " across runs",
+    )
+    parser.add_argument(
+        "--quota-db",
+        type=Path,
+        default=QuotaLedger.DEFAULT_PATH,
+        help="path of the database counting API calls per day",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="keep running and serve lookups to merriam_api_parser._client,"
+        " with connections and recent notes kept warm",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix socket of --serve (default: data/lookup.sock)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="serve HTTP on this localhost port instead of the Unix socket",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        metavar="GLOB",
+        help="notes of a directory to look up, repeatable (default: *.md)",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        metavar="GLOB",
+        help="files and folders of a directory to skip, repeatable (default: .*)",
+    )
+    parser.add_argument(
+        "--render-from",
+        type=Path,
+        metavar="SOURCE",
+        help="re-render raw JSON from a directory, zip/tar archive or response"
+        " cache to markdown without calling the API",
+    )
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=Path("data/md/"),
+        help="output directory of --render-from and --words",
+    )
+    parser.add_argument(
+        "--export",
+        type=Path,
+        metavar="FILE",
+        help="write --render-from output to one file instead of notes, as JSONL,"
+        " SQLite or Anki CSV by suffix (.jsonl, .sqlite3, .db, .csv)",
+    )
+    parser.add_argument("--workers", type=int, help="processes of --render-from")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=64,
+        help="responses sent to a worker at a time",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="collect --render-from chunks as they finish",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only fetch notes that are empty, stale or from an older renderer",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=30.0,
+        help="days after which --incremental refetches a note",
+    )
+    parser.add_argument(
+        "--stats",
+        type=Path,
+        metavar="FILE",
+        help="write stage timings and counters at the end of the run,"
+        " as JSON for a .json file, else in the Prometheus text format",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+        default="INFO",
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="log one JSON object per line",
+    )
+    parser.add_argument(
+        "--log-rate",
+        type=float,
+        default=10.0,
+        help="per-word info lines per second, 0 for no limit",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="show a live progress line on stderr",
+    )
+    return parser.parse_args(argv)
 
 
 def get_user_input() -> str:
@@ -82,39 +469,456 @@ def get_path(user_input: str) -> Path:
     return Path("data/md/") if user_input == "-d" else Path(user_input)
 
 
-async def main() -> None:
+async def main(argv: Sequence[str] = ()) -> None:
     """Run."""
-    configure_logging()
-    request_response: MerriamWebsterAPI = init_api()
-    user_input = process_user_input(get_user_input())
+    args = parse_args(argv)
+    listener = configure_logging(
+        args.log_level,
+        json_format=args.log_json,
+        rate=args.log_rate,
+    )
+    try:
+        await run(args)
+    finally:
+        listener.stop()
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run with parsed command line arguments."""
+    if args.render_from is not None:
+        render_from(args)
+        return
+    _check_args(args)
+    user_input = (
+        None
+        if args.words is not None or args.worker or args.serve
+        else process_user_input(args.target or get_user_input())
+    )
+    if isinstance(user_input, str):
+        await lookup_word(user_input, args)
+        return
+    cache = None if args.no_cache else ResponseCache(args.cache)
+    bucket = None
+    if args.journal is not None:
+        from merriam_api_parser._shared import SharedTokenBucket
+
+        bucket = SharedTokenBucket(args.journal, args.rate)
+    scheduler = AdaptiveScheduler(
+        args.rate,
+        max_concurrency=args.max_concurrency,
+        bucket=bucket,
+    )
+    quota = None if args.offline else QuotaLedger(args.quota_db, args.daily_quota)
+    request_response: MerriamWebsterAPI = init_api(
+        cache,
+        offline=args.offline,
+        scheduler=scheduler,
+        api_url=args.api_url,
+        retrier=_retrier(args),
+        quota=quota,
+    )
+    progress = asyncio.create_task(show_progress(METRICS)) if args.progress else None
+    try:
+        await process_input(request_response, user_input, args)
+    finally:
+        if progress is not None:
+            progress.cancel()
+            await asyncio.gather(progress, return_exceptions=True)
+        await request_response.aclose()
+        logging.info("Scheduler: %s", scheduler.stats())
+        logging.info(
+            "Deduplicated: %d coalesced, %d from stems",
+            request_response.coalescer.coalesced,
+            request_response.stems.hits + (cache.stem_hits if cache is not None else 0),
+        )
+        if cache is not None:
+            logging.info("Response cache: %s", cache.stats())
+            cache.close()
+        if quota is not None:
+            logging.info("API calls today: %d", quota.spent())
+            quota.close()
+        if bucket is not None:
+            bucket.close()
+    if args.stats is not None:
+        METRICS.export(args.stats)
+
+
+def _check_args(args: argparse.Namespace) -> None:
+    if args.no_cache and args.offline:
+        msg = "--offline needs the response cache"
+        raise ValueError(msg)
+    if args.worker and args.journal is None:
+        msg = "--worker needs --journal"
+        raise ValueError(msg)
+
+
+async def lookup_word(word: str, args: argparse.Namespace) -> None:
+    """Write the note of one word to data/md/, the fast path of a lookup.
+
+    One request needs no pacing, so there is no scheduler, progress or run
+    summary, only the cache and the quota ledger.
+    """
+    cache = None if args.no_cache else ResponseCache(args.cache)
+    quota = None if args.offline else QuotaLedger(args.quota_db, args.daily_quota)
+    api = init_api(
+        cache,
+        offline=args.offline,
+        api_url=args.api_url,
+        retrier=_retrier(args),
+        quota=quota,
+    )
+    try:
+        await process_input(api, word, args)
+    finally:
+        await api.aclose()
+        if cache is not None:
+            cache.close()
+        if quota is not None:
+            quota.close()
+    if args.stats is not None:
+        METRICS.export(args.stats)
+
+
+def _retrier(args: argparse.Namespace) -> Retrier:
+    return Retrier(
+        RetryPolicy(
+            attempts=args.attempts,
+            connect_timeout=args.connect_timeout,
+            read_timeout=args.read_timeout,
+        ),
+        CircuitBreaker(),
+        Deadline(args.deadline),
+    )
 
-    if isinstance(user_input, Path):  # TODO: increase coverage
+
+def render_from(args: argparse.Namespace) -> None:
+    """Re-render stored responses without calling the API."""
+    from merriam_api_parser._bulk import render_corpus
+    from merriam_api_parser._sinks import open_sink
+
+    sink = open_sink(args.export) if args.export is not None else None
+    try:
+        report = render_corpus(
+            args.render_from,
+            args.out,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            ordered=not args.unordered,
+            sink=sink,
+        )
+    finally:
+        if sink is not None:
+            sink.close()
+    logging.info("Rendered %s", report)
+    if args.stats is not None:
+        METRICS.export(args.stats)
+
+
+async def process_input(
+    api: MerriamWebsterAPI,
+    user_input: str | Path | None,
+    args: argparse.Namespace,
+) -> None:
+    """Write the notes of a word list, a directory or a single word."""
+    journal = (
+        JobJournal(args.journal, lease=args.lease) if args.journal is not None else None
+    )
+    try:
+        await _process_input(api, user_input, args, journal)
+    finally:
+        if journal is not None:
+            if released := journal.release():
+                logging.info("Released %d unfinished jobs", released)
+            logging.info("Journal: %s", journal.counts())
+            journal.close()
+
+
+async def _process_input(
+    api: MerriamWebsterAPI,
+    user_input: str | Path | None,
+    args: argparse.Namespace,
+    journal: JobJournal | None,
+) -> None:
+    if args.serve:
+        from merriam_api_parser._daemon import serve
+
+        await serve(api, args.socket, args.port)
+
+    elif journal is not None and args.worker:
+        await process_journal(api, journal, fetchers=args.max_concurrency)
+
+    elif user_input is None:
+        await process_word_list(
+            api,
+            args.words,
+            args.out,
+            resume=args.resume,
+            fetchers=args.max_concurrency,
+            journal=journal,
+        )
+
+    elif isinstance(user_input, Path):  # TODO: increase coverage
         path = user_input
-        tasks = [
-            request_response.process_word(word) for word in Reader(path).get_md_names()
-        ]
-        for word, response in await asyncio.gather(*tasks):
-            Writer(path / f"{word}.md").write(response)
+        await process_directory(
+            api,
+            path,
+            incremental=args.incremental,
+            max_age=args.max_age * 24 * 3600,
+            fetchers=args.max_concurrency,
+            reader=Reader(
+                path,
+                include=args.include or ("*.md",),
+                exclude=args.exclude or (".*",),
+            ),
+            journal=journal,
+        )
 
     elif isinstance(user_input, str):
         path = Path("data/md/")
-        word, response = await request_response.process_word(user_input)
-        Writer(path / f"{word}.md").write(response)
+        word, response = await api.process_word(user_input)
+        path.mkdir(parents=True, exist_ok=True)
+        Writer(path / f"{word}.md", normalize=True).write(response)
 
     else:
         msg = "Invalid user input"
         raise TypeError(msg)
 
-    MdFormatter(path).md_format()
 
+async def process_directory(  # noqa: PLR0913
+    api: MerriamWebsterAPI,
+    path: Path,
+    *,
+    incremental: bool = False,
+    max_age: float = 30 * 24 * 3600,
+    fetchers: int = 16,
+    reader: Reader | None = None,
+    journal: JobJournal | None = None,
+) -> "PipelineStats":
+    """Fetch and write a note for every word in a vault as responses arrive.
+
+    Fetching starts while the vault is still being scanned, and every note
+    is rewritten in place, next to where it was found. With a `journal` the
+    whole vault is queued first and the most recently modified notes are
+    looked up first.
+    """
+    from merriam_api_parser._manifest import Manifest
+    from merriam_api_parser._pipeline import Pipeline
+
+    reader = reader or Reader(path)
+    manifest = Manifest(path) if incremental and path.is_dir() else None
+    found = 0
+
+    def due(note: Path) -> bool:
+        nonlocal found
+        found += 1
+        return manifest is None or manifest.is_due(note, max_age)
+
+    pipeline = Pipeline(
+        api,
+        fetchers=fetchers,
+        on_write=manifest.record if manifest is not None else None,
+    )
+    feed = reader.anotes(keep=due)
+    if journal is not None:
+        feed = _journaled(
+            pipeline,
+            journal,
+            ((word, note, _modified(note)) async for word, note in feed),
+        )
+    try:
+        stats = await pipeline.run(_within_budget(feed, api))
+    finally:
+        if manifest is not None:
+            manifest.save()
+        if journal is not None:
+            journal.release()
+    skipped = found - stats.fetched - stats.failed
+    logging.info(
+        "Wrote %d notes, %d unchanged, %d failed, %d skipped",
+        stats.written,
+        stats.unchanged,
+        stats.failed,
+        skipped,
+    )
+    return stats
+
+
+async def process_word_list(  # noqa: PLR0913
+    api: MerriamWebsterAPI,
+    source: Path,
+    out_dir: Path,
+    *,
+    resume: bool = False,
+    fetchers: int = 16,
+    journal: JobJournal | None = None,
+) -> "PipelineStats":
+    """Write a note to out_dir for every word of a word list.
+
+    Words are read lazily and flow through the bounded pipeline, so memory
+    stays flat however long the list is. With `resume` words that already
+    have a non-empty note are skipped, so an interrupted run can be
+    restarted. With a `journal` the whole list is queued first and looked up
+    in list order.
+    """
+    from merriam_api_parser._pipeline import Pipeline
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    async def notes() -> AsyncIterator[tuple[str, Path]]:
+        async for word in aiter_words(source):
+            note = out_dir / f"{word}.md"
+            if note.parent != out_dir:
+                logging.warning("Skipping %s, not a valid note name", word)
+            elif not resume or not _has_content(note):
+                yield word, note
+
+    pipeline = Pipeline(api, fetchers=fetchers)
+    feed = notes()
+    line = itertools.count()
+    if journal is not None:
+        feed = _journaled(
+            pipeline,
+            journal,
+            ((word, note, -next(line)) async for word, note in feed),
+        )
+    try:
+        stats = await pipeline.run(_within_budget(feed, api))
+    finally:
+        if journal is not None:
+            journal.release()
+    logging.info(
+        "Wrote %d notes, %d unchanged, %d failed",
+        stats.written,
+        stats.unchanged,
+        stats.failed,
+    )
+    return stats
+
+
+async def _journaled(
+    pipeline: "Pipeline",
+    journal: JobJournal,
+    jobs: AsyncIterator[tuple[str, Path, float]],
+) -> AsyncIterator[tuple[str, Path]]:
+    """Queue all jobs in the journal, then work through it in order."""
+    batch: list[tuple[str, Path, float]] = []
+    added = 0
+    async for job in jobs:
+        batch.append(job)
+        if len(batch) == _JOURNAL_BATCH:
+            added += journal.add(batch)
+            batch.clear()
+    added += journal.add(batch)
+    logging.info("Journal: %d new jobs, %s", added, journal.counts())
+    async for note in _claimed(pipeline, journal):
+        yield note
+
+
+async def _claimed(
+    pipeline: "Pipeline",
+    journal: JobJournal,
+) -> AsyncIterator[tuple[str, Path]]:
+    """Yield jobs leased from the journal a few at a time until none is left.
+
+    The pipeline's outcomes are recorded in the journal: words that ran into
+    the daily quota are deferred to the next run, and only words without an
+    entry fail for good. Words whose lookup failed otherwise, e.g. past the
+    deadline, with the circuit open or on a network error, stay leased
+    until the run releases them back to the queue.
+    """
+
+    def failed(_word: str, note: Path, error: Exception | None) -> None:
+        if isinstance(error, QuotaExhaustedError):
+            journal.mark(note, "deferred")
+        elif isinstance(error, _NO_ENTRY):
+            journal.mark(note, "failed")
+
+    pipeline.on_done = lambda _word, note: journal.mark(note, "done")
+    pipeline.on_fail = failed
+    while jobs := journal.claim(pipeline.fetchers):
+        for job in jobs:
+            yield job
+
+
+async def process_journal(
+    api: MerriamWebsterAPI,
+    journal: JobJournal,
+    *,
+    fetchers: int = 16,
+) -> "PipelineStats":
+    """Work as one of several workers through the jobs of a shared journal.
+
+    Jobs are leased a few at a time, so workers share the queue evenly, and
+    the jobs of a worker that died are taken over once their lease expires.
+    """
+    from merriam_api_parser._pipeline import Pipeline
+
+    pipeline = Pipeline(api, fetchers=fetchers)
+    try:
+        stats = await pipeline.run(
+            _within_budget(_claimed(pipeline, journal), api),
+        )
+    finally:
+        journal.release()
+    logging.info(
+        "Worker %s wrote %d notes, %d unchanged, %d failed",
+        journal.owner,
+        stats.written,
+        stats.unchanged,
+        stats.failed,
+    )
+    return stats
+
+
+async def _within_budget(
+    notes: AsyncIterator[tuple[str, Path]],
+    api: MerriamWebsterAPI,
+) -> AsyncIterator[tuple[str, Path]]:
+    """Stop yielding notes once the daily quota or the run's deadline is used up."""
+    async for note in notes:
+        if api.quota is not None and api.quota.remaining() <= 0:
+            logging.info("Daily quota used up, stopping")
+            return
+        if not api.retrier.deadline.remaining():
+            logging.info("Deadline exceeded, stopping")
+            return
+        yield note
+
+
+def _modified(note: Path) -> float:
+    try:
+        return note.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _has_content(note: Path) -> bool:
+    try:
+        return note.stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def configure_logging(
+    level: int | str = logging.INFO,
+    *,
+    json_format: bool = False,
+    rate: float | None = None,
+) -> QueueListener:
+    """Configure logging for the application.
 
-def configure_logging() -> None:
-    """Configure logging for the application."""
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s %(levelname)s %(message)s",
-        handlers=[
-            logging.FileHandler("api_parser.log", mode="a"),
-            logging.StreamHandler(),
-        ],
+    Records are written by a background thread, so logging never blocks the
+    event loop. Stop the returned listener to flush it.
+    """
+    formatter = (
+        JsonFormatter()
+        if json_format
+        else logging.Formatter("%(asctime)s %(levelname)s %(message)s")
     )
+    handlers: list[logging.Handler] = [
+        logging.FileHandler("api_parser.log", mode="a"),
+        logging.StreamHandler(),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return start_logging(handlers, level, rate)
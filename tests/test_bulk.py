@@ -0,0 +1,96 @@
+import json
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from merriam_api_parser._bulk import BulkReport, iter_responses, render_corpus
+from merriam_api_parser._cache import ResponseCache
+from merriam_api_parser._io import MdFormatter
+from merriam_api_parser._json_parser import JsonParser
+from merriam_api_parser._metrics import METRICS
+from merriam_api_parser._sinks import JsonlSink
+
+
+@pytest.fixture()
+def json_body() -> str:
+    return Path("tests/test_data.json").read_text(encoding="utf-8")
+
+
+@pytest.fixture()
+def corpus(tmp_path, json_body) -> Path:
+    source = tmp_path / "json"
+    source.mkdir()
+    for word in ("alpha", "beta", "gamma"):
+        (source / f"{word}.json").write_text(f"[{json_body}]", encoding="utf-8")
+    (source / "broken.json").write_text('["suggestion"]', encoding="utf-8")
+    return source
+
+
+def test_iter_responses_archive_and_cache(tmp_path, corpus):
+    archive = tmp_path / "json.zip"
+    with zipfile.ZipFile(archive, "w") as file:
+        for path in corpus.iterdir():
+            file.write(path, path.name)
+    cache = ResponseCache(tmp_path / "cache.sqlite3")
+    for word, body in iter_responses(corpus):
+        cache.set(word, body)
+    cache.close()
+
+    expected = sorted(iter_responses(corpus))
+    assert sorted(iter_responses(archive)) == expected
+    assert sorted(iter_responses(tmp_path / "cache.sqlite3")) == expected
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_render_corpus(tmp_path, corpus, json_body, ordered):
+    out_dir = tmp_path / "md"
+    report = render_corpus(corpus, out_dir, workers=2, chunk_size=1, ordered=ordered)
+
+    assert (report.entries, report.written, report.failed) == (4, 3, 1)
+    expected = MdFormatter.normalize(JsonParser(json.loads(json_body)).get_md_text())
+    assert (out_dir / "beta.md").read_text(encoding="utf-8") == expected
+    assert "entries/s" in str(report)
+
+
+def test_render_corpus_keeps_unchanged_notes(tmp_path, corpus):
+    out_dir = tmp_path / "md"
+    render_corpus(corpus, out_dir, workers=1)
+    note = out_dir / "beta.md"
+    os.utime(note, (0, 0))
+
+    report = render_corpus(corpus, out_dir, workers=1)
+
+    assert note.stat().st_mtime == 0
+    assert (report.written, report.unchanged, report.failed) == (0, 3, 1)
+    assert "3 unchanged" in str(report)
+
+
+def test_render_corpus_collects_worker_metrics(tmp_path, corpus):
+    METRICS.reset()
+    render_corpus(corpus, tmp_path / "md", workers=2)
+
+    assert METRICS.histograms["parse"].count == 3  # noqa: PLR2004
+    assert METRICS.counters["notes_written"] == 3  # noqa: PLR2004
+
+
+def test_render_corpus_with_executor(tmp_path, corpus):
+    with ThreadPoolExecutor(1) as executor:
+        report = render_corpus(corpus, tmp_path / "md", executor=executor)
+    assert report.written == 3  # noqa: PLR2004
+
+
+def test_render_corpus_to_sink(tmp_path, corpus):
+    with ThreadPoolExecutor(1) as executor, JsonlSink(tmp_path / "out.jsonl") as sink:
+        report = render_corpus(corpus, tmp_path / "md", executor=executor, sink=sink)
+
+    assert (report.written, report.failed) == (3, 1)
+    assert sink.rows == 3  # noqa: PLR2004
+    assert not (tmp_path / "md").exists()
+
+
+def test_bulk_report():
+    assert BulkReport().entries_per_second == 0
+    assert BulkReport(entries=10, seconds=2).entries_per_second == 5  # noqa: PLR2004
@@ -0,0 +1,93 @@
+import sqlite3
+
+import pytest
+
+from merriam_api_parser._cache import ResponseCache, normalize_word
+
+
+@pytest.fixture()
+def cache() -> ResponseCache:
+    cache = ResponseCache(":memory:", max_entries=2)
+    yield cache
+    cache.close()
+
+
+def test_normalize_word():
+    assert normalize_word("  Ice  Cream ") == "ice cream"
+
+
+def test_cache_hit_and_miss(cache):
+    assert cache.get("word") is None
+    cache.set("Word", "[]")
+    assert cache.get("word ") == "[]"
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+def test_cache_ttl(cache):
+    cache.set("word", "[]", ttl=-1)
+    assert cache.get("word") is None
+    assert cache.get("word", allow_expired=True) == "[]"
+
+
+def test_cache_lru_eviction(cache, mocker):
+    clock = mocker.patch("merriam_api_parser._cache.time.time")
+    clock.return_value = 1.0
+    cache.set("a", "1")
+    clock.return_value = 2.0
+    cache.set("b", "2")
+    clock.return_value = 3.0
+    assert cache.get("a") == "1"
+    clock.return_value = 4.0
+    cache.set("c", "3")
+    assert len(cache) == cache.max_entries
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+
+def test_cache_batches_access_times(tmp_path, mocker):
+    clock = mocker.patch("merriam_api_parser._cache.time.time", return_value=1.0)
+    path = tmp_path / "cache.sqlite3"
+    cache = ResponseCache(path)
+    cache.set("a", "1")
+    clock.return_value = 2.0
+    assert cache.get("a") == "1"
+
+    reader = sqlite3.connect(path)
+    query = "SELECT accessed_at FROM responses"
+    assert reader.execute(query).fetchone() == (1.0,)
+    cache.close()
+    assert reader.execute(query).fetchone() == (2.0,)
+    reader.close()
+
+
+def test_cache_counts_entries(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_entries=2)
+    for word in ("a", "a", "b"):
+        cache.set(word, "1")
+    cache.close()
+
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_entries=2)
+    cache.set("c", "1")
+    assert len(cache) == cache.max_entries
+    cache.close()
+
+
+def test_cache_resolves_stems(cache):
+    cache.set("goose", "[goose]")
+    cache.index_stems("goose", {"goose": "goose", "Geese": "goose"})
+
+    assert cache.resolve("geese") == ("goose", "[goose]")
+    assert cache.resolve("gander") is None
+    assert cache.stem_hits == 1
+
+
+def test_cache_resolve_skips_expired_and_evicted(cache):
+    cache.set("goose", "[goose]", ttl=-1)
+    cache.index_stems("goose", {"geese": "goose"})
+
+    assert cache.resolve("geese") is None
+    assert cache.resolve("geese", allow_expired=True) == ("goose", "[goose]")
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.resolve("geese", allow_expired=True) is None
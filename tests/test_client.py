@@ -0,0 +1,37 @@
+import pytest
+
+from merriam_api_parser import _client
+
+
+def test_main_prints_note(mocker, capsys):
+    mock_lookup = mocker.patch.object(_client, "lookup", return_value="# run\n")
+
+    assert _client.main(["run", "--url", "http://127.0.0.1:1"]) == 0
+
+    assert capsys.readouterr().out == "# run\n"
+    mock_lookup.assert_called_once_with(
+        "run",
+        socket_path=_client.DEFAULT_SOCKET,
+        url="http://127.0.0.1:1",
+    )
+
+
+def test_main_without_entry(mocker, capsys):
+    mocker.patch.object(_client, "lookup", return_value=None)
+
+    assert _client.main(["walk"]) == 1
+
+    assert "No entry for walk" in capsys.readouterr().err
+
+
+def test_main_with_failed_lookup(mocker, capsys):
+    mocker.patch.object(_client, "lookup", side_effect=OSError("Lookup failed"))
+
+    assert _client.main(["run"]) == 2  # noqa: PLR2004
+
+    assert "Lookup failed" in capsys.readouterr().err
+
+
+def test_lookup_without_daemon(tmp_path):
+    with pytest.raises(OSError, match="No such file"):
+        _client.lookup("run", socket_path=tmp_path / "missing.sock")
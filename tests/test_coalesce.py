@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+
+from merriam_api_parser._coalesce import Coalescer, StemMap, entry_stems
+
+
+@pytest.mark.asyncio()
+async def test_coalescer_shares_in_flight_call():
+    coalescer: Coalescer[int] = Coalescer()
+    calls = []
+
+    async def call() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(coalescer.run("key", call) for _ in range(3)))
+
+    assert results == [42, 42, 42]
+    assert len(calls) == 1
+    assert coalescer.coalesced == 2  # noqa: PLR2004
+    assert await coalescer.run("key", call) == 42  # noqa: PLR2004
+    assert len(calls) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_coalescer_shares_errors():
+    coalescer: Coalescer[int] = Coalescer()
+
+    async def call() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    results = await asyncio.gather(
+        coalescer.run("key", call),
+        coalescer.run("key", call),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio()
+async def test_coalescer_survives_cancelled_callers():
+    coalescer: Coalescer[int] = Coalescer()
+    started = asyncio.Event()
+    cancelled = []
+
+    async def call() -> int:
+        started.set()
+        try:
+            await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+        return 42
+
+    first = asyncio.create_task(coalescer.run("key", call))
+    await started.wait()
+    second = asyncio.create_task(coalescer.run("key", call))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == 42  # noqa: PLR2004
+    assert first.cancelled()
+
+    started.clear()
+    only = asyncio.create_task(coalescer.run("key", call))
+    await started.wait()
+    only.cancel()
+    await asyncio.gather(only, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert cancelled == [1]
+
+
+def test_entry_stems():
+    body = json.dumps(
+        [
+            {"meta": {"id": "lead:1", "stems": ["lead", "led"]}},
+            {"meta": {"id": "lead:2", "stems": ["lead", "leads"]}},
+            "not an entry",
+        ],
+    )
+
+    assert entry_stems(body) == {"lead": "lead:1", "led": "lead:1", "leads": "lead:2"}
+    assert entry_stems(json.dumps(["word", "wood"])) == {}
+    assert entry_stems("not json") == {}
+
+
+def test_stem_map():
+    stems = StemMap(max_bodies=1)
+    stems.add("run", "run body", ["run", "Ran"])
+
+    assert stems.get("ran") == "run body"
+    assert stems.get("RUN") == "run body"
+    assert stems.get("walk") is None
+    assert stems.hits == 2  # noqa: PLR2004
+
+    stems.add("walk", "walk body", ["walk"])
+    assert stems.get("ran") is None
+
+
+def test_stem_map_forgets_stems_of_evicted_bodies():
+    stems = StemMap(max_bodies=2)
+    for i in range(100):
+        stems.add(f"w{i}", f"body {i}", [f"w{i}", f"w{i}s", f"w{i}ed"])
+    stems.add("w99", "new body", ["w99"])
+
+    assert len(stems._stems) == 4  # noqa: PLR2004
+    assert stems.get("w98s") == "body 98"
+    assert stems.get("w99s") is None
+    assert stems.get("w99") == "new body"
+
+
+def test_stem_map_ignores_suggestions():
+    stems = StemMap()
+    stems.add("wrod", "[]", [])
+
+    assert stems.get("wrod") is None
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import urllib.request
+
+import pytest
+
+from merriam_api_parser._client import lookup
+from merriam_api_parser._daemon import LookupServer
+from merriam_api_parser._stub_server import StubServer
+from merriam_api_parser.utility import MerriamWebsterAPI
+
+
+class FakeApi:
+    """Api knowing only 'run', and failing to answer for 'down'."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def parse_response(self, word: str) -> str:
+        """Return a note with trailing spaces for 'run', else no entry."""
+        self.calls.append(word)
+        if word == "down":
+            return ""
+        if word.lower() != "run":
+            msg = "Response holds no dictionary entry"
+            raise ValueError(msg)
+        return "# run  \n\n\n- move fast\n"
+
+
+@pytest.mark.asyncio()
+async def test_lookup_server_keeps_notes_warm(tmp_path):
+    api = FakeApi()
+    server = LookupServer(api)
+    socket_path = tmp_path / "lookup.sock"
+    await server.start(socket_path)
+    try:
+        first = await asyncio.to_thread(lookup, "run", socket_path=socket_path)
+        second = await asyncio.to_thread(lookup, "Run", socket_path=socket_path)
+        missing = await asyncio.to_thread(lookup, "walk", socket_path=socket_path)
+    finally:
+        await server.close()
+
+    assert first == second == "# run\n\n- move fast\n"
+    assert missing is None
+    assert api.calls == ["run", "walk"]
+    assert server.health()["hits"] == 1
+    assert not socket_path.exists()
+
+
+@pytest.mark.asyncio()
+async def test_lookup_server_reports_failed_lookups():
+    api = FakeApi()
+    server = LookupServer(api)
+    url = await server.start()
+    try:
+        with pytest.raises(OSError, match="503"):
+            await asyncio.to_thread(lookup, "down", url=url)
+        with pytest.raises(OSError, match="503"):
+            await asyncio.to_thread(lookup, "down", url=url)
+    finally:
+        await server.close()
+
+    assert api.calls == ["down", "down"]
+
+
+@pytest.mark.asyncio()
+async def test_lookup_server_over_tcp():
+    server = LookupServer(FakeApi(), max_entries=1)
+    url = await server.start()
+    try:
+        note = await asyncio.to_thread(lookup, "run", url=url)
+        health_url = f"{url}/health"
+        with await asyncio.to_thread(urllib.request.urlopen, health_url) as response:
+            health = json.load(response)
+    finally:
+        await server.close()
+
+    assert note == "# run\n\n- move fast\n"
+    assert health["notes"] == 1
+    assert health["misses"] == 1
+
+
+@pytest.mark.asyncio()
+async def test_lookup_server_replaces_stale_socket(tmp_path):
+    socket_path = tmp_path / "lookup.sock"
+    stale = LookupServer(FakeApi())
+    await stale.start(socket_path)
+    stale._socket_path = None  # die without cleaning up
+    await stale.close()
+
+    server = LookupServer(FakeApi())
+    await server.start(socket_path)
+    try:
+        note = await asyncio.to_thread(lookup, "run", socket_path=socket_path)
+    finally:
+        await server.close()
+
+    assert note is not None
+
+
+@pytest.mark.asyncio()
+async def test_lookup_server_unknown_word_is_not_found(tmp_path):
+    stub = StubServer()
+    async with stub as api_url:
+        api = MerriamWebsterAPI("key", api_url=api_url.rstrip("/"))
+        server = LookupServer(api)
+        socket_path = tmp_path / "lookup.sock"
+        await server.start(socket_path)
+        try:
+            first = await asyncio.to_thread(lookup, "wrod", socket_path=socket_path)
+            second = await asyncio.to_thread(lookup, "wrod", socket_path=socket_path)
+        finally:
+            await server.close()
+            await api.aclose()
+
+    assert first is None
+    assert second is None
+    assert stub.requests == {200: 1}
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from merriam_api_parser import _decode
+from merriam_api_parser._decode import first_entry, loads, pick
+from merriam_api_parser._synthetic import PayloadGenerator
+
+
+def _expected(response: list) -> dict:
+    entry = response[0]
+    return {
+        "meta": {"id": entry["meta"]["id"], "stems": entry["meta"]["stems"]},
+        "fl": entry["fl"],
+        "def": [{"sseq": entry["def"][0]["sseq"]}],
+    }
+
+
+@pytest.mark.parametrize("homographs", [1, 3])
+@pytest.mark.parametrize("as_bytes", [False, True])
+def test_first_entry_keeps_renderer_fields(homographs, as_bytes):
+    response = PayloadGenerator(senses=4, homographs=homographs).response("run")
+    body = json.dumps(response, indent=1)
+
+    entry = first_entry(body.encode() if as_bytes else body)
+
+    assert entry == _expected(response)
+
+
+def test_first_entry_with_stdlib(mocker):
+    mocker.patch.object(_decode, "_loads", json.loads)
+    response = PayloadGenerator(senses=2).response("run")
+
+    assert first_entry(json.dumps(response)) == _expected(response)
+    assert loads(b"[1]") == [1]
+
+
+def test_first_entry_with_meta_text():
+    body = json.dumps([{"meta": {"id": "meta"}, "fl": "noun"}, {"meta": {}}])
+
+    assert first_entry(body) == {"meta": {"id": "meta"}, "fl": "noun"}
+
+
+@pytest.mark.parametrize(
+    "body",
+    ['["runs", "runner"]', "[]", '{"meta": {}}', '  {"meta": 1, "meta": 2}'],
+)
+def test_first_entry_without_entry(body):
+    with pytest.raises(ValueError, match="Response"):
+        first_entry(body)
+
+
+def test_pick():
+    schema = {"a": None, "b": [{"c": None}]}
+
+    assert pick({"a": 1, "b": [{"c": 2, "d": 3}, {}], "e": 4}, schema) == {
+        "a": 1,
+        "b": [{"c": 2}],
+    }
+    assert pick({"b": "text"}, schema) == {"b": []}
+    assert pick([], schema) == {}
@@ -0,0 +1,127 @@
+import asyncio
+import gzip
+
+import pytest
+
+from merriam_api_parser._http import AsyncHTTPTransport, HTTPError, Response
+
+
+class _Server:
+    """Tiny keep-alive HTTP server used as a stand-in for the real API."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def __aexit__(self, *_args: object) -> None:
+        self.server.close()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        while True:
+            try:
+                request_line = await reader.readuntil(b"\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            while await reader.readuntil(b"\r\n") != b"\r\n":
+                pass
+            path = request_line.split()[1].decode()
+            writer.write(self._respond(path))
+            await writer.drain()
+            if path == "/close":
+                break
+        writer.close()
+
+    @staticmethod
+    def _respond(path: str) -> bytes:
+        if path == "/chunked":
+            return (
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+                b"3\r\n[1,\r\n2\r\n2]\r\n0\r\n\r\n"
+            )
+        if path == "/gzip":
+            body = gzip.compress(b"[]")
+            return (
+                b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\n"
+                b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+            )
+        if path == "/close":
+            return b"HTTP/1.1 404 Not Found\r\nConnection: close\r\n\r\nmissing"
+        body = path.encode()
+        return b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+
+
+@pytest.mark.asyncio()
+async def test_keep_alive_reuses_connection():
+    server = _Server()
+    transport = AsyncHTTPTransport()
+    async with server as base_url:
+        for word in ("/apple/", "/banana", "/cherry"):
+            response = await transport.get(base_url + word, timeout=5)
+            assert response.ok
+            assert response.text == word
+        await transport.aclose()
+    assert server.connections == 1
+    assert transport.connections_opened == 1
+
+
+@pytest.mark.asyncio()
+async def test_pool_is_bounded():
+    server = _Server()
+    transport = AsyncHTTPTransport(max_connections=2)
+    async with server as base_url:
+        responses = await asyncio.gather(
+            *(transport.get(f"{base_url}/word{i}", timeout=5) for i in range(20)),
+        )
+        await transport.aclose()
+    assert all(response.ok for response in responses)
+    assert transport.connections_opened <= transport.max_connections
+
+
+@pytest.mark.asyncio()
+async def test_chunked_gzip_and_close():
+    server = _Server()
+    transport = AsyncHTTPTransport()
+    async with server as base_url:
+        assert (await transport.get(f"{base_url}/chunked", timeout=5)).text == "[1,2]"
+        assert (await transport.get(f"{base_url}/gzip", timeout=5)).text == "[]"
+        response = await transport.get(f"{base_url}/close", timeout=5)
+        assert not response.ok
+        assert response.body == b"missing"
+        assert (await transport.get(f"{base_url}/again", timeout=5)).ok
+        await transport.aclose()
+    assert server.connections == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_transport_errors():
+    transport = AsyncHTTPTransport()
+    with pytest.raises(HTTPError):
+        await transport.get("ftp://example.com/", timeout=5)
+    with pytest.raises(HTTPError):
+        await transport.get("http://127.0.0.1:1/", timeout=5)
+
+
+@pytest.mark.asyncio()
+async def test_read_timeout():
+    async def hang(reader, writer) -> None:
+        await reader.read()
+        writer.close()
+
+    server = await asyncio.start_server(hang, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    transport = AsyncHTTPTransport()
+    with pytest.raises(HTTPError, match="TimeoutError"):
+        await transport.get(f"http://127.0.0.1:{port}/", 0.05, connect_timeout=5)
+    assert transport.connections_opened == 1
+    server.close()
+
+
+def test_response():
+    assert Response(204).ok
+    assert not Response(429).ok
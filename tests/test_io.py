@@ -1,9 +1,20 @@
+import bz2
+import gzip
+import io
+import os
+import threading
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
 
-from merriam_api_parser._io import Reader, Writer
+from merriam_api_parser._io import (
+    MdFormatter,
+    Reader,
+    Writer,
+    aiter_words,
+    iter_words,
+)
 
 
 @pytest.fixture()
@@ -38,8 +49,116 @@ def test_reader_directory_no_md_files(temp_dir: TemporaryDirectory) -> None:
     assert reader.get_md_names() == []
 
 
+def test_reader_recursive(temp_dir: Path) -> None:
+    for name in ("a.md", "x/b.md", "x/y/c.md", "x/y/c.txt", ".obsidian/d.md", "z/e.md"):
+        (temp_dir / name).parent.mkdir(parents=True, exist_ok=True)
+        (temp_dir / name).write_text("", encoding="UTF-8")
+
+    reader = Reader(temp_dir, exclude=(".*", "z"), workers=2)
+    assert sorted(reader.notes()) == [
+        ("a", temp_dir / "a.md"),
+        ("b", temp_dir / "x" / "b.md"),
+        ("c", temp_dir / "x" / "y" / "c.md"),
+    ]
+    assert Reader(temp_dir, recursive=False).get_md_names() == ["a"]
+    assert sorted(Reader(temp_dir, include=("y/*",)).get_md_names()) == ["c", "c"]
+
+
+def test_reader_skips_symlink_loops(temp_dir: Path) -> None:
+    (temp_dir / "x").mkdir()
+    (temp_dir / "x" / "b.md").write_text("", encoding="UTF-8")
+    (temp_dir / "x" / "up").symlink_to(temp_dir, target_is_directory=True)
+
+    reader = Reader(temp_dir, workers=2)
+    assert list(reader.notes()) == [("b", temp_dir / "x" / "b.md")]
+
+
+@pytest.mark.asyncio()
+async def test_reader_anotes(temp_dir: Path) -> None:
+    (temp_dir / "a.md").write_text("", encoding="UTF-8")
+    assert [note async for note in Reader(temp_dir).anotes()] == [
+        ("a", temp_dir / "a.md"),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_reader_anotes_keep_runs_off_the_loop(temp_dir: Path) -> None:
+    for name in ("a.md", "b.md"):
+        (temp_dir / name).write_text("", encoding="UTF-8")
+    threads = set()
+
+    def keep(note: Path) -> bool:
+        threads.add(threading.get_ident())
+        return note.stem == "b"
+
+    notes = [note async for note in Reader(temp_dir).anotes(keep=keep)]
+
+    assert notes == [("b", temp_dir / "b.md")]
+    assert threading.get_ident() not in threads
+
+
 def test_writer(temp_dir: TemporaryDirectory) -> None:
     file_path = temp_dir / "test.md"
     writer = Writer(file_path)
     writer.write("# Test\n\nThis is a test.")
     assert file_path.read_text(encoding="UTF-8") == "# Test\n\nThis is a test."
+
+
+def test_writer_skips_unchanged(temp_dir: TemporaryDirectory) -> None:
+    file_path = temp_dir / "test.md"
+    assert Writer(file_path).write("# Test")
+    os.utime(file_path, (0, 0))
+    assert not Writer(file_path).write("# Test")
+    assert file_path.stat().st_mtime == 0
+    assert Writer(file_path).write("# Test!")
+
+
+def test_writer_normalize(temp_dir: TemporaryDirectory) -> None:
+    file_path = temp_dir / "test.md"
+    Writer(file_path, normalize=True).write("# Test  \n\n\n\ntext")
+    assert file_path.read_text(encoding="UTF-8") == "# Test\n\ntext\n"
+
+
+def test_md_formatter_normalize() -> None:
+    raw = Path("tests/test_data.md").read_text(encoding="UTF-8")
+    normalized = MdFormatter.normalize(raw)
+    assert "\n\n\n" not in normalized
+    assert normalized.endswith("test illustration\n")
+    assert normalized.startswith("---\naliases: test_alias\n---\n\n# test_id\n")
+    assert MdFormatter.normalize(normalized) == normalized
+    assert MdFormatter.normalize("\n \n") == ""
+
+
+def test_md_formatter_md_format(temp_dir: TemporaryDirectory) -> None:
+    (temp_dir / "a.md").write_text("# A\n\n\n", encoding="UTF-8")
+    (temp_dir / "b.md").write_text("# B\n", encoding="UTF-8")
+    os.utime(temp_dir / "b.md", (0, 0))
+    MdFormatter(temp_dir).md_format()
+    assert (temp_dir / "a.md").read_text(encoding="UTF-8") == "# A\n"
+    assert (temp_dir / "b.md").stat().st_mtime == 0
+
+
+@pytest.mark.parametrize(
+    ("name", "opener"),
+    [("words.txt", open), ("words.gz", gzip.open), ("words.bz2", bz2.open)],
+)
+def test_iter_words(temp_dir: Path, name: str, opener) -> None:
+    with opener(temp_dir / name, "wt", encoding="UTF-8") as file:
+        file.write("# header\nrun\n\n  ice   cream \nRun\n")
+
+    assert list(iter_words(temp_dir / name)) == ["run", "ice cream", "Run"]
+
+
+def test_iter_words_stdin(monkeypatch) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO("a\nb\n"))
+    assert list(iter_words(Path("-"))) == ["a", "b"]
+
+
+@pytest.mark.asyncio()
+async def test_aiter_words(temp_dir: Path) -> None:
+    (temp_dir / "words.txt").write_text("a\nb\nc\n", encoding="UTF-8")
+    assert [word async for word in aiter_words(temp_dir / "words.txt", 2)] == [
+        "a",
+        "b",
+        "c",
+    ]
@@ -0,0 +1,130 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from merriam_api_parser._journal import JobJournal, QuotaExhaustedError, QuotaLedger
+
+
+def test_quota_ledger_counts_across_restarts(tmp_path):
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3", daily_limit=2)
+    ledger.spend()
+    ledger.close()
+
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3", daily_limit=2)
+    ledger.spend()
+
+    assert ledger.spent() == 2  # noqa: PLR2004
+    assert ledger.remaining() == 0
+    with pytest.raises(QuotaExhaustedError):
+        ledger.spend()
+
+
+def test_quota_ledger_holds_under_concurrent_spending(tmp_path):
+    path = tmp_path / "quota.sqlite3"
+
+    def spend_all(_: int) -> int:
+        ledger = QuotaLedger(path, daily_limit=200)
+        spent = 0
+        try:
+            while True:
+                ledger.spend()
+                spent += 1
+        except QuotaExhaustedError:
+            return spent
+        finally:
+            ledger.close()
+
+    with ThreadPoolExecutor(8) as pool:
+        spent = sum(pool.map(spend_all, range(8)))
+
+    assert spent == QuotaLedger(path).spent() == 200  # noqa: PLR2004
+
+
+def test_quota_ledger_with_zero_limit(tmp_path):
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3", daily_limit=0)
+
+    with pytest.raises(QuotaExhaustedError):
+        ledger.spend()
+    assert ledger.spent() == 0
+
+
+def test_quota_ledger_without_limit(mocker):
+    ledger = QuotaLedger(":memory:")
+    ledger.spend()
+    mocker.patch.object(QuotaLedger, "today", return_value="2000-01-02")
+
+    assert ledger.spent() == 0
+    assert ledger.remaining() == float("inf")
+
+
+def test_journal_hands_out_jobs_by_priority(tmp_path):
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    jobs = [(f"w{i}", Path(f"w{i}.md"), float(i % 3)) for i in range(10)]
+
+    assert journal.add(jobs) == 10  # noqa: PLR2004
+    assert journal.add(jobs[:2]) == 0
+    claimed = journal.claim(4)
+
+    assert [word for word, _ in claimed[:3]] == ["w2", "w5", "w8"]
+    assert len(claimed + journal.claim(10)) == 10  # noqa: PLR2004
+
+
+def test_journal_resumes_unfinished_jobs(tmp_path):
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    journal.add(
+        [("a", Path("a.md"), 3), ("b", Path("b.md"), 2), ("c", Path("c.md"), 1)],
+    )
+    for _, path in journal.claim(3):
+        journal.mark(path, "done" if path.stem == "a" else "deferred")
+    journal.mark(Path("c.md"), "failed")
+    journal.close()
+
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+
+    assert journal.counts() == {
+        "pending": 0,
+        "leased": 0,
+        "done": 1,
+        "failed": 1,
+        "deferred": 1,
+    }
+    assert journal.claim(3) == [("b", Path("b.md"))]
+    with pytest.raises(ValueError, match="Unknown job state"):
+        journal.mark(Path("a.md"), "lost")
+
+
+def test_journal_leases_jobs_to_one_worker(tmp_path, mocker):
+    first = JobJournal(tmp_path / "journal.sqlite3", owner="first", lease=60)
+    second = JobJournal(tmp_path / "journal.sqlite3", owner="second", lease=60)
+    first.add([(word, Path(f"{word}.md"), 0) for word in "abc"])
+
+    assert first.claim(2) == [("a", Path("a.md")), ("b", Path("b.md"))]
+    assert second.claim(2) == [("c", Path("c.md"))]
+    assert second.claim(2) == []
+
+    first.mark(Path("a.md"), "done")
+    mocker.patch("time.time", return_value=time.time() + 61)
+
+    assert second.claim(2) == [("b", Path("b.md")), ("c", Path("c.md"))]
+    assert second.counts()["leased"] == 2  # noqa: PLR2004
+
+
+def test_journal_releases_unfinished_leases(tmp_path):
+    first = JobJournal(tmp_path / "journal.sqlite3", owner="first", lease=60)
+    second = JobJournal(tmp_path / "journal.sqlite3", owner="second", lease=60)
+    first.add([(word, Path(f"{word}.md"), 0) for word in "abc"])
+    first.claim(2)
+    second.claim(1)
+    first.mark(Path("a.md"), "done")
+
+    assert first.release() == 1
+    assert second.claim(2) == [("b", Path("b.md"))]
+    assert first.counts() == {
+        "pending": 0,
+        "leased": 2,
+        "done": 1,
+        "failed": 0,
+        "deferred": 0,
+    }
@@ -1,10 +1,13 @@
+import io
 import json
+import pickle
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from merriam_api_parser._json_parser import JsonParser
+from merriam_api_parser._entry import DividedSense, Entry, Sense, VerbalIllustration
+from merriam_api_parser._json_parser import JsonParser, MarkdownRenderer
 
 
 @pytest.fixture()
@@ -91,6 +94,11 @@ def single_pseq() -> list[Any]:
     ]
 
 
+@pytest.fixture()
+def out() -> io.StringIO:
+    return io.StringIO()
+
+
 @pytest.fixture()
 def empty_parser() -> JsonParser:
     return JsonParser({})
@@ -101,6 +109,24 @@ def full_parser(json_data) -> JsonParser:
     return JsonParser(json_data)
 
 
+@pytest.fixture()
+def renderer() -> MarkdownRenderer:
+    return MarkdownRenderer()
+
+
+@pytest.fixture()
+def senses() -> list[Sense]:
+    return [
+        Sense(
+            "1",
+            "test definition",
+            (VerbalIllustration("test illustration"),),
+            DividedSense("sense divider", "test definition"),
+        ),
+        Sense("1 a", "test definition", (VerbalIllustration("test illustration"),)),
+    ]
+
+
 def test_single_sseq(json_data, single_sseq):
     _single_sseq = json_data["def"][0]["sseq"][0]
     assert _single_sseq == single_sseq
@@ -111,124 +137,89 @@ def test_single_sense(json_data, single_sense):
     assert _single_sense == single_sense
 
 
-def test_parse_sseq(full_parser):
-    parser = full_parser
-    parser._parse_sseq()
-    assert parser._sense == {
-        "1": {
-            "text": "test definition",
-            "vis": ["test illustration"],
-            "sdsense_sd": "sense divider",
-            "sdsense_text": "test definition",
-        },
-        "1 a": {"text": "test definition", "vis": ["test illustration"]},
-    }
+def test_parse(full_parser, senses):
+    entry = full_parser.parse()
+    assert entry == Entry("test_id", ("test_alias",), "", tuple(senses))
+    assert full_parser.parse() is entry
+
+
+def test_parse_entry_pickles(full_parser):
+    entry = full_parser.parse()
+    assert pickle.loads(pickle.dumps(entry)) == entry  # noqa: S301
+
+
+def test_parse_sseq(full_parser, senses):
+    assert full_parser._parse_sseq() == senses
 
 
 def test_parse_sseq_empty(empty_parser):
-    parser = empty_parser
-    parser._parse_sseq()
-    assert parser._sense == {}
+    assert empty_parser._parse_sseq() == []
+    assert empty_parser.parse() == Entry("")
 
 
-def test_parse_single_sseq(full_parser, single_sseq):
-    parser = full_parser
-    parser._parse_single_sseq(single_sseq)
-    assert parser._sense == {
-        "1": {
-            "text": "test definition",
-            "vis": ["test illustration"],
-            "sdsense_sd": "sense divider",
-            "sdsense_text": "test definition",
-        },
-        "1 a": {"text": "test definition", "vis": ["test illustration"]},
-    }
+def test_parse_single_sseq(empty_parser, single_sseq, senses):
+    parsed: list[Sense] = []
+    empty_parser._parse_single_sseq(single_sseq, parsed)
+    assert parsed == senses
 
 
-def test_pase_single_sseq_pseq(full_parser, single_pseq):
-    parser = full_parser
-    parser._parse_single_sseq(single_pseq)
-    assert parser._sense == {
-        "1": {
-            "text": "test definition",
-            "vis": ["test illustration"],
-            "sdsense_sd": "sense divider",
-            "sdsense_text": "test definition",
-        },
-        "1 a": {"text": "test definition", "vis": ["test illustration"]},
-    }
+def test_pase_single_sseq_pseq(empty_parser, single_pseq, senses):
+    parsed: list[Sense] = []
+    empty_parser._parse_single_sseq([single_pseq], parsed)
+    assert parsed == senses[1:]
 
 
 def test_parse_single_sseq_index_error(empty_parser):
     # For coverage
-    parser = empty_parser
-    parser._parse_single_sseq([{"test": "test"}])
+    parsed: list[Sense] = []
+    empty_parser._parse_single_sseq([{"test": "test"}], parsed)
+    assert parsed == []
 
 
-def test_parse_single_sense(empty_parser, single_sense):
-    parser = empty_parser
-    sense_number, definition_text = parser._parse_single_sense(single_sense)
-    assert sense_number == "1"
-    assert definition_text == {
-        "text": "test definition",
-        "vis": ["test illustration"],
-        "sdsense_sd": "sense divider",
-        "sdsense_text": "test definition",
-    }
+def test_parse_single_sense(empty_parser, single_sense, senses):
+    assert empty_parser._parse_single_sense(single_sense) == senses[0]
 
 
 def test_parse_dt(empty_parser):
     parser = empty_parser
-    origin_dt = [["text", "test definition"]]
-    dt = parser._parse_dt(origin_dt)
-    assert dt == {"text": "test definition", "vis": ""}
+    assert parser._parse_dt([["text", "test definition"]]) == ("test definition", ())
+    assert parser._parse_dt(
+        [["text", "a "], ["vis", [{"t": "x"}]], ["text", "b"], ["uns", []]],
+    ) == ("a b", (VerbalIllustration("x"),))
 
 
-def test_name_ele_constructor(empty_parser):
-    parser = empty_parser
-    lst = [["text", "test definition"]]
-    name_ele = parser._name_ele_constructor(lst)
-    assert name_ele == {"text": "test definition"}
-
+def test_add_head(renderer, out):
+    renderer._add_head(out, "test", 1)
+    assert out.getvalue() == "\n\n# test"
 
-def test_add_head(empty_parser):
-    parser = empty_parser
-    parser._add_head("test", 1)
-    assert parser._md_text == "\n\n# test"
 
-
-def test_add_sense(empty_parser):
-    parser = empty_parser
-    sense = {"text": "test definition", "vis": ["test illustration"]}
-    parser._add_sense(sense, "text", "vis")
-    assert parser._md_text == (
-        '\n\n<mark style="background: #FFB8EBA6;">test definition</mark>\n\ntest illustration'
+def test_add_sense(renderer, out):
+    vis = (VerbalIllustration("test illustration"), VerbalIllustration("{it}x{/it}"))
+    renderer._add_sense(out, "{bc}test definition", vis)
+    assert out.getvalue() == (
+        '\n\n<mark style="background: #FFB8EBA6;">: test definition</mark>\n\ntest illustration\n\n_x_'
     )
 
 
-def test_add_md_new_line(empty_parser):
-    parser = empty_parser
-    parser._add_md_new_line()
-    assert parser._md_text == "\n\n"
+def test_add_md_new_line(renderer, out):
+    renderer._add_md_new_line(out)
+    assert out.getvalue() == "\n\n"
 
 
-def test_add_three_hyphen(empty_parser):
-    parser = empty_parser
-    parser._add_three_hyphen_up()
-    parser._add_three_hyphen_down()
-    assert parser._md_text == "---\n---"
+def test_add_three_hyphen(renderer, out):
+    renderer._add_three_hyphen_up(out)
+    renderer._add_three_hyphen_down(out)
+    assert out.getvalue() == "---\n---"
 
 
-def test_add_synonym(full_parser):
-    parser = full_parser
-    parser._add_synonym()
-    assert parser._md_text == "aliases: test_alias\n"
+def test_add_synonym(renderer, out):
+    renderer._add_synonym(out, ("test_alias",))
+    assert out.getvalue() == "aliases: test_alias\n"
 
 
-def test_add_all_sense(full_parser):
-    parser = full_parser
-    parser._add_all_sense()
-    assert parser._md_text == (
+def test_add_all_sense(renderer, out, senses):
+    renderer._add_all_sense(out, tuple(senses))
+    assert out.getvalue() == (
         "\n\n## 1\n\n"
         '<mark style="background: #FFB8EBA6;">test definition</mark>\n\n'
         "test illustration\n\n"
@@ -253,5 +244,28 @@ def test_get_md_text(full_parser):
     assert len(parser.get_md_text()) > 0
 
 
+def test_get_md_text_is_repeatable(full_parser):
+    assert full_parser.get_md_text() == full_parser.get_md_text()
+    assert full_parser.get_md_text() == Path("tests/test_data.md").read_text(
+        encoding="utf-8",
+    )
+
+
+def test_write_md(full_parser, out):
+    full_parser.write_md(out)
+    assert out.getvalue() == full_parser.get_md_text()
+
+
+def test_parse_is_lazy(json_data):
+    parser = JsonParser(json_data)
+    assert parser._entry is None
+    parser.get_md_text()
+    assert parser._entry is not None
+
+
+def test_renderer_matches_parser(full_parser, renderer):
+    assert renderer.render(full_parser.parse()) == full_parser.get_md_text()
+
+
 # TODO: more tests to 100% coverage
 # TODO: add 100% coverage requirement to pre-commit
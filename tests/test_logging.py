@@ -0,0 +1,64 @@
+import json
+import logging
+from logging.handlers import MemoryHandler
+
+from merriam_api_parser._logging import JsonFormatter, RateLimitFilter, start_logging
+
+
+def _record(msg: str, level: int = logging.INFO, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord("test", level, __file__, 1, msg, ("run",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter():
+    line = JsonFormatter().format(_record("Got response for %s", word="run"))
+
+    data = json.loads(line)
+    assert data["level"] == "INFO"
+    assert data["message"] == "Got response for run"
+    assert data["word"] == "run"
+
+
+def test_rate_limit_filter(mocker):
+    clock = mocker.patch("merriam_api_parser._logging.time.monotonic")
+    clock.return_value = 0.0
+    limit = RateLimitFilter(rate=2)
+
+    passed = [limit.filter(_record("Got %s")) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert limit.filter(_record("Other %s"))
+    assert limit.filter(_record("Got %s", logging.WARNING))
+
+    clock.return_value = 1.0
+    record = _record("Got %s")
+    assert limit.filter(record)
+    assert record.getMessage() == "Got run (3 similar messages dropped)"
+    assert limit.dropped == 3  # noqa: PLR2004
+
+
+def test_start_logging_flushes_on_stop(mocker):
+    mocker.patch("logging.basicConfig")
+    handler = MemoryHandler(100)
+    listener = start_logging([handler], rate=1)
+
+    queue_handler = logging.basicConfig.call_args.kwargs["handlers"][0]
+    for _ in range(3):
+        queue_handler.handle(_record("Got %s"))
+    listener.stop()
+
+    assert [record.getMessage() for record in handler.buffer] == ["Got run"]
+
+
+def test_start_logging_formats_once(mocker):
+    mocker.patch("logging.basicConfig")
+    handler = MemoryHandler(100)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    listener = start_logging([handler])
+
+    queue_handler = logging.basicConfig.call_args.kwargs["handlers"][0]
+    queue_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    queue_handler.handle(_record("Got %s", logging.WARNING))
+    listener.stop()
+
+    assert [handler.format(record) for record in handler.buffer] == ["WARNING Got run"]
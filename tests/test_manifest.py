@@ -0,0 +1,80 @@
+import os
+import time
+
+import pytest
+
+from merriam_api_parser._json_parser import RENDERER_VERSION
+from merriam_api_parser._manifest import Manifest, ManifestEntry, content_hash
+
+DAY = 24 * 3600
+
+
+@pytest.fixture()
+def vault(tmp_path):
+    (tmp_path / "empty.md").write_text("\n", encoding="utf-8")
+    (tmp_path / "filled.md").write_text("# filled", encoding="utf-8")
+    return tmp_path
+
+
+def test_is_due_empty_and_missing(vault):
+    manifest = Manifest(vault)
+    assert manifest.is_due(vault / "empty.md", DAY)
+    assert manifest.is_due(vault / "missing.md", DAY)
+
+
+def test_is_due_reads_blank_notes_in_chunks(vault):
+    (vault / "blank.md").write_text(" \n" * 5000, encoding="utf-8")
+    (vault / "late.md").write_text(" \n" * 5000 + "# late", encoding="utf-8")
+    manifest = Manifest(vault)
+    assert manifest.is_due(vault / "blank.md", DAY)
+    assert not manifest.is_due(vault / "late.md", DAY)
+
+
+def test_is_due_uses_mtime_without_entry(vault):
+    manifest = Manifest(vault)
+    note = vault / "filled.md"
+    assert not manifest.is_due(note, DAY)
+    os.utime(note, (time.time() - 2 * DAY, time.time() - 2 * DAY))
+    assert manifest.is_due(note, DAY)
+
+
+def test_is_due_stale_and_renderer_version(vault):
+    manifest = Manifest(vault)
+    note = vault / "filled.md"
+    manifest.record(vault / "filled.md", "[]", "# filled")
+    assert not manifest.is_due(note, DAY)
+
+    manifest.entries["filled.md"].fetched_at -= 2 * DAY
+    assert manifest.is_due(note, DAY)
+
+    manifest.record(vault / "filled.md", "[]", "# filled")
+    manifest.entries["filled.md"].renderer_version = RENDERER_VERSION - 1
+    assert manifest.is_due(note, DAY)
+
+
+def test_manifest_round_trip(vault):
+    manifest = Manifest(vault)
+    manifest.record(vault / "filled.md", "[]", "# filled")
+    manifest.save()
+
+    loaded = Manifest(vault)
+    assert loaded.entries == manifest.entries
+    assert loaded.entries["filled.md"] == ManifestEntry(
+        manifest.entries["filled.md"].fetched_at,
+        content_hash("[]"),
+        content_hash("# filled"),
+    )
+
+
+def test_manifest_keys_notes_by_relative_path(vault):
+    for folder in ("a", "b"):
+        (vault / folder).mkdir()
+        (vault / folder / "run.md").write_text("# run", encoding="utf-8")
+    old = time.time() - 2 * DAY
+    os.utime(vault / "b" / "run.md", (old, old))
+    manifest = Manifest(vault)
+    manifest.record(vault / "a" / "run.md", "[]", "# run")
+
+    assert list(manifest.entries) == ["a/run.md"]
+    assert not manifest.is_due(vault / "a" / "run.md", DAY)
+    assert manifest.is_due(vault / "b" / "run.md", DAY)
@@ -0,0 +1,92 @@
+import asyncio
+import io
+import json
+import pickle
+
+import pytest
+
+from merriam_api_parser._metrics import Histogram, Metrics, show_progress
+
+
+def test_histogram():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 2.0):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1]
+    assert histogram.quantile(0.5) == 1.0  # noqa: PLR2004
+    assert histogram.quantile(1.0) == 2.0  # noqa: PLR2004
+    assert Histogram().quantile(0.5) == 0.0  # noqa: PLR2004
+
+
+def test_metrics_time_and_count():
+    metrics = Metrics()
+    with pytest.raises(ValueError, match="boom"), metrics.time("parse"):
+        raise ValueError("boom")  # noqa: EM101
+    metrics.count("cache_hits", 2)
+
+    data = metrics.to_dict()
+    assert data["counters"] == {"cache_hits": 2}
+    assert data["histograms"]["parse"]["count"] == 1
+
+    metrics.reset()
+    assert metrics.to_dict()["counters"] == {}
+
+
+def test_metrics_drain_and_merge():
+    worker = Metrics()
+    worker.observe("parse", 0.5)
+    worker.count("notes_written", 2)
+    drained = pickle.loads(pickle.dumps(worker.drain()))  # noqa: S301
+    parent = Metrics()
+    parent.observe("parse", 0.05)
+
+    parent.merge(drained)
+    parent.merge(drained)
+
+    assert worker.to_dict()["counters"] == {}
+    assert parent.counters == {"notes_written": 4}
+    assert parent.histograms["parse"].count == 3  # noqa: PLR2004
+    assert parent.histograms["parse"].max == 0.5  # noqa: PLR2004
+
+
+def test_metrics_prometheus():
+    metrics = Metrics()
+    metrics.observe("write", 0.003)
+    metrics.count("notes_written")
+
+    text = metrics.to_prometheus()
+    assert "merriam_notes_written_total 1\n" in text
+    assert 'merriam_write_seconds_bucket{le="0.0025"} 0\n' in text
+    assert 'merriam_write_seconds_bucket{le="0.005"} 1\n' in text
+    assert 'merriam_write_seconds_bucket{le="+Inf"} 1\n' in text
+    assert "merriam_write_seconds_count 1\n" in text
+
+
+def test_metrics_export(tmp_path):
+    metrics = Metrics()
+    metrics.count("api_retries")
+    metrics.export(tmp_path / "stats.json")
+    metrics.export(tmp_path / "stats.prom")
+
+    data = json.loads((tmp_path / "stats.json").read_text(encoding="utf-8"))
+    assert data["counters"] == {"api_retries": 1}
+    assert (tmp_path / "stats.prom").read_text(encoding="utf-8").startswith("# TYPE")
+
+
+@pytest.mark.asyncio()
+async def test_show_progress():
+    metrics = Metrics()
+    metrics.count("notes_written", 3)
+    metrics.count("api_failures")
+    metrics.observe("fetch", 0.02)
+    stream = io.StringIO()
+
+    task = asyncio.create_task(show_progress(metrics, 0.001, stream))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert "3 notes, 1 failed" in stream.getvalue()
+    assert "fetch p50 25ms" in stream.getvalue()
+    assert stream.getvalue().endswith("\n")
@@ -0,0 +1,110 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+
+from merriam_api_parser._pipeline import Pipeline, PipelineStats
+
+
+class FakeApi:
+    """Api answering every word except 'missing' and 'broken'."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def fetch(self, word: str) -> str | None:
+        """Return a body for word."""
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if word == "error":
+            raise RuntimeError
+        return None if word == "missing" else word
+
+    def render(self, body: str) -> str:
+        """Render a body."""
+        if body == "broken":
+            raise ValueError
+        return f"# {body}"
+
+
+@pytest.mark.asyncio()
+async def test_pipeline_writes_notes(tmp_path):
+    (tmp_path / "same.md").write_text("# same\n", encoding="utf-8")
+    records = []
+    words = ["alpha", "same", "missing", "broken", "error"]
+    pipeline = Pipeline(FakeApi(), fetchers=2, on_write=lambda *r: records.append(r))
+
+    stats = await pipeline.run((word, tmp_path / f"{word}.md") for word in words)
+
+    assert stats == PipelineStats(fetched=3, written=1, unchanged=1, failed=3)
+    assert (tmp_path / "alpha.md").read_text(encoding="utf-8") == "# alpha\n"
+    assert not (tmp_path / "missing.md").exists()
+    assert sorted(records) == [
+        (tmp_path / "alpha.md", "alpha", "# alpha"),
+        (tmp_path / "same.md", "same", "# same"),
+    ]
+
+
+@pytest.mark.asyncio()
+async def test_pipeline_is_bounded(tmp_path):
+    api = FakeApi()
+    pulled = 0
+
+    async def source() -> AsyncIterator[tuple[str, Path]]:
+        nonlocal pulled
+        for i in range(200):
+            pulled += 1
+            # words pulled but not yet written never exceed the queue bounds
+            assert pulled - pipeline.stats.written <= 3 * 4 + 3 + 3
+            yield f"w{i}", tmp_path / f"w{i}.md"
+
+    pipeline = Pipeline(api, fetchers=3, queue_size=4)
+    stats = await pipeline.run(source())
+
+    assert stats.written == 200  # noqa: PLR2004
+    assert api.peak <= 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_pipeline_reports_outcomes(tmp_path):
+    done, failed = [], []
+    pipeline = Pipeline(
+        FakeApi(),
+        on_done=lambda word, _: done.append(word),
+        on_fail=lambda word, _, error: failed.append((word, type(error))),
+    )
+
+    await pipeline.run((word, tmp_path / f"{word}.md") for word in ["ok", "error"])
+
+    assert done == ["ok"]
+    assert failed == [("error", RuntimeError)]
+
+
+@pytest.mark.asyncio()
+async def test_pipeline_survives_failing_callbacks(tmp_path):
+    def on_done(word: str, _: Path) -> None:
+        raise OSError(word)
+
+    pipeline = Pipeline(FakeApi(), fetchers=2, queue_size=1, on_done=on_done)
+    words = [(f"w{i}", tmp_path / f"w{i}.md") for i in range(20)]
+
+    stats = await asyncio.wait_for(pipeline.run(words), timeout=10)
+
+    assert stats.written == 20  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_pipeline_raises_when_a_stage_dies(tmp_path, mocker):
+    mocker.patch(
+        "merriam_api_parser._pipeline.Writer.write",
+        side_effect=RuntimeError("disk gone"),
+    )
+    pipeline = Pipeline(FakeApi(), fetchers=2, queue_size=1)
+    words = [(f"w{i}", tmp_path / f"w{i}.md") for i in range(20)]
+
+    with pytest.raises(RuntimeError, match="disk gone"):
+        await asyncio.wait_for(pipeline.run(words), timeout=10)
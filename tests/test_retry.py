@@ -0,0 +1,115 @@
+import random
+
+import pytest
+
+from merriam_api_parser._http import HTTPError, Response
+from merriam_api_parser._retry import (
+    CircuitBreaker,
+    Deadline,
+    DeadlineExceededError,
+    Retrier,
+    RetryPolicy,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(backoff=1, max_backoff=4)
+    rng = random.Random(0)
+
+    delays = [policy.delay(attempt, rng=rng) for attempt in range(6)]
+    assert all(0 <= delay <= min(4, 2**i) for i, delay in enumerate(delays))
+    assert policy.delay(0, "7") == 7  # noqa: PLR2004
+    assert policy.delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") <= 1
+    assert policy.delay(0, "soon") <= 1
+
+
+def test_circuit_breaker_opens_and_probes():
+    clock = _Clock()
+    breaker = CircuitBreaker(threshold=0.5, window=4, cooldown=10, clock=clock)
+    for success in (True, False, True):
+        breaker.record(success=success)
+    assert not breaker.is_open
+    breaker.record(success=False)
+    assert breaker.is_open
+
+    clock.now = 10.0
+    assert not breaker.is_open
+    breaker.record(success=False)  # the probe failed
+    assert breaker.is_open
+    assert breaker.opened == 2  # noqa: PLR2004
+
+    clock.now = 20.0
+    breaker.record(success=True)
+    breaker.record(success=False)
+    assert not breaker.is_open
+
+
+def test_deadline():
+    clock = _Clock()
+    deadline = Deadline(5, clock=clock)
+    clock.now = 3.0
+    assert deadline.remaining() == 2  # noqa: PLR2004
+    clock.now = 9.0
+    assert deadline.remaining() == 0
+    assert Deadline().remaining() == float("inf")
+
+
+class _Send:
+    def __init__(self, *outcomes: Response | HTTPError) -> None:
+        self.outcomes = list(outcomes)
+        self.timeouts: list[tuple[float, float]] = []
+
+    async def __call__(self, timeout: float, connect_timeout: float) -> Response:
+        self.timeouts.append((timeout, connect_timeout))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, HTTPError):
+            raise outcome
+        return outcome
+
+
+@pytest.mark.asyncio()
+async def test_retrier_backs_off_and_honours_retry_after(mocker):
+    sleep = mocker.patch("merriam_api_parser._retry.asyncio.sleep")
+    send = _Send(HTTPError(), Response(429, {"retry-after": "3"}), Response(200))
+    retrier = Retrier(RetryPolicy(connect_timeout=1, read_timeout=2))
+
+    assert (await retrier.call(send)).ok
+    assert send.timeouts == [(2, 1)] * 3
+    assert sleep.call_args_list[-1].args[0] >= 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_retrier_gives_up():
+    retrier = Retrier(RetryPolicy(attempts=2, backoff=0))
+
+    response = await retrier.call(_Send(Response(503), Response(503)))
+    assert response.status == 503  # noqa: PLR2004
+    assert (await retrier.call(_Send(Response(404)))).status == 404  # noqa: PLR2004
+    with pytest.raises(HTTPError):
+        await retrier.call(_Send(HTTPError(), HTTPError()))
+
+
+@pytest.mark.asyncio()
+async def test_retrier_deadline():
+    clock = _Clock()
+    retrier = Retrier(
+        RetryPolicy(read_timeout=30),
+        deadline=Deadline(10, clock=clock),
+    )
+    send = _Send(Response(503, {"retry-after": "60"}))
+
+    with pytest.raises(DeadlineExceededError):
+        await retrier.call(send)
+    assert send.timeouts == [(10, 5)]
+
+    clock.now = 10.0
+    with pytest.raises(DeadlineExceededError):
+        await retrier.call(_Send())
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+
+from merriam_api_parser._scheduler import AdaptiveScheduler, TokenBucket
+
+
+@pytest.mark.asyncio()
+async def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate=100, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.04  # noqa: PLR2004
+
+
+def test_token_bucket_rejects_bad_rate():
+    with pytest.raises(ValueError, match="rate"):
+        TokenBucket(rate=0)
+
+
+@pytest.mark.asyncio()
+async def test_scheduler_bounds_in_flight():
+    scheduler = AdaptiveScheduler(rate=1000, concurrency=2, max_concurrency=2)
+    in_flight = peak = 0
+
+    async def request() -> None:
+        nonlocal in_flight, peak
+        async with scheduler.slot() as slot:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            slot.status = 200
+
+    await asyncio.gather(*(request() for _ in range(20)))
+    assert peak == 2  # noqa: PLR2004
+    assert scheduler.stats()["completed"] == 20  # noqa: PLR2004
+    assert scheduler.stats()["in_flight"] == 0
+
+
+def test_scheduler_aimd():
+    scheduler = AdaptiveScheduler(concurrency=8, max_concurrency=10)
+    for _ in range(20):
+        scheduler._observe(0.1, 200)
+    assert scheduler.limit == 10  # noqa: PLR2004
+
+    scheduler._observe(0.1, 429)
+    assert scheduler.limit == 5  # noqa: PLR2004
+    scheduler._observe(0.1, 503)  # same round trip, no second cut
+    assert scheduler.limit == 5  # noqa: PLR2004
+
+    scheduler._last_decrease = 0
+    scheduler._observe(10.0, 200)  # too slow
+    assert scheduler.limit == 2  # noqa: PLR2004
+    assert scheduler.stats()["throttled"] == 1
+    assert scheduler.stats()["errors"] == 1
+
+
+@pytest.mark.asyncio()
+async def test_scheduler_counts_exceptions():
+    scheduler = AdaptiveScheduler(rate=1000)
+    with pytest.raises(RuntimeError):
+        async with scheduler.slot():
+            raise RuntimeError
+    assert scheduler.errors == 1
+    assert scheduler.limit == 4  # noqa: PLR2004
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+import pytest
+
+from merriam_api_parser._shared import SharedTokenBucket
+
+
+def test_shared_token_bucket_is_shared(tmp_path):
+    now = [0.0]
+    first = SharedTokenBucket(tmp_path / "q.sqlite3", 2, clock=lambda: now[0])
+    second = SharedTokenBucket(tmp_path / "q.sqlite3", 2, clock=lambda: now[0])
+
+    assert first.take() == 0
+    assert second.take() == 0
+    assert first.take() == pytest.approx(0.5)
+    now[0] = 0.5
+    assert second.take() == 0
+    assert first.take() == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio()
+async def test_shared_token_bucket_acquire(tmp_path):
+    bucket = SharedTokenBucket(tmp_path / "q.sqlite3", 100, burst=1)
+
+    await bucket.acquire()
+    await bucket.acquire()
+
+    assert bucket.take() > 0
+
+
+@pytest.mark.asyncio()
+async def test_shared_token_bucket_takes_off_the_loop(tmp_path, mocker):
+    bucket = SharedTokenBucket(tmp_path / "q.sqlite3", 100, burst=4)
+    loop_thread = threading.get_ident()
+    threads = []
+    take = bucket.take
+
+    def record() -> float:
+        threads.append(threading.get_ident())
+        return take()
+
+    mocker.patch.object(bucket, "take", record)
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    assert len(threads) == 4  # noqa: PLR2004
+    assert loop_thread not in threads
+
+
+def test_shared_token_bucket_rejects_bad_rate(tmp_path):
+    with pytest.raises(ValueError, match="rate must be positive"):
+        SharedTokenBucket(tmp_path / "q.sqlite3", 0)
@@ -0,0 +1,85 @@
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from merriam_api_parser._entry import Entry, Sense
+from merriam_api_parser._sinks import (
+    AnkiCsvSink,
+    BatchSink,
+    JsonlSink,
+    SqliteSink,
+    open_sink,
+)
+
+
+@pytest.fixture()
+def entry() -> Entry:
+    return Entry(
+        "run:1",
+        ("run", "ran"),
+        "verb",
+        (
+            Sense("1", "{bc}to go {it}faster{/it} than {sx|walk||}"),
+            Sense("2", "{bc}to flee <fast>"),
+        ),
+    )
+
+
+def test_jsonl_sink(tmp_path, entry):
+    path = tmp_path / "out.jsonl"
+    with JsonlSink(path, batch_size=2) as sink:
+        for word in ("run", "ran", "runs"):
+            sink.write(word, entry, "# run")
+
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [row["word"] for row in rows] == ["run", "ran", "runs"]
+    assert rows[0]["entry_id"] == "run:1"
+    assert rows[0]["senses"][0]["number"] == "1"
+    assert rows[0]["markdown"] == "# run"
+
+
+def test_sqlite_sink_commits_per_batch(tmp_path, entry):
+    path = tmp_path / "out.sqlite3"
+    sink = SqliteSink(path, batch_size=2)
+    for word in ("run", "ran", "runs"):
+        sink.write(word, entry, "# run")
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM entries").fetchone() == (2,)
+    sink.close()
+    assert conn.execute("SELECT COUNT(*) FROM entries").fetchone() == (3,)
+    stems, senses = conn.execute(
+        "SELECT stems, senses FROM entries WHERE word = 'run'",
+    ).fetchone()
+    assert json.loads(stems) == ["run", "ran"]
+    assert len(json.loads(senses)) == 2  # noqa: PLR2004
+    conn.close()
+
+
+def test_anki_csv_sink(tmp_path, entry):
+    path = tmp_path / "out.csv"
+    with AnkiCsvSink(path) as sink:
+        sink.write("run", entry, "# run")
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "#separator:Comma"
+    ((word, back),) = csv.reader(lines[3:])
+    assert word == "run"
+    assert back == (
+        '1 : to go <i>faster</i> than <a href="https://www.merriam-webster.com/'
+        'dictionary/walk">walk</a><br>2 : to flee &lt;fast&gt;'
+    )
+
+
+def test_open_sink(tmp_path):
+    with open_sink(tmp_path / "sub" / "out.JSONL") as sink:
+        assert isinstance(sink, JsonlSink)
+    with pytest.raises(ValueError, match="Unknown export format"):
+        open_sink(tmp_path / "out.txt")
+
+
+def test_batch_sink_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        BatchSink()  # type: ignore[abstract]
@@ -0,0 +1,92 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from merriam_api_parser._cache import ResponseCache
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Generous bounds, a regression shows up as several times slower.
+IMPORT_BUDGET = 1.0
+FIRST_RESULT_BUDGET = 2.0
+
+# Modules only bulk re-rendering, exports, the daemon or batches need. ssl is
+# not among them: asyncio imports it, only its context is created lazily.
+LAZY_MODULES = (
+    "merriam_api_parser._bulk",
+    "merriam_api_parser._sinks",
+    "merriam_api_parser._daemon",
+    "merriam_api_parser._client",
+    "merriam_api_parser._shared",
+    "merriam_api_parser._pipeline",
+    "merriam_api_parser._manifest",
+    "hashlib",
+    "multiprocessing",
+    "tarfile",
+    "http.client",
+    "csv",
+)
+
+
+def _python(*args: str, cwd: Path = ROOT) -> tuple[float, str]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    start = time.perf_counter()
+    done = subprocess.run(
+        [sys.executable, *args],  # noqa: S603
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, done.stdout
+
+
+def test_import_is_lazy():
+    seconds, out = _python(
+        "-c",
+        "import json, sys, merriam_api_parser.utility;"
+        f" print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))",
+    )
+
+    assert json.loads(out) == []
+    assert seconds < IMPORT_BUDGET
+
+
+def _cached_run(tmp_path: Path) -> Path:
+    path = tmp_path / "cache.sqlite3"
+    cache = ResponseCache(path)
+    cache.set("run", json.dumps([{"meta": {"id": "run"}, "hwi": {"hw": "run"}}]))
+    cache.close()
+    return path
+
+
+def test_single_word_first_result(tmp_path):
+    _cached_run(tmp_path)
+    seconds, _ = _python(
+        str(ROOT / "main.py"),
+        "--offline",
+        "--cache",
+        str(tmp_path / "cache.sqlite3"),
+        "run",
+        cwd=tmp_path,
+    )
+
+    assert "# run" in (tmp_path / "data" / "md" / "run.md").read_text(encoding="utf-8")
+    assert seconds < FIRST_RESULT_BUDGET
+
+
+def test_offline_run_creates_no_ssl_context(tmp_path):
+    argv = ["main.py", "--offline", "--cache", str(_cached_run(tmp_path)), "run"]
+    _python(
+        "-c",
+        "import runpy, ssl, sys; ssl.create_default_context = None;"
+        f" sys.argv = {argv!r};"
+        f" runpy.run_path({str(ROOT / 'main.py')!r}, run_name='__main__')",
+        cwd=tmp_path,
+    )
+
+    assert (tmp_path / "data" / "md" / "run.md").exists()
@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from merriam_api_parser._http import AsyncHTTPTransport, HTTPError
+from merriam_api_parser._stub_server import StubServer
+from merriam_api_parser._synthetic import PayloadGenerator
+from merriam_api_parser.utility import MerriamWebsterAPI
+
+
+@pytest.fixture()
+def fixtures(tmp_path) -> Path:
+    body = Path("tests/test_data.json").read_text(encoding="utf-8")
+    (tmp_path / "test.json").write_text(f"[{body}]", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.asyncio()
+async def test_stub_server_fixtures_and_suggestions(fixtures):
+    transport = AsyncHTTPTransport()
+    async with StubServer(fixtures) as api_url:
+        fixture = await transport.get(f"{api_url}test?key=k", timeout=5)
+        unknown = await transport.get(f"{api_url}wrod?key=k", timeout=5)
+        await transport.aclose()
+
+    assert json.loads(fixture.text)[0]["meta"]["id"] == "test_id"
+    assert json.loads(unknown.text) == ["wrods", "wroder", "unwrod"]
+    assert transport.connections_opened == 1
+
+
+@pytest.mark.asyncio()
+async def test_stub_server_generated_payload():
+    server = StubServer(generator=PayloadGenerator(senses=3), latency=0.001)
+    async with server as api_url:
+        api = MerriamWebsterAPI("key", api_url=api_url.rstrip("/"))
+        word, response = await api.process_word("ice cream")
+        await api.aclose()
+
+    assert word == "ice cream"
+    assert "# ice cream" in response
+    assert server.requests == {200: 1}
+
+
+@pytest.mark.asyncio()
+async def test_stub_server_faults():
+    transport = AsyncHTTPTransport()
+    async with StubServer(throttle_rate=1.0, retry_after=7) as api_url:
+        throttled = await transport.get(f"{api_url}word", timeout=5)
+    async with StubServer(error_rate=1.0) as api_url:
+        failed = await transport.get(f"{api_url}word", timeout=5)
+    server = StubServer(reset_rate=1.0)
+    async with server as api_url:
+        with pytest.raises(HTTPError):
+            await transport.get(f"{api_url}word", timeout=5)
+    await transport.aclose()
+
+    assert throttled.status == 429  # noqa: PLR2004
+    assert throttled.headers["retry-after"] == "7"
+    assert failed.status in (500, 502, 503)
+    assert server.requests == {0: 1}
+
+
+def test_stub_server_rejects_unknown_distribution():
+    with pytest.raises(ValueError, match="distribution"):
+        StubServer(latency_distribution="pareto")
+
+
+def test_stub_server_delay():
+    assert StubServer(latency=0.5)._delay() == 0.5  # noqa: PLR2004
+    assert 0 <= StubServer(latency=0.5, latency_distribution="uniform")._delay() <= 1
+    assert StubServer(latency=0.5, latency_distribution="exponential")._delay() >= 0
@@ -0,0 +1,28 @@
+from merriam_api_parser._json_parser import JsonParser
+from merriam_api_parser._synthetic import PayloadGenerator, word_list
+
+
+def test_payload_generator_shape():
+    generator = PayloadGenerator(senses=7, vis_per_sense=2, homographs=2)
+    response = generator.response("word")
+
+    assert [entry["meta"]["id"] for entry in response] == ["word:1", "word:2"]
+    entry = JsonParser(response[0]).parse()
+    assert len(entry.senses) == 7  # noqa: PLR2004
+    assert all(len(sense.vis) == 2 for sense in entry.senses)  # noqa: PLR2004
+    assert any(sense.divided for sense in entry.senses)
+
+
+def test_payload_generator_is_deterministic():
+    assert PayloadGenerator(seed=1).entry("a") == PayloadGenerator(seed=1).entry("a")
+
+
+def test_payload_renders_links():
+    md = JsonParser(PayloadGenerator(links_per_text=5).entry("word")).get_md_text()
+    assert "https://www.merriam-webster.com/dictionary/" in md
+    assert "{" not in md
+
+
+def test_word_list():
+    words = word_list(50)
+    assert len(set(words)) == 50  # noqa: PLR2004
@@ -1,6 +1,11 @@
 import pytest
 
-from merriam_api_parser._token_parser import TextTokenFormatter
+from merriam_api_parser._token_parser import (
+    HtmlTokenFormatter,
+    TextTokenFormatter,
+    Token,
+    tokenize,
+)
 
 
 def test_parse_token() -> None:
@@ -8,6 +13,8 @@ def test_parse_token() -> None:
     _test_basic_text_formatting(formatter)
     _test_url_formatting(formatter)
     _test_multiple_urls(formatter)
+    _test_full_token_set(formatter)
+    _test_unknown_tokens(formatter)
     _test_invalid_input(formatter)
     _test_repr(formatter)
 
@@ -49,6 +56,36 @@ def _test_multiple_urls(formatter: TextTokenFormatter) -> None:
     )
 
 
+def _test_full_token_set(formatter: TextTokenFormatter) -> None:
+    assert formatter.parse_token("{b}bold{/b} {it}italic{/it}") == "**bold** _italic_"
+    assert formatter.parse_token("{ldquo}hi{rdquo}") == "“hi”"
+    assert formatter.parse_token("H{inf}2{/inf}O x{sup}2{/sup}") == (
+        "H<sub>2</sub>O x<sup>2</sup>"
+    )
+    assert formatter.parse_token("{sc}ad{/sc}") == (
+        '<span style="font-variant: small-caps;">ad</span>'
+    )
+    assert formatter.parse_token("{phrase}in time{/phrase} {gloss}sense{/gloss}") == (
+        "**_in time_** [sense]"
+    )
+    assert formatter.parse_token("{dx}see {dxt|circle:1||}{/dx}") == (
+        " — see [circle](https://www.merriam-webster.com/dictionary/circle)"
+    )
+    assert formatter.parse_token("{ma}{mat|pond|}{/ma}") == (
+        " — more at [pond](https://www.merriam-webster.com/dictionary/pond)"
+    )
+    assert formatter.parse_token("from {et_link|ab-:1|ab-:1}") == (
+        "from [ab-](https://www.merriam-webster.com/dictionary/ab-)"
+    )
+    assert formatter.parse_token("{ds||1||}{bc}x") == ": x"
+    assert formatter.parse_token("one{p_br}two") == "one\n\ntwo"
+
+
+def _test_unknown_tokens(formatter: TextTokenFormatter) -> None:
+    assert formatter.parse_token("{unknown} {/wi|x}") == "{unknown} {/wi|x}"
+    assert formatter.parse_token("{sx|||}") == ""
+
+
 def _test_invalid_input(formatter: TextTokenFormatter) -> None:
     with pytest.raises(TypeError):
         formatter.parse_token(None)  # type: ignore[arg-type]
@@ -57,3 +94,28 @@ def _test_invalid_input(formatter: TextTokenFormatter) -> None:
 def _test_repr(formatter: TextTokenFormatter) -> None:
     formatter.parse_token("This is a test.")
     assert repr(formatter) == "TextTokenFormatter(text='This is a test.')"
+
+
+def test_tokenize() -> None:
+    assert list(tokenize("{bc}a {wi}b{/wi} {d_link|c|c:2}")) == [
+        Token("mark", "bc"),
+        Token("text", "a "),
+        Token("open", "wi"),
+        Token("text", "b"),
+        Token("close", "wi"),
+        Token("text", " "),
+        Token("link", "d_link", ("c", "c:2")),
+    ]
+    assert list(tokenize("")) == []
+
+
+def test_html_token_formatter() -> None:
+    formatter = HtmlTokenFormatter()
+    assert formatter.parse_token("{bc}{b}a{/b} {phrase}b{/phrase} {sup}2{/sup}") == (
+        ": <b>a</b> <b><i>b</i></b> <sup>2</sup>"
+    )
+    assert formatter.parse_token("x < y & {d_link|a b|a b:1}") == (
+        'x &lt; y &amp; <a href="https://www.merriam-webster.com/dictionary/a-b">'
+        "a b</a>"
+    )
+    assert formatter.parse_token("one{p_br}two") == "one<br><br>two"
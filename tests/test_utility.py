@@ -1,10 +1,23 @@
+import asyncio
+import json
+from logging.handlers import QueueHandler
+from pathlib import Path
+
 import pytest
 
 from merriam_api_parser import utility
+from merriam_api_parser._cache import ResponseCache
+from merriam_api_parser._http import Response
+from merriam_api_parser._journal import JobJournal, QuotaLedger
+from merriam_api_parser._logging import JsonFormatter
+from merriam_api_parser._manifest import Manifest
+from merriam_api_parser._retry import Deadline, Retrier, RetryPolicy
+from merriam_api_parser._scheduler import AdaptiveScheduler
 
 
 @pytest.mark.asyncio()
-async def test_main_with_single_word(mocker):
+async def test_main_with_single_word(mocker, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)  # keep the cache, quota and notes out of data/
     mocker.patch("merriam_api_parser.utility.get_user_input", return_value="word")
     mocker.patch("merriam_api_parser.utility.process_user_input", return_value="word")
     mock_process_word = mocker.patch(
@@ -19,15 +32,348 @@ async def test_main_with_single_word(mocker):
     mock_write.assert_called_once_with("response")
 
 
+@pytest.mark.asyncio()
+async def test_main_exports_stats(mocker, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    mocker.patch("merriam_api_parser.utility.get_user_input", return_value="word")
+    mocker.patch(
+        "merriam_api_parser.utility.MerriamWebsterAPI.process_word",
+        return_value=("word", "response"),
+    )
+    mocker.patch("merriam_api_parser._io.Writer.write")
+
+    await utility.main(["--no-cache", "--stats", str(tmp_path / "stats.json")])
+
+    data = json.loads((tmp_path / "stats.json").read_text(encoding="utf-8"))
+    assert set(data) == {"seconds", "counters", "histograms"}
+
+
+@pytest.mark.asyncio()
+async def test_main_closes_stores_on_errors(mocker, monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    mocker.patch(
+        "merriam_api_parser.utility.process_input",
+        side_effect=KeyboardInterrupt,
+    )
+    close_cache = mocker.spy(ResponseCache, "close")
+    close_quota = mocker.spy(QuotaLedger, "close")
+
+    with pytest.raises(KeyboardInterrupt):
+        await utility.main(["--words", str(tmp_path / "words.txt")])
+
+    close_cache.assert_called_once()
+    close_quota.assert_called_once()
+
+
 def test_configure_logging(mocker):
     mock_basic_config = mocker.patch("logging.basicConfig")
     mock_file_handler = mocker.patch("logging.FileHandler")
     mock_stream_handler = mocker.patch("logging.StreamHandler")
 
-    utility.configure_logging()
+    listener = utility.configure_logging("WARNING", json_format=True)
+    listener.stop()
+
+    mock_basic_config.assert_called_once_with(level="WARNING", handlers=[mocker.ANY])
+    (handler,) = mock_basic_config.call_args.kwargs["handlers"]
+    assert isinstance(handler, QueueHandler)
+    assert listener.handlers == (mock_file_handler(), mock_stream_handler())
+    (formatter,) = mock_file_handler().setFormatter.call_args.args
+    assert isinstance(formatter, JsonFormatter)
+
+
+class FakeTransport:
+    """Transport returning canned responses in order."""
+
+    def __init__(self, *responses: Response) -> None:
+        self.responses = list(responses)
+        self.urls: list[str] = []
+
+    async def get(
+        self,
+        url: str,
+        timeout: float,  # noqa: ARG002
+        connect_timeout: float | None = None,  # noqa: ARG002
+    ) -> Response:
+        """Record the URL and return the next canned response."""
+        self.urls.append(url)
+        await asyncio.sleep(0)
+        return self.responses.pop(0)
+
+    async def aclose(self) -> None:
+        """Nothing to release."""
+
+
+def _ok(*entries: dict) -> Response:
+    return Response(200, {}, json.dumps(list(entries)).encode())
+
+
+def _retrier(attempts: int = 2) -> Retrier:
+    return Retrier(RetryPolicy(attempts=attempts, backoff=0))
+
+
+@pytest.mark.asyncio()
+async def test_parse_response_uses_cache():
+    cache = ResponseCache(":memory:")
+    transport = FakeTransport(_ok({"meta": {"id": "word"}}))
+    api = utility.MerriamWebsterAPI("key", cache, transport=transport)
+
+    first = await api.parse_response("word")
+    second = await api.parse_response("Word")
+
+    assert first == second
+    assert "# word" in first
+    assert transport.urls == [f"{api.API_URL}word?key=key"]
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+
+@pytest.mark.asyncio()
+async def test_parse_response_offline_miss():
+    transport = FakeTransport()
+    api = utility.MerriamWebsterAPI(
+        "",
+        ResponseCache(":memory:"),
+        offline=True,
+        transport=transport,
+    )
+
+    assert await api.parse_response("word") == ""
+    assert transport.urls == []
+
+
+@pytest.mark.asyncio()
+async def test_parse_response_retries_once():
+    transport = FakeTransport(Response(503), _ok({"meta": {"id": "ice cream"}}))
+    api = utility.MerriamWebsterAPI("key", transport=transport, retrier=_retrier())
+
+    assert "# ice cream" in await api.parse_response("ice cream")
+    assert transport.urls[0].endswith("/ice%20cream?key=key")
+    assert len(transport.urls) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_parse_response_gives_up():
+    transport = FakeTransport(Response(503), Response(503))
+    api = utility.MerriamWebsterAPI(
+        "key",
+        ResponseCache(":memory:"),
+        transport=transport,
+        retrier=_retrier(),
+    )
+
+    assert await api.parse_response("word") == ""
+    assert len(api.cache) == 0
+
+
+@pytest.mark.asyncio()
+async def test_fetch_deduplicates_casing_and_inflections():
+    entry = {"meta": {"id": "run:1", "stems": ["run", "runs", "running"]}}
+    transport = FakeTransport(_ok(entry))
+    api = utility.MerriamWebsterAPI("key", transport=transport)
+
+    bodies = await asyncio.gather(
+        api.fetch("Run"),
+        api.fetch("run"),
+        api.fetch("run "),
+    )
+    bodies.append(await api.fetch("running"))
+
+    assert len(set(bodies)) == 1
+    assert len(transport.urls) == 1
+    assert api.coalescer.coalesced == 2  # noqa: PLR2004
+    assert api.stems.hits == 1
+
+
+@pytest.mark.asyncio()
+async def test_fetch_resolves_stems_offline():
+    cache = ResponseCache(":memory:")
+    entry = {"meta": {"id": "goose", "stems": ["goose", "geese"]}}
+    online = utility.MerriamWebsterAPI(
+        "key",
+        cache,
+        transport=FakeTransport(_ok(entry)),
+    )
+    await online.fetch("goose")
+
+    transport = FakeTransport()
+    offline = utility.MerriamWebsterAPI("", cache, offline=True, transport=transport)
+
+    assert "# goose" in await offline.parse_response("Geese")
+    assert transport.urls == []
+    assert cache.stem_hits == 1
+
+
+def test_init_api_offline_without_key(monkeypatch):
+    monkeypatch.delenv("MERRIAM_WEBSTER_DICTIONARY_KEY", raising=False)
+    with pytest.raises(ValueError, match="MERRIAM_WEBSTER_DICTIONARY_KEY"):
+        utility.init_api()
+    assert utility.init_api(offline=True).offline
+
+
+@pytest.mark.asyncio()
+async def test_parse_response_reports_to_scheduler():
+    scheduler = AdaptiveScheduler(rate=1000)
+    transport = FakeTransport(Response(429), _ok({"meta": {"id": "word"}}))
+    api = utility.MerriamWebsterAPI(
+        "key",
+        transport=transport,
+        scheduler=scheduler,
+        retrier=_retrier(),
+    )
+
+    assert await api.parse_response("word")
+    assert scheduler.stats()["completed"] == 2  # noqa: PLR2004
+    assert scheduler.stats()["throttled"] == 1
+
+
+@pytest.mark.asyncio()
+async def test_main_render_from(mocker, tmp_path):
+    mock_render = mocker.patch("merriam_api_parser._bulk.render_corpus")
+    mock_input = mocker.patch("merriam_api_parser.utility.get_user_input")
+
+    await utility.main(["--render-from", str(tmp_path), "--out", "md", "--unordered"])
 
-    mock_basic_config.assert_called_once_with(
-        level=mocker.ANY,
-        format="%(asctime)s %(levelname)s %(message)s",
-        handlers=[mock_file_handler(), mock_stream_handler()],
+    mock_render.assert_called_once_with(
+        tmp_path,
+        Path("md"),
+        workers=None,
+        chunk_size=64,
+        ordered=False,
+        sink=None,
     )
+    mock_input.assert_not_called()
+
+
+@pytest.mark.asyncio()
+async def test_process_directory_incremental(tmp_path):
+    (tmp_path / "stub.md").write_text("", encoding="utf-8")
+    (tmp_path / "done.md").write_text("# done", encoding="utf-8")
+    transport = FakeTransport(_ok({"meta": {"id": "stub"}}))
+    api = utility.MerriamWebsterAPI("key", transport=transport)
+
+    await utility.process_directory(api, tmp_path, incremental=True)
+
+    assert len(transport.urls) == 1
+    assert "# stub" in (tmp_path / "stub.md").read_text(encoding="utf-8")
+    assert (tmp_path / "done.md").read_text(encoding="utf-8") == "# done"
+    assert list(Manifest(tmp_path).entries) == ["stub.md"]
+
+
+@pytest.mark.asyncio()
+async def test_process_word_list_resume(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("done\nnew\na/b\n", encoding="utf-8")
+    out_dir = tmp_path / "md"
+    out_dir.mkdir()
+    (out_dir / "done.md").write_text("# done\n", encoding="utf-8")
+    transport = FakeTransport(_ok({"meta": {"id": "new"}}))
+    api = utility.MerriamWebsterAPI("key", transport=transport)
+
+    stats = await utility.process_word_list(api, words, out_dir, resume=True)
+
+    assert stats.written == 1
+    assert transport.urls == [f"{api.API_URL}new?key=key"]
+    assert "# new" in (out_dir / "new.md").read_text(encoding="utf-8")
+
+
+@pytest.mark.asyncio()
+async def test_process_directory_writes_next_to_source(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "word.md").write_text("", encoding="utf-8")
+    transport = FakeTransport(_ok({"meta": {"id": "word"}}))
+    api = utility.MerriamWebsterAPI("key", transport=transport)
+
+    stats = await utility.process_directory(api, tmp_path)
+
+    assert stats.written == 1
+    assert "# word" in (tmp_path / "nested" / "word.md").read_text(encoding="utf-8")
+    assert not (tmp_path / "word.md").exists()
+
+
+@pytest.mark.asyncio()
+async def test_process_word_list_journal_defers_over_quota(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("first\nsecond\nthird\n", encoding="utf-8")
+    out_dir = tmp_path / "md"
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    quota = QuotaLedger(tmp_path / "quota.sqlite3", daily_limit=1)
+    transport = FakeTransport(_ok({"meta": {"id": "word"}}))
+    api = utility.MerriamWebsterAPI("key", transport=transport, quota=quota)
+
+    stats = await utility.process_word_list(
+        api,
+        words,
+        out_dir,
+        fetchers=1,
+        journal=journal,
+    )
+
+    assert stats.written == 1
+    assert transport.urls == [f"{api.API_URL}first?key=key"]
+    assert journal.counts()["done"] == 1
+    journal.release()
+    assert [word for word, _ in journal.claim(3)][-1] == "third"
+
+
+@pytest.mark.asyncio()
+async def test_process_word_list_journal_requeues_transient_failures(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("down\nwrod\nword\n", encoding="utf-8")
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    transport = FakeTransport(
+        Response(503, {}, b""),
+        Response(200, {}, b'["wrods"]'),
+        _ok({"meta": {"id": "word"}}),
+    )
+    api = utility.MerriamWebsterAPI("key", transport=transport, retrier=_retrier(1))
+
+    await utility.process_word_list(
+        api,
+        words,
+        tmp_path / "md",
+        fetchers=1,
+        journal=journal,
+    )
+
+    assert journal.counts() == {
+        "pending": 1,
+        "leased": 0,
+        "done": 1,
+        "failed": 1,
+        "deferred": 0,
+    }
+    assert journal.claim(3) == [("down", tmp_path / "md" / "down.md")]
+
+
+@pytest.mark.asyncio()
+async def test_process_word_list_stops_at_deadline(tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("one\ntwo\nthree\n", encoding="utf-8")
+    journal = JobJournal(tmp_path / "journal.sqlite3")
+    transport = FakeTransport()
+    retrier = Retrier(deadline=Deadline(0))
+    api = utility.MerriamWebsterAPI("key", transport=transport, retrier=retrier)
+
+    stats = await utility.process_word_list(
+        api,
+        words,
+        tmp_path / "md",
+        journal=journal,
+    )
+
+    assert stats.fetched == stats.failed == 0
+    assert transport.urls == []
+    assert journal.counts()["pending"] == 3  # noqa: PLR2004
+
+
+@pytest.mark.asyncio()
+async def test_process_journal_works_through_queue(tmp_path):
+    journal = JobJournal(tmp_path / "journal.sqlite3", owner="worker")
+    journal.add([(word, tmp_path / f"{word}.md", 0) for word in ["one", "two"]])
+    transport = FakeTransport(*[_ok({"meta": {"id": "word"}})] * 2)
+    api = utility.MerriamWebsterAPI("key", transport=transport)
+
+    stats = await utility.process_journal(api, journal, fetchers=1)
+
+    assert stats.written == 2  # noqa: PLR2004
+    assert journal.counts()["done"] == 2  # noqa: PLR2004
+    assert (tmp_path / "two.md").exists()